@@ -0,0 +1,74 @@
+"""
+範囲攻撃（ウィザードの弾）の着弾処理コストの計測用エントリポイント。
+敵を一定の範囲に密集させて配置し、範囲攻撃弾の命中処理1回あたりの時間を
+全件走査と空間インデックス検索で比較する。
+
+例:
+    python aoe_benchmark.py --counts 1000,5000,10000
+"""
+
+import argparse
+import random
+import time
+from typing import List
+
+from src.game.scenes.ingame.bullet import Bullet
+from src.game.scenes.ingame.enemy.enemy import GroundEnemy
+from src.game.scenes.ingame.enemy.enemy_archetype import TANK_ENEMY
+from src.game.scenes.ingame.enemy.enemy_manager import EnemyManager
+
+# 敵を配置する正方形の一辺（タイル）
+FIELD_SIZE = 32
+# 範囲攻撃の半径（PlayerUnitManagerのウィザードと同じ）
+AOE_RADIUS = 2.5
+
+
+def build_field(count: int, seed: int) -> EnemyManager:
+    """
+    count 体の敵を FIELD_SIZE 四方に一様に配置する。
+    命中で倒れないよう係数を大きくしておく。
+    """
+    rng = random.Random(seed)
+    manager = EnemyManager()
+    path = ((0, 0),)
+    for _ in range(count):
+        x = rng.uniform(0, FIELD_SIZE)
+        y = rng.uniform(0, FIELD_SIZE)
+        manager.spawn_enemy(GroundEnemy(TANK_ENEMY, x, y, path, coefficient=1_000_000.0))
+    return manager
+
+
+def measure(manager: EnemyManager, impacts: int, use_grid: bool, seed: int) -> float:
+    """
+    ランダムに選んだ敵へ範囲攻撃弾を impacts 回命中させ、1回あたりの時間（マイクロ秒）を返す。
+    """
+    rng = random.Random(seed)
+    enemies = manager.enemies
+    targets: List[GroundEnemy] = [rng.choice(enemies.items) for _ in range(impacts)]  # type: ignore[misc]
+    grid = manager.grid if use_grid else None
+    bullet = Bullet(0.0, 0.0, targets[0], 1, aoe_radius=AOE_RADIUS)
+    start = time.perf_counter()
+    for target in targets:
+        # 標的の位置に発射し、最初の update で命中させる
+        bullet.reset(target.x, target.y, target, 1, aoe_radius=AOE_RADIUS)
+        bullet.update(enemies, grid)
+    elapsed = time.perf_counter() - start
+    return elapsed / impacts * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PyxelTD area-of-effect benchmark")
+    parser.add_argument("--counts", type=str, default="1000,5000,10000", help="敵の数（カンマ区切り）")
+    parser.add_argument("--impacts", type=int, default=2000, help="計測する命中回数")
+    parser.add_argument("--seed", type=int, default=0, help="乱数シード")
+    args = parser.parse_args()
+
+    for count in (int(c) for c in args.counts.split(",")):
+        manager = build_field(count, args.seed)
+        scan = measure(manager, args.impacts, use_grid=False, seed=args.seed)
+        grid = measure(manager, args.impacts, use_grid=True, seed=args.seed)
+        print(f"enemies={count}: full_scan={scan:.1f}us grid={grid:.1f}us per impact (x{scan / grid:.1f})")
+
+
+if __name__ == "__main__":
+    main()
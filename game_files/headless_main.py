@@ -0,0 +1,83 @@
+"""
+ヘッドレスシミュレーション用エントリポイント。
+pyxelのウィンドウを開かずにステージを全速で進行させ、結果を出力する。
+
+例:
+    python headless_main.py --stage 0 --place 0,2,4 --place 2,6,5 --runs 100
+"""
+
+import argparse
+import time
+
+from src.game.scenes.ingame.headless_simulator import HeadlessSimulator
+from src.game.scenes.ingame.player_unit.player_unit import PLAYER_UNIT_MASTER
+
+
+def parse_placement(value: str) -> tuple[int, int, int]:
+    """
+    "ユニット番号,x,y" 形式の文字列を分解する。
+    """
+    parts = value.split(",")
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError(f"invalid placement: {value}")
+    unit_index, x, y = (int(p) for p in parts)
+    if not 0 <= unit_index < len(PLAYER_UNIT_MASTER):
+        raise argparse.ArgumentTypeError(f"unknown unit index: {unit_index}")
+    return unit_index, x, y
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PyxelTD headless simulation")
+    parser.add_argument("--stage", type=int, default=0, help="ステージ番号（0始まり）")
+    parser.add_argument("--runs", type=int, default=1, help="実行回数")
+    parser.add_argument("--max-ticks", type=int, default=None, help="1回あたりの最大ティック数")
+    parser.add_argument("--funds", type=int, default=100, help="初期資金")
+    parser.add_argument("--start-wave", type=int, default=0, help="このウェーブ（0始まり）から開始する")
+    parser.add_argument("--start-tick", type=int, default=0, help="開始ウェーブのこのティック目から開始する")
+    parser.add_argument(
+        "--place", type=parse_placement, action="append", default=[], help="開始時の配置 (ユニット番号,x,y)"
+    )
+    parser.add_argument("--flow-field", action="store_true", help="敵の移動にフローフィールドを使う")
+    parser.add_argument("--mazing", action="store_true", help="道タイルへのユニット配置（迷路化）を許可する")
+    parser.add_argument("--array-store", action="store_true", help="敵の状態をNumPy配列で保持する（要NumPy）")
+    parser.add_argument(
+        "--analytic-projectiles", action="store_true", help="弾の着弾ティックを発射時に求め、追尾移動を省略する"
+    )
+    parser.add_argument("--pool-stats", action="store_true", help="弾・敵のオブジェクトプールの統計を表示する")
+    args = parser.parse_args()
+    if args.array_store and (args.flow_field or args.mazing):
+        parser.error("--array-store cannot be combined with --flow-field or --mazing")
+
+    for run in range(args.runs):
+        simulator = HeadlessSimulator(
+            stage_index=args.stage,
+            funds=args.funds,
+            use_flow_field=args.flow_field,
+            mazing=args.mazing,
+            use_array_store=args.array_store,
+            analytic_projectiles=args.analytic_projectiles,
+            start_wave=args.start_wave,
+            start_tick=args.start_tick,
+        )
+        for unit_index, x, y in args.place:
+            if not simulator.place_unit(PLAYER_UNIT_MASTER[unit_index], x, y):
+                print(f"placement skipped: unit={unit_index} pos=({x}, {y})")
+        start = time.perf_counter()
+        result = simulator.run(max_ticks=args.max_ticks)
+        elapsed = time.perf_counter() - start
+        print(
+            f"run={run} result={result.name} ticks={simulator.tick_count} "
+            f"base_hp={simulator.base_hp} funds={simulator.funds} elapsed={elapsed:.3f}s"
+        )
+        if args.pool_stats:
+            print(f"  bullet_pool: {simulator.player_unit_manager.bullet_pool.get_stats()}")
+            for enemy_class, pool in simulator.enemy_manager.pools.items():
+                print(f"  enemy_pool[{enemy_class.__name__}]: {pool.get_stats()}")
+            store = simulator.enemy_manager.store
+            if store is not None:
+                for view_class, pool in store.view_pools.items():
+                    print(f"  view_pool[{view_class.__name__}]: {pool.get_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+ヘッドレスシミュレーションの回帰確認用エントリポイント。
+固定の配置でステージを最後まで進め、決着・ティック数・資金・拠点HPが期待値と一致するかを確認する。
+高速化などでシミュレーションの結果が変わっていないかの確認に使う（不一致があれば終了コード1）。
+配列ストア・着弾計算モードも同じ期待値と一致すること。
+
+例:
+    python headless_regression.py
+    python headless_regression.py --array-store
+    python headless_regression.py --analytic-projectiles
+"""
+
+import argparse
+import sys
+from typing import List, NamedTuple, Tuple
+
+from src.game.scenes.ingame.headless_simulator import HeadlessSimulator
+from src.game.scenes.ingame.player_unit.player_unit import PLAYER_UNIT_MASTER
+
+# 1回あたりの最大ティック数（全シナリオがこれより前に決着する）
+MAX_TICKS = 30000
+
+
+class Scenario(NamedTuple):
+    """
+    回帰確認の1ケース。期待値は (決着, ティック数, 資金, 拠点HP)。
+    """
+
+    name: str
+    stage: int
+    funds: int
+    placements: List[Tuple[int, int, int]]  # (ユニット番号, x, y)
+    expected: Tuple[str, int, int, int]
+
+
+SCENARIOS: List[Scenario] = [
+    Scenario(
+        "stage0-clear-a",
+        0,
+        4000,
+        [
+            (3, 4, 9),
+            (2, 10, 1),
+            (3, 8, 12),
+            (2, 6, 9),
+            (2, 6, 11),
+            (1, 3, 6),
+            (1, 5, 7),
+            (2, 2, 3),
+            (2, 2, 4),
+            (3, 2, 8),
+            (2, 11, 9),
+            (3, 11, 5),
+            (2, 12, 9),
+            (0, 2, 2),
+        ],
+        ("CLEAR", 3858, 3650, 4),
+    ),
+    Scenario(
+        "stage0-clear-b",
+        0,
+        4000,
+        [
+            (1, 8, 6),
+            (3, 2, 9),
+            (0, 9, 2),
+            (2, 3, 11),
+            (1, 6, 6),
+            (1, 5, 9),
+            (3, 9, 12),
+            (0, 2, 1),
+            (0, 11, 4),
+            (0, 8, 7),
+            (3, 13, 6),
+            (3, 4, 9),
+            (2, 11, 3),
+        ],
+        ("CLEAR", 3727, 3768, 3),
+    ),
+    Scenario(
+        "stage0-gameover",
+        0,
+        1000,
+        [(3, 11, 2), (0, 12, 6), (1, 2, 0), (2, 3, 11), (0, 11, 7), (3, 13, 6), (3, 8, 5), (1, 2, 3)],
+        ("GAMEOVER", 2546, 674, 0),
+    ),
+    Scenario(
+        "stage0-gameover-b",
+        0,
+        1000,
+        [
+            (3, 12, 9),
+            (2, 6, 7),
+            (0, 6, 11),
+            (0, 4, 9),
+            (1, 10, 2),
+            (0, 9, 7),
+            (1, 5, 6),
+            (1, 2, 8),
+            (0, 3, 7),
+            (1, 9, 1),
+            (3, 6, 6),
+            (2, 11, 9),
+            (1, 8, 11),
+        ],
+        ("GAMEOVER", 3838, 946, 0),
+    ),
+    Scenario(
+        "stage1-gameover-a",
+        1,
+        1000,
+        [(0, 15, 4), (2, 10, 3), (3, 10, 10), (2, 14, 0), (2, 13, 0), (3, 9, 8), (0, 4, 2), (1, 10, 8)],
+        ("GAMEOVER", 2040, 686, 0),
+    ),
+    Scenario(
+        "stage1-gameover-b",
+        1,
+        1000,
+        [(3, 1, 0), (3, 13, 2), (0, 0, 3), (0, 16, 2), (1, 13, 7), (0, 13, 0)],
+        ("GAMEOVER", 1886, 740, 0),
+    ),
+    Scenario(
+        "stage1-gameover-c",
+        1,
+        1000,
+        [(2, 11, 7), (0, 11, 8), (0, 12, 3), (2, 16, 4), (3, 0, 2), (2, 5, 4), (1, 4, 2)],
+        ("GAMEOVER", 1621, 772, 0),
+    ),
+    Scenario(
+        "stage2-gameover-a",
+        2,
+        1000,
+        [(0, 7, 2), (2, 15, 2), (2, 23, 4), (1, 24, 5), (0, 19, 15), (1, 12, 15), (3, 24, 10), (2, 7, 18)],
+        ("GAMEOVER", 927, 703, 0),
+    ),
+    Scenario(
+        "stage2-gameover-b",
+        2,
+        1000,
+        [(3, 15, 13), (2, 10, 8), (1, 7, 8), (2, 23, 16), (0, 23, 3), (3, 23, 5), (2, 12, 10), (2, 7, 13)],
+        ("GAMEOVER", 3095, 775, 0),
+    ),
+    Scenario(
+        "stage2-gameover-c",
+        2,
+        1000,
+        [(0, 7, 8), (2, 13, 1), (3, 14, 10), (2, 19, 13), (1, 6, 4), (3, 6, 6), (1, 12, 1), (3, 22, 15)],
+        ("GAMEOVER", 1547, 521, 0),
+    ),
+]
+
+
+def run_scenario(
+    scenario: Scenario, use_array_store: bool, analytic_projectiles: bool = False
+) -> Tuple[str, int, int, int]:
+    """
+    シナリオを最後まで進め、(決着, ティック数, 資金, 拠点HP) を返す。
+    """
+    simulator = HeadlessSimulator(
+        stage_index=scenario.stage,
+        funds=scenario.funds,
+        use_array_store=use_array_store,
+        analytic_projectiles=analytic_projectiles,
+    )
+    for unit_index, x, y in scenario.placements:
+        if not simulator.place_unit(PLAYER_UNIT_MASTER[unit_index], x, y):
+            raise ValueError(f"{scenario.name}: cannot place unit {unit_index} at ({x}, {y})")
+    result = simulator.run(max_ticks=MAX_TICKS)
+    return result.name, simulator.tick_count, simulator.funds, simulator.base_hp
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PyxelTD headless regression check")
+    parser.add_argument("--array-store", action="store_true", help="敵の状態をNumPy配列で保持する（要NumPy）")
+    parser.add_argument(
+        "--analytic-projectiles", action="store_true", help="弾の着弾ティックを発射時に求め、追尾移動を省略する"
+    )
+    args = parser.parse_args()
+
+    failures = 0
+    for scenario in SCENARIOS:
+        actual = run_scenario(scenario, args.array_store, args.analytic_projectiles)
+        matched = actual == scenario.expected
+        if not matched:
+            failures += 1
+        status = "ok" if matched else "MISMATCH"
+        print(f"{scenario.name}: {status} actual={actual} expected={scenario.expected}")
+    print(f"{len(SCENARIOS) - failures}/{len(SCENARIOS)} scenarios match")
+    if failures:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
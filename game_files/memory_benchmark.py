@@ -0,0 +1,77 @@
+"""
+メモリ使用量の計測用エントリポイント。
+敵・弾を指定数だけ生成して生存させたまま、1体（1発）あたりの確保バイト数を表示する。
+管理クラス（EnemyManager / PlayerUnitManager）経由で追加するため、リストや空間インデックスの分も含む。
+
+例:
+    python memory_benchmark.py --count 10000
+"""
+
+import argparse
+import tracemalloc
+from typing import Callable
+
+from src.game.scenes.ingame.enemy.enemy import GroundEnemy
+from src.game.scenes.ingame.enemy.enemy_archetype import BASIC_ENEMY, FLYING_ENEMY, EnemyArchetype
+from src.game.scenes.ingame.enemy.enemy_manager import EnemyManager
+from src.game.scenes.ingame.player_unit.player_unit_manager import PlayerUnitManager
+
+# 計測用の共有経路（StageManagerと同じく全ての敵で1つの経路を共有する）
+PATH = ((0, 0), (10, 0), (10, 10), (20, 10))
+
+
+def measure(count: int, populate: Callable[[int], object]) -> float:
+    """
+    populate(count) で生成したオブジェクトが生存している間の増加量を、1個あたりのバイト数で返す。
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = populate(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return (after - before) / count
+
+
+def spawn_enemies(archetype: EnemyArchetype, use_array_store: bool) -> Callable[[int], object]:
+    """
+    指定した種類の敵を count 体出現させる関数を返す。
+    """
+
+    def populate(count: int) -> object:
+        manager = EnemyManager(use_array_store=use_array_store)
+        for i in range(count):
+            enemy = manager.acquire_enemy(archetype.enemy_class, archetype, -1.0, float(i % 10), PATH)
+            manager.spawn_enemy(enemy)
+        return manager
+
+    return populate
+
+
+def fire_bullets(count: int) -> object:
+    """
+    1体の敵に向けて count 発の弾を発射した状態を作る。
+    """
+    enemy_manager = EnemyManager()
+    target = GroundEnemy(BASIC_ENEMY, 0.0, 0.0, PATH)
+    enemy_manager.spawn_enemy(target)
+    unit_manager = PlayerUnitManager()
+    for _ in range(count):
+        unit_manager.bullets.add(unit_manager.bullet_pool.acquire(5.0, 5.0, target, 1))
+    return enemy_manager, unit_manager
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="PyxelTD memory benchmark")
+    parser.add_argument("--count", type=int, default=10000, help="生成する敵・弾の数")
+    parser.add_argument("--array-store", action="store_true", help="敵の状態をNumPy配列で保持する（要NumPy）")
+    args = parser.parse_args()
+
+    for archetype in (BASIC_ENEMY, FLYING_ENEMY):
+        per_enemy = measure(args.count, spawn_enemies(archetype, args.array_store))
+        print(f"{archetype.type_id}: {per_enemy:.1f} bytes/enemy (count={args.count})")
+    print(f"Bullet: {measure(args.count, fire_bullets):.1f} bytes/bullet (count={args.count})")
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ from .scenes.title_scene import TitleScene
 from .scenes.menu_scene import MenuScene
 from .scenes.in_game_scene import InGameScene
 from .scenes.stage_select_scene import StageSelectScene
+from .scenes.ingame.sprite_atlas import build_sprite_atlas
 from .input_manager import InputManager
 
 from .scenes.scene_type import SceneType
@@ -31,6 +32,8 @@ class Game:
         font_renderer = FontRenderer.get_instance()
         font_renderer.register_font("default", "../../assets/fonts/misaki_bdf_2021-05-05/misaki_mincho.bdf")
         font_renderer.register_font("gothic", "../../assets/fonts/misaki_bdf_2021-05-05/misaki_gothic.bdf")
+        # 敵・ユニット・弾のスプライトをイメージバンクに描画しておく
+        build_sprite_atlas()
         self.input_manager = InputManager(
             [
                 # ESCは終了なので除外
@@ -44,6 +47,7 @@ class Game:
                 pyxel.KEY_Z,
                 pyxel.KEY_X,
                 pyxel.KEY_R,
+                pyxel.KEY_F,
             ]
         )
         self.scenes = {
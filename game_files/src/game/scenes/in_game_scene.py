@@ -26,7 +26,9 @@ class InGameScene(BaseScene):
         if scene_param is not None and "stage_index" in scene_param:
             stage_index = scene_param["stage_index"]
         self.stage_index = stage_index
-        self.manager = InGameManager(self, stage_index)
+        # 迷路化モード（道タイルへの配置を許可）はシーンパラメータで指定する
+        self.mazing = bool(scene_param.get("mazing", False)) if scene_param is not None else False
+        self.manager = InGameManager(self, stage_index, mazing=self.mazing)
 
     def change_state(self, new_state: GameStateProtocol) -> None:
         """
@@ -43,7 +45,9 @@ class InGameScene(BaseScene):
         """
         result = self.manager.update(input_manager)
         if result == InGameResult.RETRY:
-            game.change_scene(new_scene=SceneType.IN_GAME, scene_param={"stage_index": self.stage_index})
+            game.change_scene(
+                new_scene=SceneType.IN_GAME, scene_param={"stage_index": self.stage_index, "mazing": self.mazing}
+            )
         elif result == InGameResult.STAGE_SELECT:
             game.change_scene(new_scene=SceneType.STAGE_SELECT)
 
@@ -2,41 +2,184 @@
 Bullet - ユニットの弾（攻撃）クラス
 """
 
+from itertools import chain
+from typing import Iterable, List, Optional, Tuple
+
 from .enemy.enemy import Enemy
-from .enemy.buff import BuffBase
+from .enemy.buff import BuffDefinition
+from .enemy.spatial_grid import SpatialGrid
+from .entity_list import EntityHandle, EntityList, NO_HANDLE
+from .constants import TILE_SIZE
+from .sprite_atlas import BULLET_SPRITE, SPRITE_ATLAS, DrawTarget
 
 
 class Bullet:
     """
     ユニットの弾（攻撃）を表すクラス。
     敵に向かって移動し、当たるとダメージを与える。
+    ObjectPoolで再利用されるため、状態の初期化は reset で行う。
+
+    通常は毎ティック標的に向かって移動する（update）。
+    着弾計算モードでは発射時に launch で着弾ティックを求めておき、そのティックに resolve で命中処理だけを行う。
+    着弾ティックは標的の移動予測（Enemy.predict_positions）を update と同じ計算で追尾して求めるため、
+    予測の前提（標的の速度・フローフィールド）が変わらない限り毎ティック追尾した場合と一致する。
+    前提が変わったときは repredict で途中から求め直す。
+    ただし同じティックに着弾する弾の処理順は毎ティック追尾した場合と異なることがあり、
+    先に処理した弾で標的が倒れると、残りの弾が外れるかどうかが変わる（途中の配置で経路が頻繁に変わる場合に起こりうる）。
+    この場合の座標は描画時に interpolate で、追尾の計算で求めた各ティックの位置から引く。
     """
 
+    __slots__ = (
+        "entity_handle",
+        "x",
+        "y",
+        "target",
+        "damage",
+        "grant_buff",
+        "speed",
+        "aoe_radius",
+        "is_active",
+        "flying_effect",
+        "track",
+        "aim_key",
+        "fire_tick",
+        "impact_tick",
+    )
+
+    # 着弾ティックの予測で調べる最大ティック数（弾は敵より十分速いので通常は数十ティック以内に収まる）
+    MAX_FLIGHT_TICKS = 600
+
     def __init__(
         self,
         x: float,
         y: float,
         target: "Enemy",
         damage: int,
-        grant_buff: BuffBase | None = None,
+        grant_buff: BuffDefinition | None = None,
+        speed: float = 0.5,
+        aoe_radius: float = 0.0,
+        flying_effect: bool = False,
+    ) -> None:
+        self.entity_handle: EntityHandle = NO_HANDLE  # PlayerUnitManagerのEntityListが割り当てるハンドル
+        self.reset(x, y, target, damage, grant_buff, speed, aoe_radius, flying_effect)
+
+    def reset(
+        self,
+        x: float,
+        y: float,
+        target: "Enemy",
+        damage: int,
+        grant_buff: BuffDefinition | None = None,
         speed: float = 0.5,
         aoe_radius: float = 0.0,
         flying_effect: bool = False,
     ) -> None:
+        """
+        生成直後と同じ状態に戻す（プールから再利用する際に呼ばれる）。
+        """
         self.x = x
         self.y = y
-        self.target = target  # Enemyインスタンス
+        # 標的のハンドル。敵は入れ替え削除・プールで再利用されるため、参照ではなくハンドルで保持する
+        self.target: EntityHandle = target.entity_handle
         self.damage = damage
-        self.grant_buff = grant_buff
+        self.grant_buff = grant_buff  # 命中時に付与する共有のバフ定義
         self.speed = speed
         self.aoe_radius = aoe_radius  # 着弾時の範囲攻撃半径（0なら単体）
         self.is_active = True
-        self.hit_pos: tuple[float, float] | None = None
         self.flying_effect = flying_effect
+        # --- 着弾計算モード用 ---
+        self.track: List[Tuple[float, float]] = []  # track[i]: 発射から i 回目の更新後の座標（track[0]は発射地点）
+        self.aim_key: Tuple[float, int] = (0.0, 0)  # 着弾ティックを求めたときの標的の prediction_key
+        self.fire_tick = 0
+        self.impact_tick = 0
+
+    def launch(self, target: Enemy, fire_tick: int) -> int:
+        """
+        標的の移動予測を毎ティックの追尾と同じ計算でたどり、命中するティックを求める（着弾計算モード）。
+        発射から j 回目の更新では標的の j ティック後の予測位置へ向かい、距離が speed 未満なら命中とする。
+        Returns:
+            int: 着弾ティック
+        """
+        self.fire_tick = fire_tick
+        self.track = [(self.x, self.y)]
+        self.aim_key = target.prediction_key()
+        return self._aim(target.predict_positions(), 0)
+
+    def repredict(self, target: Enemy, tick: int) -> int:
+        """
+        標的の prediction_key が変わったときに、tick のティックの更新の前に呼んで着弾ティックを求め直す。
+        前のティックまでの更新は予測どおりだったものとし、その時点の弾の座標と標的の現在位置から追尾をやり直す。
+        Returns:
+            int: 着弾ティック（tick 以降）
+        """
+        self.aim_key = target.prediction_key()
+        positions = chain(((target.x, target.y),), target.predict_positions())
+        return self._aim(positions, tick - 1 - self.fire_tick)
+
+    def _aim(self, positions: Iterable[Tuple[float, float]], done: int) -> int:
+        """
+        done 回の更新を済ませた座標（track[done]）から、標的の位置 positions へ1ティックずつ追尾し、着弾ティックを求める。
+        移動と命中の判定は update と同じ計算で行い、途中の座標は track に残す。
+        """
+        track = self.track
+        del track[done + 1 :]
+        x, y = track[done]
+        speed = self.speed
+        ticks = done
+        for target_x, target_y in positions:
+            ticks += 1
+            dx = target_x - x
+            dy = target_y - y
+            dist = (dx**2 + dy**2) ** 0.5
+            if dist < speed or dist == 0 or ticks >= self.MAX_FLIGHT_TICKS:
+                break
+            x += speed * dx / dist
+            y += speed * dy / dist
+            track.append((x, y))
+        self.impact_tick = self.fire_tick + ticks
+        return self.impact_tick
+
+    def resolve(self, enemies: EntityList[Enemy], grid: Optional[SpatialGrid] = None) -> None:
+        """
+        着弾ティックに命中処理を行う（着弾計算モード）。標的が既にいなければ外れる。
+        """
+        target = enemies.get(self.target)
+        if self.is_active and target is not None and target.is_alive:
+            self._hit(target, enemies, grid)
+        self.is_active = False
 
-    def update(self, enemies: list[Enemy]) -> None:
+    def interpolate(self, tick: int) -> None:
+        """
+        描画用に、tick 時点の座標を追尾の計算で求めた座標から引く（着弾計算モード）。
+        """
+        track = self.track
+        if track:
+            self.x, self.y = track[min(tick - self.fire_tick, len(track) - 1)]
+
+    def update(self, enemies: EntityList[Enemy], grid: Optional[SpatialGrid] = None) -> None:
         """
         弾をターゲットに向けて移動。到達したらダメージを与える。
+        grid を渡すと、範囲攻撃の対象を空間インデックスで絞り込む。
+        """
+        target = enemies.get(self.target)
+        if not self.is_active or target is None or not target.is_alive:
+            self.is_active = False
+            return
+        dx = target.x - self.x
+        dy = target.y - self.y
+        dist = (dx**2 + dy**2) ** 0.5
+        # 命中
+        if dist < self.speed or dist == 0:
+            self._hit(target, enemies, grid)
+            self.is_active = False
+        else:
+            self.x += self.speed * dx / dist
+            self.y += self.speed * dy / dist
+
+    def _hit(self, target: Enemy, enemies: EntityList[Enemy], grid: Optional[SpatialGrid]) -> None:
+        """
+        命中処理。範囲攻撃なら標的の位置を中心に範囲内の敵全てにダメージを与える。
+        範囲内の判定は平方距離で行い、grid があれば着弾点周辺のバケットだけを調べる。
         """
 
         def apply_damage(enemy: Enemy) -> None:
@@ -46,44 +189,41 @@ class Bullet:
                 damage *= 2
             enemy.damage(damage)
             if self.grant_buff:
-                enemy.buff_manager.add_buff(self.grant_buff)
+                enemy.apply_buff(self.grant_buff)
 
-        if not self.is_active or not self.target.is_alive:
-            self.is_active = False
-            return
-        dx = self.target.x - self.x
-        dy = self.target.y - self.y
-        dist = (dx**2 + dy**2) ** 0.5
-        # 命中
-        if dist < self.speed or dist == 0:
-            # 範囲攻撃なら敵全てにダメージ
-            if self.aoe_radius > 0:
-                self.hit_pos = (self.target.x, self.target.y)
-                # 範囲攻撃弾の着弾処理
-                if self.aoe_radius > 0 and self.hit_pos is not None:
-                    bx, by = self.hit_pos
-                    for enemy in enemies:
-                        if not enemy.is_alive:
-                            continue
-                        ex, ey = enemy.x, enemy.y
-                        dist = ((ex - bx) ** 2 + (ey - by) ** 2) ** 0.5
-                        if dist <= self.aoe_radius:
-                            apply_damage(enemy)
-                    self.hit_pos = None  # 1回だけ処理
+        # 範囲攻撃なら着弾点（標的の位置）から範囲内の敵全てにダメージ
+        if self.aoe_radius > 0:
+            bx, by = target.x, target.y
+            if grid is not None:
+                for enemy in grid.query_range(bx, by, self.aoe_radius):
+                    if enemy.is_alive:
+                        apply_damage(enemy)
             else:
-                apply_damage(self.target)
-            self.is_active = False
+                radius_sq = self.aoe_radius * self.aoe_radius
+                for enemy in enemies:
+                    if not enemy.is_alive:
+                        continue
+                    dx = enemy.x - bx
+                    dy = enemy.y - by
+                    if dx * dx + dy * dy <= radius_sq:
+                        apply_damage(enemy)
         else:
-            self.x += self.speed * dx / dist
-            self.y += self.speed * dy / dist
+            apply_damage(target)
 
     def draw(self, camera_x: int, camera_y: int) -> None:
         """
         弾を画面上に描画。
         """
-        import pyxel
-        from .constants import TILE_SIZE
-
         sx = int((self.x - camera_x) * TILE_SIZE + TILE_SIZE // 2)
         sy = int((self.y - camera_y) * TILE_SIZE + TILE_SIZE // 2)
-        pyxel.circ(sx, sy, 2, 7)
+        if not SPRITE_ATLAS.draw(BULLET_SPRITE, sx, sy):
+            import pyxel
+
+            self.draw_body(pyxel, sx, sy)
+
+    @staticmethod
+    def draw_body(target: DrawTarget, cx: int, cy: int) -> None:
+        """
+        弾の見た目を中心 (cx, cy) に描画する（スプライトアトラスの生成にも使う）。
+        """
+        target.circ(cx, cy, 2, 7)
@@ -59,3 +59,20 @@ class Camera:
         カメラの左上タイル座標を返す。
         """
         return self.x, self.y
+
+
+class CullStats:
+    """
+    1フレームの描画で、表示範囲内として描画した数と範囲外として省いた数（検証用）。
+    描画処理の先頭で reset し、描画のたびに数える。
+    """
+
+    __slots__ = ("drawn", "culled")
+
+    def __init__(self) -> None:
+        self.drawn = 0
+        self.culled = 0
+
+    def reset(self) -> None:
+        self.drawn = 0
+        self.culled = 0
@@ -8,3 +8,13 @@ TILE_SIZE: int = 8  # 1タイル = 8x8px
 # 画面に表示するタイル数（横・縦）
 VIEW_TILE_WIDTH: int = 14  # 画面横タイル数
 VIEW_TILE_HEIGHT: int = 14  # 画面縦タイル数
+
+# 描画カリングで表示範囲の外側にも含めるタイル数
+# 敵の黒縁・羽・影・HPバーのように、描画がタイル座標からはみ出す分を見込む
+CULL_MARGIN: int = 3
+
+# pyxelのイメージバンク（1枚 256x256px）の用途
+IMAGE_BANK_SIZE: int = 256
+SPRITE_IMAGE_BANK: int = 0  # 起動時に敵・ユニット・弾のスプライトを描画しておくバンク
+MAP_IMAGE_BANK: int = 2  # ステージ読み込み時にマップ全体を描画しておくバンク
+# バンク1は FontRenderer の描画済み文字列キャッシュ（utils/font_renderer.py）が使用する
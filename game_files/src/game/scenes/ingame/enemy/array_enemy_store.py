@@ -0,0 +1,402 @@
+"""
+ArrayEnemyStore - 敵の状態をNumPy配列（Structure of Arrays）で保持し、移動をベクトル化するストア
+
+大量の敵（数千〜数万体）を扱うステージ向けのEnemyManagerのバックエンド。
+NumPyは任意依存のため、このモジュールはEnemyManagerで配列ストアを有効にした場合のみimportされる。
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type
+
+import numpy as np  # 配列演算によるベクトル化に使用（任意依存）
+
+from .buff import BuffBase, BuffDefinition, ISpeedBuff, ITimerBuff
+from .enemy import Enemy
+from ..object_pool import ObjectPool
+
+# 配列に保持するフィールド名と、ビューから読み出す際の型変換
+_HOT_FIELDS: Dict[str, Callable[[Any], Any]] = {
+    "x": float,
+    "y": float,
+    "hp": int,
+    "is_alive": bool,
+    "is_flying": bool,
+    "hp_bar_timer": int,
+    "path_index": int,
+}
+
+# スロットごとの配列と型
+_SLOT_ARRAYS: Dict[str, Any] = {
+    "used": np.bool_,
+    "x": np.float64,
+    "y": np.float64,
+    "base_speed": np.float64,
+    "hp": np.int64,
+    "is_alive": np.bool_,
+    "is_flying": np.bool_,
+    "hp_bar_timer": np.int64,
+    "path_offset": np.int64,
+    "path_len": np.int64,
+    "path_index": np.int64,
+    "landing_x": np.float64,
+    "landing_y": np.float64,
+    "buff_timer": np.int64,
+    "buff_delta": np.float64,
+    "cell_x": np.int64,
+    "cell_y": np.int64,
+}
+
+# ビューが自前で持ち、元の敵から写さない属性
+_VIEW_OWN_FIELDS = frozenset(_HOT_FIELDS) | {"buff_manager"}
+
+# 経路点ごとの連結配列と型
+_PATH_ARRAYS: Dict[str, Any] = {
+    "path_x": np.float64,
+    "path_y": np.float64,
+}
+
+
+def _slot_names(enemy_class: Type[Enemy]) -> List[str]:
+    """
+    敵クラスとその基底クラスが __slots__ で宣言した属性名を全て返す。
+    """
+    names: List[str] = []
+    for cls in reversed(enemy_class.__mro__):
+        slots = cls.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return names
+
+
+def _array_field(name: str, cast: Callable[[Any], Any]) -> property:
+    """
+    ストアの配列要素を読み書きするプロパティを生成する。
+    ストアから外れた（除去済みの）ビューは、除去時点の値を保持した辞書を参照する。
+    """
+
+    def getter(view: "EnemyArrayView") -> Any:
+        store = view._store
+        if store is None:
+            return view._detached[name]  # type: ignore[index]
+        return cast(getattr(store, name)[view._slot])
+
+    def setter(view: "EnemyArrayView", value: Any) -> None:
+        store = view._store
+        if store is None:
+            view._detached[name] = value  # type: ignore[index]
+        else:
+            getattr(store, name)[view._slot] = value
+
+    return property(getter, setter)
+
+
+class EnemyArrayView:
+    """
+    ArrayEnemyStoreの1スロットを既存のEnemyクラスとして見せるためのMix-in。
+    位置・HP・フラグ等はプロパティ経由で配列を読み書きし、
+    描画・ダメージ処理などのメソッドは元のEnemyクラスの実装をそのまま使う。
+    ビューは元のクラスごとのObjectPoolで再利用し、スロットへの結び付けは reset で行う。
+    Enemy側の __slots__ と配置が衝突しないよう、ビュー固有の属性の __slots__ は
+    ビュークラスの生成時（ArrayEnemyStore._view_class）に宣言する。
+    """
+
+    __slots__ = ()
+
+    _store: "ArrayEnemyStore | None"
+    _slot: int
+    _detached: Optional[Dict[str, Any]]  # ストアから外したときの値（結び付いている間はNone）
+
+    x = _array_field("x", float)
+    y = _array_field("y", float)
+    hp = _array_field("hp", int)
+    is_alive = _array_field("is_alive", bool)
+    is_flying = _array_field("is_flying", bool)
+    hp_bar_timer = _array_field("hp_bar_timer", int)
+    path_index = _array_field("path_index", int)
+
+    def __init__(self, store: "ArrayEnemyStore", slot: int) -> None:
+        self.buff_manager = ArrayBuffManager(self)  # type: ignore[assignment]
+        EnemyArrayView.reset(self, store, slot)
+
+    def reset(self, store: "ArrayEnemyStore", slot: int) -> None:  # type: ignore[override]
+        """
+        ビューをストアのスロットに結び付ける（プールから再利用する際に呼ばれる）。
+        """
+        self._store = store
+        self._slot = slot
+        self._detached = None
+
+
+class ArrayBuffManager:
+    """
+    配列ストア上の敵に対するBuffManager互換のアダプタ。
+    速度低下バフ（ISpeedBuff かつ ITimerBuff）の残り時間と速度補正値を配列で管理する。
+    速度バフは敵1体につき同時に1つまでで、効果中に付与した速度バフは種類によらず無視する
+    （BuffManagerでは種類の違う速度バフは重ねて掛かる）。
+    """
+
+    __slots__ = ("view",)
+
+    def __init__(self, view: EnemyArrayView) -> None:
+        self.view = view
+
+    def apply(self, definition: BuffDefinition) -> None:
+        """
+        共有のバフ定義を適用する。既に効果中なら重複させない（BuffManagerと同じ規則）。
+        """
+        self._set_speed_buff(definition.duration, definition.speed_modifier)
+
+    def add_buff(self, buff: BuffBase) -> None:
+        """
+        バフを適用する。既に効果中なら重複させない（BuffManagerと同じ規則）。
+        """
+        if not (isinstance(buff, ISpeedBuff) and isinstance(buff, ITimerBuff)):
+            raise TypeError(f"ArrayEnemyStore does not support buff type: {type(buff).__name__}")
+        self._set_speed_buff(buff.get_duration(), buff.get_speed_multiplier())
+
+    def _set_speed_buff(self, duration: int, speed_modifier: float) -> None:
+        """
+        速度バフの残り時間と速度補正値を書き込む。
+        """
+        store = self.view._store
+        if store is None:
+            return
+        slot = self.view._slot
+        if store.buff_timer[slot] > 0:
+            return
+        store.buff_timer[slot] = max(1, duration)
+        store.buff_delta[slot] = speed_modifier
+
+    def update(self) -> None:
+        """
+        バフの残り時間はストアのstepでまとめて進めるため、個別更新では何もしない。
+        """
+        pass
+
+    def get_speed_multiplier(self) -> float:
+        """
+        現在の速度倍率を返す。
+        """
+        store = self.view._store
+        if store is None:
+            return 1.0
+        return 1.0 + float(store.buff_delta[self.view._slot])
+
+
+class ArrayEnemyStore:
+    """
+    敵の状態を固定長のNumPy配列に詰めて保持し、1ティック分の移動を配列演算でまとめて行うクラス。
+
+    スロットは再利用され、除去された敵のスロットは空きリストに戻る。
+    経路は共有経路ごとに1度だけ連結配列へ登録し、各敵は経路の開始位置・長さと進み具合を持つ。
+    """
+
+    def __init__(self, capacity: int = 256) -> None:
+        self.capacity = 0
+        self.size = 0  # 使用したことのある最大スロット数（走査範囲）
+        self.views: List[Enemy | None] = []
+        self._free_slots: List[int] = []
+        # 経路の連結配列
+        for name, dtype in _PATH_ARRAYS.items():
+            setattr(self, name, np.zeros(0, dtype=dtype))
+        self._path_count = 0
+        self._path_offsets: Dict[int, Tuple[Sequence[Tuple[int, int]], int]] = {}  # id(path) → (path, offset)
+        self._view_classes: Dict[Type[Enemy], Type[Enemy]] = {}
+        self._copy_fields: Dict[Type[Enemy], Tuple[str, ...]] = {}  # 元の敵から写す属性名
+        self.view_pools: Dict[Type[Enemy], ObjectPool[Any]] = {}  # ビュークラス → 除去したビューのプール
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        """
+        配列を指定容量まで拡張する（既存の値は保持）。
+        """
+
+        for name, dtype in _SLOT_ARRAYS.items():
+            array = np.zeros(capacity, dtype=dtype)
+            if self.capacity:
+                array[: self.capacity] = getattr(self, name)
+            setattr(self, name, array)
+        self.views.extend([None] * (capacity - self.capacity))
+        self.capacity = capacity
+
+    def _register_path(self, path: Sequence[Tuple[int, int]]) -> int:
+        """
+        経路を連結配列に登録し、開始位置を返す。同じ経路オブジェクトは1度だけ登録する。
+        """
+        entry = self._path_offsets.get(id(path))
+        if entry is not None and entry[0] is path:
+            return entry[1]
+        offset = self._path_count
+        needed = offset + len(path)
+        if needed > len(self.path_x):
+            new_len = max(needed, len(self.path_x) * 2, 64)
+            for name, dtype in _PATH_ARRAYS.items():
+                array = np.zeros(new_len, dtype=dtype)
+                array[:offset] = getattr(self, name)[:offset]
+                setattr(self, name, array)
+        for i, (px, py) in enumerate(path):
+            self.path_x[offset + i] = px
+            self.path_y[offset + i] = py
+        self._path_count = needed
+        self._path_offsets[id(path)] = (path, offset)
+        return offset
+
+    def _view_class(self, enemy_class: Type[Enemy]) -> Type[Enemy]:
+        """
+        元のEnemyクラスにEnemyArrayViewを合成したビュークラスを返す。
+        初回はビュークラスのプールと、元の敵から写す属性名の一覧もあわせて用意する。
+        """
+        view_class = self._view_classes.get(enemy_class)
+        if view_class is None:
+            view_class = type(
+                f"{enemy_class.__name__}View",
+                (EnemyArrayView, enemy_class),
+                {"__slots__": ("_store", "_slot", "_detached"), "__module__": __name__},
+            )
+            self._view_classes[enemy_class] = view_class
+            self._copy_fields[enemy_class] = tuple(
+                name for name in _slot_names(enemy_class) if name not in _VIEW_OWN_FIELDS
+            )
+            self.view_pools[view_class] = ObjectPool(view_class, capacity=1024)
+        return view_class
+
+    def adopt(self, enemy: Enemy) -> Enemy:
+        """
+        生成済みの敵の状態をストアへ移し、配列を参照するビューを返す。
+        以後はビューを元の敵の代わりに使うこと。
+        """
+        if enemy.flow_field is not None:
+            raise ValueError("ArrayEnemyStore does not support flow-field movement")
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            if self.size >= self.capacity:
+                self._allocate(self.capacity * 2)
+            slot = self.size
+            self.size += 1
+        path = enemy.path
+        for name in _HOT_FIELDS:
+            getattr(self, name)[slot] = getattr(enemy, name, 0.0)
+        self.used[slot] = True
+        self.base_speed[slot] = enemy.base_speed
+        self.path_offset[slot] = self._register_path(path)
+        self.path_len[slot] = len(path)
+        self.landing_x[slot] = getattr(enemy, "landing_x", 0.0)
+        self.landing_y[slot] = getattr(enemy, "landing_y", 0.0)
+        self.buff_timer[slot] = 0
+        self.buff_delta[slot] = 0.0
+        self.cell_x[slot] = int(np.floor(self.x[slot]))
+        self.cell_y[slot] = int(np.floor(self.y[slot]))
+
+        view_class = self._view_class(type(enemy))
+        view = self.view_pools[view_class].acquire(self, slot)
+        # 配列で保持しない属性は元の敵の __slots__ からそのまま写す
+        for key in self._copy_fields[type(enemy)]:
+            if hasattr(enemy, key):
+                setattr(view, key, getattr(enemy, key))
+        self.views[slot] = view
+        return view
+
+    def release(self, slot: int) -> None:
+        """
+        スロットを解放する。ビューは除去時点の値を保持したまま切り離される（弾の標的として残す場合）。
+        切り離したビューが不要になったら recycle でプールへ返却すること。
+        """
+        view = self.views[slot]
+        if view is not None:
+            view._detached = {name: cast(getattr(self, name)[slot]) for name, cast in _HOT_FIELDS.items()}  # type: ignore[attr-defined]
+            view._store = None  # type: ignore[attr-defined]
+        self._free_slot(slot)
+
+    def recycle(self, view: Enemy) -> None:
+        """
+        不要になったビューをプールへ返却する。スロットに結び付いたままならスロットも解放する。
+        返却後はビューを参照しないこと。
+        """
+        if view._store is not None:  # type: ignore[attr-defined]
+            self._free_slot(view._slot)  # type: ignore[attr-defined]
+            view._store = None  # type: ignore[attr-defined]
+        view._detached = None  # type: ignore[attr-defined]
+        self.view_pools[type(view)].release(view)
+
+    def _free_slot(self, slot: int) -> None:
+        """
+        スロットを空きリストに戻す。
+        """
+        self.views[slot] = None
+        self.used[slot] = False
+        self.is_alive[slot] = False
+        self._free_slots.append(slot)
+
+    def step(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        全ての敵を1ティック分まとめて更新する。Enemy.update / FlyingEnemy.update と同じ規則で、
+        バフ時間の経過 → 死亡判定 → HPバータイマー → 経路（飛行中は着地点）への移動 を行う。
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]:
+                ゴールに到達したスロット、除去すべきスロット、タイルが変わったスロット
+        """
+        n = self.size
+        used = self.used[:n]
+        alive = self.is_alive[:n]
+        flying = self.is_flying[:n]
+        hp = self.hp[:n]
+        path_index = self.path_index[:n]
+        path_len = self.path_len[:n]
+        x = self.x[:n]
+        y = self.y[:n]
+
+        # バフ時間の経過（飛行中の敵はBuffManager.pauseと同じくバフ時間が進まない）
+        buff_timer = self.buff_timer[:n]
+        ticking = used & ~flying & (buff_timer > 0)
+        buff_timer[ticking] -= 1
+        expired = ticking & (buff_timer <= 0)
+        self.buff_delta[:n][expired] = 0.0
+
+        # HP0以下の敵は移動せずに死亡
+        active = used & alive
+        dead_now = active & (hp <= 0)
+        alive[dead_now] = False
+        active &= ~dead_now
+
+        bar = self.hp_bar_timer[:n]
+        bar[active & (bar > 0)] -= 1
+
+        # 経路を使い切った地上の敵（空経路など）はゴール扱いで消える
+        ground = active & ~flying
+        exhausted = ground & (path_index >= path_len)
+        alive[exhausted] = False
+        moving_ground = ground & ~exhausted
+        movers = moving_ground | (active & flying)
+
+        # 目標座標: 飛行中は着地点、地上は経路上の次のタイル（Enemy._move_towards と同じ計算）
+        waypoint = np.where(moving_ground, self.path_offset[:n] + path_index, 0)
+        target_x = np.where(flying, self.landing_x[:n], self.path_x[waypoint] if len(self.path_x) else 0.0)
+        target_y = np.where(flying, self.landing_y[:n], self.path_y[waypoint] if len(self.path_y) else 0.0)
+        speed = self.base_speed[:n] * (1.0 + self.buff_delta[:n])
+        dx = target_x - x
+        dy = target_y - y
+        # 軸に平行な移動は残り距離が差の絶対値そのもの（Enemy._move_towards と同じ）なので、sqrtは斜めの移動だけに使う
+        dist = np.abs(dx) + np.abs(dy)
+        diagonal = (dx != 0) & (dy != 0)
+        if diagonal.any():
+            dist[diagonal] = np.sqrt(dx[diagonal] ** 2 + dy[diagonal] ** 2)
+        arrive = movers & (dist < speed)
+        advance = movers & ~arrive & (dist != 0)
+        x[arrive] = target_x[arrive]
+        y[arrive] = target_y[arrive]
+        x[advance] += speed[advance] * dx[advance] / dist[advance]
+        y[advance] += speed[advance] * dy[advance] / dist[advance]
+
+        landed = arrive & flying
+        path_index[arrive & ~flying] += 1
+        path_index[landed] = 0
+        flying[landed] = False
+
+        goal_reached = (moving_ground | exhausted) & (path_index >= path_len)
+        removed = used & ~(alive & (path_index < path_len))
+
+        new_cell_x = np.floor(x).astype(np.int64)
+        new_cell_y = np.floor(y).astype(np.int64)
+        cell_changed = used & ~removed & ((new_cell_x != self.cell_x[:n]) | (new_cell_y != self.cell_y[:n]))
+        self.cell_x[:n] = new_cell_x
+        self.cell_y[:n] = new_cell_y
+        return np.flatnonzero(goal_reached), np.flatnonzero(removed), np.flatnonzero(cell_changed)
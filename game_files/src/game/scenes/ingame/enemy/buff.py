@@ -2,6 +2,8 @@ from abc import ABC, abstractmethod
 
 
 class ISpeedBuff(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_speed_multiplier(self) -> float:
         """
@@ -11,6 +13,8 @@ class ISpeedBuff(ABC):
 
 
 class ITimerBuff(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def get_duration(self) -> int:
         """
@@ -23,8 +27,11 @@ class BuffBase(ABC):
     """
     バフのインターフェース。
     すべてのバフはこのインターフェースを実装する必要がある。
+    敵ごとに生成されるため、継承先でも __slots__ を宣言して __dict__ を持たせないこと。
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None: ...
 
     @abstractmethod
@@ -48,6 +55,8 @@ class SpeedDownBuff(BuffBase, ISpeedBuff, ITimerBuff):
     敵の移動速度を下げるバフ。
     """
 
+    __slots__ = ("duration", "speed_multiplier")
+
     def __init__(self, duration: int, speed_multiplier: float) -> None:
         super().__init__()
         self.duration = duration
@@ -73,3 +82,49 @@ class SpeedDownBuff(BuffBase, ISpeedBuff, ITimerBuff):
         バフの持続時間を取得する。
         """
         return self.duration
+
+
+class BuffDefinition:
+    """
+    不変のバフ定義（フライウェイト）。
+    同じ種類のバフは1つの定義を全ての弾・敵で共有し、敵ごとの状態は (定義ID, 効果が切れるティック) だけを持つ。
+    生成後に属性を書き換えないこと。
+    """
+
+    __slots__ = ("definition_id", "name", "duration", "speed_modifier", "allow_duplicate")
+
+    def __init__(
+        self, definition_id: int, name: str, duration: int, speed_modifier: float, allow_duplicate: bool = False
+    ) -> None:
+        """
+        Args:
+            definition_id (int): BUFF_DEFINITIONS 内のインデックス
+            name (str): 識別用の名前
+            duration (int): 持続時間（ティック数）
+            speed_modifier (float): 速度倍率に加算する値（速度低下なら負）
+            allow_duplicate (bool): 同じ定義のバフを重複して適用できるか
+        """
+        self.definition_id = definition_id
+        self.name = name
+        self.duration = duration
+        self.speed_modifier = speed_modifier
+        self.allow_duplicate = allow_duplicate
+
+
+# 登録済みのバフ定義（インデックス = 定義ID）
+BUFF_DEFINITIONS: list[BuffDefinition] = []
+
+
+def register_buff_definition(
+    name: str, duration: int, speed_modifier: float, allow_duplicate: bool = False
+) -> BuffDefinition:
+    """
+    バフ定義を登録し、定義IDを割り当てて返す。
+    """
+    definition = BuffDefinition(len(BUFF_DEFINITIONS), name, duration, speed_modifier, allow_duplicate)
+    BUFF_DEFINITIONS.append(definition)
+    return definition
+
+
+# 魔法使い（Mage）の攻撃で付与する速度低下（300フレームの間、速度を0.5倍）
+SLOW_BUFF = register_buff_definition("slow", duration=300, speed_modifier=-0.5)
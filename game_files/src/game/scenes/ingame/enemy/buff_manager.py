@@ -1,13 +1,108 @@
-from .buff import BuffBase, ISpeedBuff
+from typing import Dict, Optional, Tuple, Type, TYPE_CHECKING
+
+from .buff import BUFF_DEFINITIONS, BuffBase, BuffDefinition, ISpeedBuff, ITimerBuff
+
+if TYPE_CHECKING:
+    from .buff_timer_wheel import BuffTimerWheel
+
+# 敵ごとのバフ状態: (定義ID, 効果が切れるティック)
+BuffRecord = Tuple[int, int]
+
+# 停止中に付与され、効果切れをまだ予約していない記録の効果切れティック
+HELD_EXPIRE_TICK = -1
+
+# バフが1つもない敵で共有する空のコンテナ（最初にバフを追加したときに敵ごとのリスト・辞書を確保する）
+_EMPTY: tuple = ()
 
 
 class BuffManager:
     """
     敵ユニットのバフ（強化効果）を管理するクラス。
+
+    共有のバフ定義（BuffDefinition）は (定義ID, 効果が切れるティック) の記録だけを保持する。
+    個別の状態を持つバフオブジェクト（BuffBase）も従来どおり追加できる。
+    速度倍率などの集計値はバフの追加・効果切れのときだけ計算し直してキャッシュする。
+    タイマーホイールが設定されていれば、時間制バフの効果切れはホイールに任せ、毎ティックの減算を行わない。
+    大半の敵はバフを受けないため、リスト・辞書は最初にバフを追加したときに確保する。
+    飛行中の敵のように update が呼ばれない間は pause で効果時間を止め、resume した時点から効果時間を数え始める。
     """
 
-    def __init__(self) -> None:
-        self.buffs: list[BuffBase] = []
+    __slots__ = (
+        "buffs",
+        "records",
+        "timer_wheel",
+        "_tick",
+        "_ticking_buffs",
+        "_type_counts",
+        "_speed_multiplier",
+        "_held",
+    )
+
+    def __init__(self, timer_wheel: Optional["BuffTimerWheel"] = None) -> None:
+        self.timer_wheel = timer_wheel
+        self.clear()
+
+    def clear(self) -> None:
+        """
+        全てのバフを取り除く（敵をプールで再利用する際に呼ばれる）。
+        タイマーホイールに残った予約は、効果切れ時に該当する記録がないため無視される。
+        """
+        self.buffs: list[BuffBase] = _EMPTY  # type: ignore[assignment]
+        self.records: list[BuffRecord] = _EMPTY  # type: ignore[assignment]
+        self._tick = 0  # タイマーホイールがない場合に記録の効果切れを判定するための経過ティック
+        self._ticking_buffs: list[BuffBase] = _EMPTY  # type: ignore[assignment]  # 毎ティック update が必要なバフ
+        self._type_counts: Dict[Type[BuffBase], int] = _EMPTY  # type: ignore[assignment]  # クラスごとの適用数
+        self._speed_multiplier = 1.0
+        # 停止中なら、効果切れの予約を resume まで保留しているバフ・記録（停止中でなければNone）
+        self._held: Optional[list["BuffBase | BuffRecord"]] = None
+
+    def pause(self) -> None:
+        """
+        効果時間の経過を止める。以後に付与された時間制バフは、resume するまでタイマーホイールに予約しない。
+        タイマーホイールがない場合は update が呼ばれない限り効果時間が進まないため、呼び出し側の update 停止で足りる。
+        敵の生成直後（バフがない状態）に呼ぶこと。
+        """
+        if self._held is None:
+            self._held = []
+
+    def resume(self) -> None:
+        """
+        効果時間の経過を再開し、停止中に付与されたバフの効果切れを現在のティックから予約する。
+        """
+        held = self._held
+        self._held = None
+        wheel = self.timer_wheel
+        if not held or wheel is None:
+            return
+        for item in held:
+            if isinstance(item, tuple):
+                record = (item[0], wheel.expire_tick(BUFF_DEFINITIONS[item[0]].duration))
+                self.records[self.records.index(item)] = record
+                wheel.schedule(self, record, record[1])
+            else:
+                wheel.schedule(self, item, wheel.expire_tick(item.get_duration()))
+
+    def apply(self, definition: BuffDefinition) -> None:
+        """
+        共有のバフ定義を適用する。重複不可の定義が効果中なら何もしない。
+        """
+        definition_id = definition.definition_id
+        if not definition.allow_duplicate:
+            for record in self.records:
+                if record[0] == definition_id:
+                    return
+        if self.timer_wheel is not None and self._held is not None:
+            record = (definition_id, HELD_EXPIRE_TICK)
+            self._held.append(record)
+        elif self.timer_wheel is not None:
+            record = (definition_id, self.timer_wheel.expire_tick(definition.duration))
+            self.timer_wheel.schedule(self, record, record[1])
+        else:
+            record = (definition_id, self._tick + max(1, definition.duration))
+        if not self.records:
+            self.records = []
+        self.records.append(record)
+        self._refresh()
 
     def add_buff(self, buff: BuffBase) -> None:
         """
@@ -15,28 +110,77 @@ class BuffManager:
         """
         if not buff.is_allow_duplicate():
             # 既に同じタイプのバフがある場合は追加しない
-            for existing_buff in self.buffs:
-                if isinstance(existing_buff, type(buff)):
+            buff_type = type(buff)
+            for existing_type in self._type_counts:
+                if issubclass(existing_type, buff_type):
                     return
+        if not self.buffs:
+            self.buffs = []
+            self._type_counts = {}
         self.buffs.append(buff)
+        self._type_counts[type(buff)] = self._type_counts.get(type(buff), 0) + 1
+        if self.timer_wheel is not None and isinstance(buff, ITimerBuff):
+            if self._held is not None:
+                self._held.append(buff)
+            else:
+                self.timer_wheel.schedule(self, buff, self.timer_wheel.expire_tick(buff.get_duration()))
+        else:
+            if not self._ticking_buffs:
+                self._ticking_buffs = []
+            self._ticking_buffs.append(buff)
+        self._refresh()
 
     def update(self) -> None:
         """
         バフの効果を更新する。
+        タイマーホイールで管理しているバフはここでは更新しない。
         """
-        new_buffs = []
-        for buff in self.buffs:
-            if not buff.update():
-                new_buffs.append(buff)
-        self.buffs = new_buffs
+        if self.timer_wheel is None and self.records:
+            self._tick += 1
+            for record in [record for record in self.records if record[1] <= self._tick]:
+                self.expire(record)
+        if not self._ticking_buffs:
+            return
+        expired = [buff for buff in self._ticking_buffs if buff.update()]
+        for buff in expired:
+            self.expire(buff)
 
-    def get_speed_multiplier(self) -> float:
+    def expire(self, buff: "BuffBase | BuffRecord") -> None:
         """
-        指定した敵ユニットの速度倍率を取得。
-        バフが適用されていない場合は1.0を返す。
+        バフを取り除く（効果切れ）。
+        """
+        if isinstance(buff, tuple):
+            if buff in self.records:
+                self.records.remove(buff)
+                self._refresh()
+            return
+        if buff not in self.buffs:
+            return
+        self.buffs.remove(buff)
+        if buff in self._ticking_buffs:
+            self._ticking_buffs.remove(buff)
+        count = self._type_counts[type(buff)] - 1
+        if count:
+            self._type_counts[type(buff)] = count
+        else:
+            del self._type_counts[type(buff)]
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """
+        キャッシュしている集計値を計算し直す。
         """
         speed_multiplier = 1.0
         for buff in self.buffs:
             if isinstance(buff, ISpeedBuff):
                 speed_multiplier += buff.get_speed_multiplier()
-        return speed_multiplier
+        for definition_id, _ in self.records:
+            speed_multiplier += BUFF_DEFINITIONS[definition_id].speed_modifier
+        self._speed_multiplier = speed_multiplier
+
+    def get_speed_multiplier(self) -> float:
+        """
+        指定した敵ユニットの速度倍率を取得。
+        バフが適用されていない場合は1.0を返す。
+        """
+        return self._speed_multiplier
@@ -0,0 +1,63 @@
+"""
+BuffTimerWheel - バフの効果切れをティック単位で予約する共有タイマーホイール
+"""
+
+from typing import List, Tuple, TYPE_CHECKING, Union
+
+from .buff import BuffBase
+
+if TYPE_CHECKING:
+    from .buff_manager import BuffManager, BuffRecord
+
+# (効果が切れるティック, 対象のBuffManager, バフまたはバフ記録)
+TimerEntry = Tuple[int, "BuffManager", Union[BuffBase, "BuffRecord"]]
+
+
+class BuffTimerWheel:
+    """
+    全ての敵のバフの効果切れを1つのリング状のバケット列で管理するクラス。
+
+    バフごとに毎ティック残り時間を減らす代わりに、付与時に「効果が切れるティック」のバケットへ登録し、
+    ティックを進めたときに該当バケットだけを処理する。1ティックの処理コストは
+    その時点で効果が切れるバフの数に比例し、効果中のバフの総数には依存しない。
+    ホイールの周長より長い効果時間は、同じバケットに残したまま周回を待つ。
+    """
+
+    def __init__(self, size: int = 512) -> None:
+        """
+        Args:
+            size (int): バケット数（一般的な効果時間より長くしておくと周回待ちが発生しない）
+        """
+        self.tick = 0  # 現在のティック
+        self.size = size
+        self.buckets: List[List[TimerEntry]] = [[] for _ in range(size)]
+
+    def expire_tick(self, duration: int) -> int:
+        """
+        今付与したバフの効果が切れるティックを返す。
+        従来の毎ティック減算と同じく、付与から duration 回ティックを進めた時点で効果が切れる（最短1ティック）。
+        """
+        return self.tick + max(1, duration)
+
+    def schedule(self, manager: "BuffManager", buff: "BuffBase | BuffRecord", expire_tick: int) -> None:
+        """
+        バフの効果切れを予約する。指定ティックまで進めたときに manager.expire(buff) が呼ばれる。
+        """
+        self.buckets[expire_tick % self.size].append((expire_tick, manager, buff))
+
+    def advance(self) -> None:
+        """
+        1ティック進め、このティックで効果が切れるバフを各BuffManagerから取り除く。
+        """
+        self.tick += 1
+        index = self.tick % self.size
+        bucket = self.buckets[index]
+        if not bucket:
+            return
+        pending: List[TimerEntry] = []
+        for entry in bucket:
+            if entry[0] == self.tick:
+                entry[1].expire(entry[2])
+            else:
+                pending.append(entry)
+        self.buckets[index] = pending
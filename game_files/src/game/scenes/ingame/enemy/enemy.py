@@ -1,6 +1,13 @@
-from typing import List, Tuple, Callable, Optional
+from typing import Iterator, Sequence, Tuple, Callable, Optional, TYPE_CHECKING
 from .buff_manager import BuffManager
-from .buff import BuffBase
+from .buff import BuffBase, BuffDefinition
+from ..entity_list import EntityHandle, NO_HANDLE
+from ..constants import TILE_SIZE
+from ..sprite_atlas import SPRITE_ATLAS, DrawTarget
+
+if TYPE_CHECKING:
+    from ..flow_field import FlowField
+    from .enemy_archetype import EnemyArchetype
 
 """
 Enemy - 敵ユニットの基本クラス
@@ -13,34 +20,89 @@ class Enemy(ABC):
     """
     敵ユニットの抽象基底クラス。
     位置・速度・HP・移動・描画・到達判定などを管理。
-    継承先で各メソッドを実装すること。
+    HP・速度・報酬などの能力値は敵の種類（EnemyArchetype）から引き、継承先は移動の仕方と描画だけを実装する。
+    大量に生存させるため __slots__ で属性を固定し、インスタンスごとの __dict__ を持たない。
+    継承先で属性を追加する場合は、その継承先でも __slots__ を宣言すること。
     """
 
+    __slots__ = (
+        "archetype",
+        "buff_manager",
+        "entity_handle",
+        "x",
+        "y",
+        "base_speed",
+        "max_hp",
+        "hp",
+        "path",
+        "path_index",
+        "is_alive",
+        "hp_bar_timer",
+        "reward",
+        "is_flying",
+        "on_defeat",
+        "coefficient",
+        "spawn_order",
+        "flow_field",
+        "waypoint",
+    )
+
+    # 見た目の状態（スプライトアトラスは敵の種類×状態ごとに1枚描画する）
+    SPRITE_STATES: Tuple[str, ...] = ("walk",)
+
     def __init__(
         self,
+        archetype: "EnemyArchetype",
+        x: float,
+        y: float,
+        path: Sequence[Tuple[int, int]],
+        on_defeat: Optional[Callable[["Enemy"], None]] = None,
+        coefficient: float = 1.0,
+    ) -> None:
+        """
+        Args:
+            archetype: 敵の種類（能力値・見た目）
+            x, y: 出現座標（タイル座標）
+            path: 進む経路（StageManagerが共有する経路）
+            on_defeat: 撃破時のコールバック
+            coefficient: ステージ難易度調整用係数（HP・報酬に掛かる）
+        """
+        self.buff_manager = BuffManager()
+        self.entity_handle: EntityHandle = NO_HANDLE  # EnemyManagerのEntityListが割り当てるハンドル
+        Enemy.reset(self, archetype, x, y, path, on_defeat, coefficient)
+
+    def reset(
+        self,
+        archetype: "EnemyArchetype",
         x: float,
         y: float,
-        base_speed: float,
-        hp: int,
-        path: list[Tuple[int, int]],
-        reward: int = 5,
+        path: Sequence[Tuple[int, int]],
         on_defeat: Optional[Callable[["Enemy"], None]] = None,
         coefficient: float = 1.0,
     ) -> None:
+        """
+        生成直後と同じ状態に戻す（プールから再利用する際に呼ばれる）。
+        """
+        stats = archetype.get_stats(coefficient)  # 係数を適用済みの能力値（種類と係数ごとにキャッシュ）
+        self.archetype = archetype
         self.x = x
         self.y = y
-        self.base_speed = base_speed
-        self.max_hp = int(hp * coefficient)  # ステージ難易度調整用係数を適用
+        self.base_speed = stats.speed
+        self.max_hp = stats.max_hp
         self.hp = self.max_hp
-        self.path = path
-        self.path_index = 0
+        self.path = path  # 共有経路（StageManagerが保持する不変タプル）
+        self.path_index = 0  # 次に向かう経路点のインデックス
         self.is_alive = True  # Falseなら死亡・ゴール到達
         self.hp_bar_timer = 0  # HPバー表示タイマー（フレーム数）
-        self.reward = int(reward * coefficient)  # 報酬も係数適用
+        self.reward = stats.reward
         self.is_flying = False  # 飛行中かどうか
         self.on_defeat = on_defeat  # 敵撃破時のコールバック
-        self.buff_manager = BuffManager()
+        self.buff_manager.clear()
         self.coefficient = coefficient
+        self.spawn_order = 0  # EnemyManagerが割り当てる出現順（小さいほど先に出現）
+        # フローフィールド移動時のみ使用（pathの代わりに次のタイルを都度引く）
+        self.flow_field: Optional["FlowField"] = None
+        self.waypoint: Optional[Tuple[int, int]] = None
 
     def update(self) -> bool:
         """
@@ -56,31 +118,128 @@ class Enemy(ABC):
             return False
         if self.hp_bar_timer > 0:
             self.hp_bar_timer -= 1
-        if self.path_index < len(self.path):
+        if self.flow_field is not None:
+            if self.waypoint is not None:
+                self._follow_flow_field(self.flow_field, self.waypoint)
+            else:
+                self.is_alive = False
+        elif self.path_index < len(self.path):
             target_x, target_y = self.path[self.path_index]
-            dx = target_x - self.x
-            dy = target_y - self.y
-            dist = (dx**2 + dy**2) ** 0.5
-            if dist < self.get_speed():
-                self.x = target_x
-                self.y = target_y
+            if self._move_towards(target_x, target_y):
                 self.path_index += 1
-            else:
-                if dist != 0:
-                    self.x += self.get_speed() * dx / dist
-                    self.y += self.get_speed() * dy / dist
         else:
             self.is_alive = False
         return self.is_goal()
 
-    @abstractmethod
+    def _move_towards(self, target_x: float, target_y: float) -> bool:
+        """
+        目標座標へ現在の速度で直進する。1ティックで届く距離なら目標座標に到着させる。
+        経路の区間はタイル間の上下左右の移動なので、軸に平行な移動では残り距離が
+        動く軸の差の絶対値そのものになり（sqrt(dx**2) と同じ値）、sqrtを使わずその軸の座標だけを進める。
+        Returns:
+            bool: 目標座標に到着したらTrue
+        """
+        speed = self.get_speed()
+        dx = target_x - self.x
+        dy = target_y - self.y
+        if dy == 0:
+            dist = abs(dx)
+            if dist < speed:
+                self.x = target_x
+                self.y = target_y
+                return True
+            if dist != 0:
+                self.x += speed * dx / dist
+            return False
+        if dx == 0:
+            dist = abs(dy)
+            if dist < speed:
+                self.x = target_x
+                self.y = target_y
+                return True
+            self.y += speed * dy / dist
+            return False
+        # 斜めの移動（飛行中の敵など）
+        dist = (dx**2 + dy**2) ** 0.5
+        if dist < speed:
+            self.x = target_x
+            self.y = target_y
+            return True
+        if dist != 0:
+            self.x += speed * dx / dist
+            self.y += speed * dy / dist
+        return False
+
+    def use_flow_field(self, flow_field: "FlowField", start: Tuple[int, int]) -> None:
+        """
+        経路リストの代わりにフローフィールドを参照して進むモードに切り替える。
+        Args:
+            flow_field: 移動に使うフローフィールド
+            start: 最初に向かうタイル（出現地点・着地地点）
+        """
+        self.flow_field = flow_field
+        self.path = ()
+        self.path_index = 0
+        # ゴールへ到達できない開始地点は、空の経路と同じく即ゴール扱い
+        self.waypoint = start if flow_field.is_reachable(*start) else None
+
+    def _follow_flow_field(self, flow_field: "FlowField", waypoint: Tuple[int, int]) -> None:
+        """
+        現在向かっているタイルへ進み、到着したらフローフィールドから次のタイルを引く。
+        ゴールタイルに到着すると waypoint は None になる。
+        """
+        if self._move_towards(*waypoint):
+            self.waypoint = flow_field.get_next(*waypoint)
+
+    def sprite_state(self) -> str:
+        """
+        現在の見た目の状態（SPRITE_STATES のいずれか）を返す。
+        """
+        return "walk"
+
     def draw(self, camera_x: int, camera_y: int) -> None:
         """
         敵ユニットを画面上に描画。
         camera_x, camera_y: カメラの左上タイル座標
+        見た目はスプライトアトラスから blt 1回で描画し、アトラスにない場合だけ draw_body で直接描画する。
+        """
+        if not self.is_alive:
+            return
+        screen_x = int((self.x - camera_x) * TILE_SIZE)
+        screen_y = int((self.y - camera_y) * TILE_SIZE)
+        state = self.sprite_state()
+        if not SPRITE_ATLAS.draw((self.archetype, state), screen_x, screen_y):
+            import pyxel
+
+            self.draw_body(pyxel, self.archetype, state, screen_x, screen_y)
+        self.draw_hp_bar(screen_x, screen_y)
+
+    @staticmethod
+    @abstractmethod
+    def draw_body(target: DrawTarget, archetype: "EnemyArchetype", state: str, screen_x: int, screen_y: int) -> None:
+        """
+        敵の見た目を描画する（スプライトアトラスの生成にも使う）。
+        target: 描画先（DrawTarget）
+        screen_x, screen_y: 敵の左上の描画座標
         """
         pass
 
+    def draw_hp_bar(self, screen_x: int, screen_y: int) -> None:
+        """
+        ダメージを受けてから一定時間、敵の足元にHPバーを描画する。
+        """
+        if self.hp_bar_timer > 0 and self.max_hp > 0:
+            import pyxel
+
+            bar_w = TILE_SIZE
+            bar_h = 3
+            bar_x = screen_x
+            bar_y = screen_y + TILE_SIZE
+            hp_ratio = max(0, self.hp) / self.max_hp
+            filled_w = int(bar_w * hp_ratio)
+            pyxel.rect(bar_x, bar_y, bar_w, bar_h, 0)
+            pyxel.rect(bar_x, bar_y, filled_w, bar_h, 11)
+
     def damage(self, amount: int) -> None:
         """
         ダメージを受ける。HPが0以下なら死亡。
@@ -99,8 +258,59 @@ class Enemy(ABC):
         Returns:
             bool: ゴールに到達したらTrue
         """
+        if self.flow_field is not None:
+            return self.waypoint is None
         return self.path_index >= len(self.path)
 
+    def predict_positions(self) -> Iterator[Tuple[float, float]]:
+        """
+        現在の速度のまま進んだときの位置を、1ティック後から順に返す（弾の着弾ティックの計算用）。
+        移動は update と同じ計算（_move_towards）で1ティックずつ進め、ゴールに着いた後はその位置に留まる。
+        速度やフローフィールドが変わると予測も変わるため、prediction_key が変わったら求め直すこと。
+        """
+        probe = _MotionProbe(self.x, self.y, self.get_speed())
+        if self.flow_field is not None:
+            return self._probe_flow_field(probe, self.flow_field, self.waypoint)
+        return self._probe_path(probe, self.path, self.path_index)
+
+    def prediction_key(self) -> Tuple[float, int]:
+        """
+        predict_positions の結果を左右する状態（現在の速度と、フローフィールドの更新回数）を返す。
+        """
+        revision = self.flow_field.revision if self.flow_field is not None else 0
+        return (self.get_speed(), revision)
+
+    @staticmethod
+    def _probe_path(
+        probe: "_MotionProbe", path: Sequence[Tuple[int, int]], index: int
+    ) -> Iterator[Tuple[float, float]]:
+        """
+        経路の点indexから先を1ティックずつ進めた位置を返し続ける。
+        """
+        move = Enemy._move_towards
+        while index < len(path):
+            target_x, target_y = path[index]
+            if move(probe, target_x, target_y):  # type: ignore[arg-type]
+                index += 1
+            yield (probe.x, probe.y)
+        while True:
+            yield (probe.x, probe.y)
+
+    @staticmethod
+    def _probe_flow_field(
+        probe: "_MotionProbe", flow_field: "FlowField", waypoint: Optional[Tuple[int, int]]
+    ) -> Iterator[Tuple[float, float]]:
+        """
+        フローフィールドに沿って1ティックずつ進めた位置を返し続ける（_follow_flow_field と同じ規則）。
+        """
+        move = Enemy._move_towards
+        while waypoint is not None:
+            if move(probe, *waypoint):  # type: ignore[arg-type]
+                waypoint = flow_field.get_next(*waypoint)
+            yield (probe.x, probe.y)
+        while True:
+            yield (probe.x, probe.y)
+
     def add_buff(self, buff: BuffBase) -> None:
         """
         バフを適用する。
@@ -109,6 +319,14 @@ class Enemy(ABC):
         """
         self.buff_manager.add_buff(buff)
 
+    def apply_buff(self, definition: BuffDefinition) -> None:
+        """
+        共有のバフ定義を適用する（バフオブジェクトを生成しない）。
+        Args:
+            definition: BuffDefinition（フライウェイト）
+        """
+        self.buff_manager.apply(definition)
+
     def get_speed(self) -> float:
         """
         現在の移動速度を取得。
@@ -119,204 +337,107 @@ class Enemy(ABC):
         return self.base_speed * self.buff_manager.get_speed_multiplier()
 
 
-class BasicEnemy(Enemy):
+class _MotionProbe:
     """
-    標準的な敵ユニット。
+    移動の予測で Enemy._move_towards に渡す、座標と速度だけを持つ仮の敵。
     """
 
-    DEFAULT_HP = 16
-    DEFAULT_SPEED = 0.04
-    DEFAULT_REWARD = 5
-    COLOR = 8  # 赤
+    __slots__ = ("x", "y", "speed")
 
-    def __init__(
-        self,
-        x: float,
-        y: float,
-        path: list[tuple[int, int]],
-        on_defeat: Optional[Callable[["Enemy"], None]] = None,
-        coefficient: float = 1.0,
-    ) -> None:
-        super().__init__(
-            x,
-            y,
-            self.DEFAULT_SPEED,
-            self.DEFAULT_HP,
-            path,
-            reward=self.DEFAULT_REWARD,
-            on_defeat=on_defeat,
-            coefficient=coefficient,
-        )
+    def __init__(self, x: float, y: float, speed: float) -> None:
+        self.x = x
+        self.y = y
+        self.speed = speed
 
-    def draw(self, camera_x: int, camera_y: int) -> None:
-        import pyxel
-        from ..constants import TILE_SIZE
+    def get_speed(self) -> float:
+        return self.speed
 
-        screen_x = int((self.x - camera_x) * TILE_SIZE)
-        screen_y = int((self.y - camera_y) * TILE_SIZE)
-        if self.is_alive:
-            # 赤い丸＋白縁＋中央に点
-            cx = screen_x + TILE_SIZE // 2
-            cy = screen_y + TILE_SIZE // 2
-            pyxel.circ(cx, cy, TILE_SIZE // 2, 7)  # 白縁
-            pyxel.circ(cx, cy, TILE_SIZE // 2 - 2, self.COLOR)  # 本体
-            pyxel.pset(cx, cy, 0)  # 黒点
-            if self.hp_bar_timer > 0 and self.max_hp > 0:
-                bar_w = TILE_SIZE
-                bar_h = 3
-                bar_x = screen_x
-                bar_y = screen_y + TILE_SIZE
-                hp_ratio = max(0, self.hp) / self.max_hp
-                filled_w = int(bar_w * hp_ratio)
-                pyxel.rect(bar_x, bar_y, bar_w, bar_h, 0)
-                pyxel.rect(bar_x, bar_y, filled_w, bar_h, 11)
-
-
-class FastEnemy(Enemy):
+
+class GroundEnemy(Enemy):
     """
-    高速移動型の敵ユニット。
+    経路に沿って地上を進む敵ユニット。
+    種類ごとの違いは能力値と見た目（EnemyArchetype の shape・color）だけで、クラスは共通。
     """
 
-    DEFAULT_HP = 10
-    DEFAULT_SPEED = 0.09
-    DEFAULT_REWARD = 4
-    COLOR = 10  # 緑
+    __slots__ = ()
 
-    def __init__(
-        self,
-        x: float,
-        y: float,
-        path: list[tuple[int, int]],
-        on_defeat: Optional[Callable[["Enemy"], None]] = None,
-        coefficient: float = 1.0,
-    ) -> None:
-        super().__init__(
-            x,
-            y,
-            self.DEFAULT_SPEED,
-            self.DEFAULT_HP,
-            path,
-            reward=self.DEFAULT_REWARD,
-            on_defeat=on_defeat,
-            coefficient=coefficient,
-        )
+    @staticmethod
+    def draw_body(target: DrawTarget, archetype: "EnemyArchetype", state: str, screen_x: int, screen_y: int) -> None:
+        shape = archetype.shape
+        color = archetype.color
+        cx = screen_x + TILE_SIZE // 2
+        cy = screen_y + TILE_SIZE // 2
+        if shape == "tri":
+            # 三角形＋白縁
+            size = TILE_SIZE // 2
+            target.tri(cx, cy - size, cx - size, cy + size, cx + size, cy + size, 7)  # 白縁
+            target.tri(cx, cy - size + 2, cx - size + 2, cy + size - 2, cx + size - 2, cy + size - 2, color)
+        elif shape == "rect":
+            # 大きな四角＋黒縁＋中央に小さい四角
+            target.rect(screen_x - 2, screen_y - 2, TILE_SIZE + 4, TILE_SIZE + 4, 0)  # 黒縁
+            target.rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE, color)
+            target.rect(screen_x + TILE_SIZE // 4, screen_y + TILE_SIZE // 4, TILE_SIZE // 2, TILE_SIZE // 2, 7)
+        else:
+            # 丸＋白縁＋中央に点
+            target.circ(cx, cy, TILE_SIZE // 2, 7)  # 白縁
+            target.circ(cx, cy, TILE_SIZE // 2 - 2, color)  # 本体
+            target.pset(cx, cy, 0)  # 黒点
 
-    def draw(self, camera_x: int, camera_y: int) -> None:
-        import pyxel
-        from ..constants import TILE_SIZE
 
-        screen_x = int((self.x - camera_x) * TILE_SIZE)
-        screen_y = int((self.y - camera_y) * TILE_SIZE)
-        if self.is_alive:
-            # 緑の三角形＋白縁
-            cx = screen_x + TILE_SIZE // 2
-            cy = screen_y + TILE_SIZE // 2
-            size = TILE_SIZE // 2
-            # 白縁
-            pyxel.tri(cx, cy - size, cx - size, cy + size, cx + size, cy + size, 7)
-            # 本体
-            pyxel.tri(cx, cy - size + 2, cx - size + 2, cy + size - 2, cx + size - 2, cy + size - 2, self.COLOR)
-            if self.hp_bar_timer > 0 and self.max_hp > 0:
-                bar_w = TILE_SIZE
-                bar_h = 3
-                bar_x = screen_x
-                bar_y = screen_y + TILE_SIZE
-                hp_ratio = max(0, self.hp) / self.max_hp
-                filled_w = int(bar_w * hp_ratio)
-                pyxel.rect(bar_x, bar_y, bar_w, bar_h, 0)
-                pyxel.rect(bar_x, bar_y, filled_w, bar_h, 11)
-
-
-class TankEnemy(Enemy):
+class FlyingEnemy(Enemy):
     """
-    高耐久・低速型の敵ユニット。
+    飛行→着地→道を進む特殊エネミー。
+    マップ外で生成され、指定座標まで直線飛行し、着地後は道を進む。
     """
 
-    DEFAULT_HP = 29
-    DEFAULT_SPEED = 0.025
-    DEFAULT_REWARD = 5
-    COLOR = 12  # 紫
+    __slots__ = ("landing_x", "landing_y")
+
+    SPRITE_STATES = ("flying", "landed")
 
     def __init__(
         self,
+        archetype: "EnemyArchetype",
         x: float,
         y: float,
-        path: list[tuple[int, int]],
+        path: Sequence[Tuple[int, int]],
         on_defeat: Optional[Callable[["Enemy"], None]] = None,
         coefficient: float = 1.0,
+        land_pos: Optional[Tuple[int, int]] = None,
     ) -> None:
-        super().__init__(
-            x,
-            y,
-            self.DEFAULT_SPEED,
-            self.DEFAULT_HP,
-            path,
-            reward=self.DEFAULT_REWARD,
-            on_defeat=on_defeat,
-            coefficient=coefficient,
-        )
-
-    def draw(self, camera_x: int, camera_y: int) -> None:
-        import pyxel
-        from ..constants import TILE_SIZE
-
-        screen_x = int((self.x - camera_x) * TILE_SIZE)
-        screen_y = int((self.y - camera_y) * TILE_SIZE)
-        if self.is_alive:
-            # Tank: 紫の大きな四角＋黒縁＋中央に小さい四角
-            pyxel.rect(screen_x - 2, screen_y - 2, TILE_SIZE + 4, TILE_SIZE + 4, 0)  # 黒縁
-            pyxel.rect(screen_x, screen_y, TILE_SIZE, TILE_SIZE, self.COLOR)
-            pyxel.rect(screen_x + TILE_SIZE // 4, screen_y + TILE_SIZE // 4, TILE_SIZE // 2, TILE_SIZE // 2, 7)  # 白
-            if self.hp_bar_timer > 0 and self.max_hp > 0:
-                bar_w = TILE_SIZE
-                bar_h = 3
-                bar_x = screen_x
-                bar_y = screen_y + TILE_SIZE
-                hp_ratio = max(0, self.hp) / self.max_hp
-                filled_w = int(bar_w * hp_ratio)
-                pyxel.rect(bar_x, bar_y, bar_w, bar_h, 0)
-                pyxel.rect(bar_x, bar_y, filled_w, bar_h, 11)
-
-
-class FlyingEnemy(Enemy):
-    """
-    飛行→着地→道を進む特殊エネミー。
-    マップ外で生成され、指定座標まで直線飛行し、着地後は道を進む。
-    """
-
-    DEFAULT_HP = 22
-    DEFAULT_SPEED = 0.05
-    DEFAULT_REWARD = 6
-    COLOR = 6  # 青
+        """
+        Args:
+            x, y: マップ外の初期座標
+            path: 着地後に進む道（StageManagerが共有する経路タプル）
+            land_pos: 着地する道の座標 (タイル座標)。省略時は経路の始点
+        """
+        super().__init__(archetype, x, y, path, on_defeat, coefficient)
+        self._reset_flight(land_pos if land_pos is not None else self.path[0])
 
-    def __init__(
+    def reset(
         self,
-        start_x: float,
-        start_y: float,
-        land_pos: Tuple[int, int],
-        path: List[Tuple[int, int]],
+        archetype: "EnemyArchetype",
+        x: float,
+        y: float,
+        path: Sequence[Tuple[int, int]],
         on_defeat: Optional[Callable[["Enemy"], None]] = None,
         coefficient: float = 1.0,
+        land_pos: Optional[Tuple[int, int]] = None,
     ) -> None:
         """
-        Args:
-            start_x, start_y: マップ外の初期座標
-            land_pos: 着地する道の座標 (タイル座標)
-            path: 着地後に進む道のリスト
-        """
-        super().__init__(
-            start_x,
-            start_y,
-            self.DEFAULT_SPEED,
-            self.DEFAULT_HP,
-            path,
-            reward=self.DEFAULT_REWARD,
-            on_defeat=on_defeat,
-            coefficient=coefficient,
-        )
+        生成直後と同じ状態に戻す（プールから再利用する際に呼ばれる）。
+        """
+        super().reset(archetype, x, y, path, on_defeat, coefficient)
+        self._reset_flight(land_pos if land_pos is not None else self.path[0])
+
+    def _reset_flight(self, land_pos: Tuple[int, int]) -> None:
+        """
+        飛行状態を初期化する。
+        """
         self.landing_x = land_pos[0]
         self.landing_y = land_pos[1]
         self.is_flying = True
+        # 飛行中はバフの効果時間を進めない（着地した時点から数え始める）
+        self.buff_manager.pause()
 
     def update(self) -> bool:
         """
@@ -334,62 +455,61 @@ class FlyingEnemy(Enemy):
 
         if self.is_flying:
             # 直線で着地点へ
-            dx = self.landing_x - self.x
-            dy = self.landing_y - self.y
-            dist = (dx**2 + dy**2) ** 0.5
-            if dist < self.get_speed():
-                self.x = self.landing_x
-                self.y = self.landing_y
+            if self._move_towards(self.landing_x, self.landing_y):
                 self.is_flying = False
                 self.path_index = 0
-
-            else:
-                if dist != 0:
-                    self.x += self.get_speed() * dx / dist
-                    self.y += self.get_speed() * dy / dist
+                self.buff_manager.resume()
             return False
         else:
             # 着地後は通常の道エネミーと同じ
             return super().update()
 
-    def draw(self, camera_x: int, camera_y: int) -> None:
+    def predict_positions(self) -> Iterator[Tuple[float, float]]:
         """
-        敵ユニットを画面上に描画。
-        飛行中は羽付き、着地後は青丸。
+        飛行中は着地点までの直線に続けて、着地後の移動も update と同じ計算で予測する。
         """
-        import pyxel
-        from ..constants import TILE_SIZE
+        if not self.is_flying:
+            return super().predict_positions()
+        return self._probe_flight(_MotionProbe(self.x, self.y, self.get_speed()))
 
-        screen_x = int((self.x - camera_x) * TILE_SIZE)
-        screen_y = int((self.y - camera_y) * TILE_SIZE)
-        if self.is_alive:
-            cx = screen_x + TILE_SIZE // 2
-            cy = screen_y + TILE_SIZE // 2
-            if self.is_flying:
-                # --- 影（ディザAPI）描画 ---
-                shadow_radius = 5
-                shadow_cx = cx
-                shadow_cy = cy + 10  # 本体より下
-                pyxel.dither(0.3)
-                pyxel.circ(shadow_cx, shadow_cy, shadow_radius, 0)
-                pyxel.dither(1.0)  # ディザ解除（完全不透明）
-                # --- 本体・羽 ---
-                pyxel.circ(cx, cy, TILE_SIZE // 2, 7)
-                pyxel.circ(cx, cy, TILE_SIZE // 2 - 2, self.COLOR)
-                # 羽（左右に白い線）
-                pyxel.line(cx - TILE_SIZE // 2, cy, cx - TILE_SIZE, cy - TILE_SIZE // 2, 7)
-                pyxel.line(cx + TILE_SIZE // 2, cy, cx + TILE_SIZE, cy - TILE_SIZE // 2, 7)
-            else:
-                # 着地後は青い丸＋中央に点
-                pyxel.circ(cx, cy, TILE_SIZE // 2, 7)
-                pyxel.circ(cx, cy, TILE_SIZE // 2 - 2, self.COLOR)
-                pyxel.pset(cx, cy, 0)
-            if self.hp_bar_timer > 0 and self.max_hp > 0:
-                bar_w = TILE_SIZE
-                bar_h = 3
-                bar_x = screen_x
-                bar_y = screen_y + TILE_SIZE
-                hp_ratio = max(0, self.hp) / self.max_hp
-                filled_w = int(bar_w * hp_ratio)
-                pyxel.rect(bar_x, bar_y, bar_w, bar_h, 0)
-                pyxel.rect(bar_x, bar_y, filled_w, bar_h, 11)
+    def _probe_flight(self, probe: "_MotionProbe") -> Iterator[Tuple[float, float]]:
+        """
+        着地点まで1ティックずつ進めた位置を返し、着地後は経路（またはフローフィールド）に沿った位置を返し続ける。
+        """
+        while not Enemy._move_towards(probe, self.landing_x, self.landing_y):  # type: ignore[arg-type]
+            yield (probe.x, probe.y)
+        yield (probe.x, probe.y)
+        if self.flow_field is not None:
+            yield from self._probe_flow_field(probe, self.flow_field, self.waypoint)
+        else:
+            yield from self._probe_path(probe, self.path, 0)
+
+    def sprite_state(self) -> str:
+        return "flying" if self.is_flying else "landed"
+
+    @staticmethod
+    def draw_body(target: DrawTarget, archetype: "EnemyArchetype", state: str, screen_x: int, screen_y: int) -> None:
+        """
+        飛行中は羽付き、着地後は丸。
+        """
+        cx = screen_x + TILE_SIZE // 2
+        cy = screen_y + TILE_SIZE // 2
+        if state == "flying":
+            # --- 影（ディザAPI）描画 ---
+            shadow_radius = 5
+            shadow_cx = cx
+            shadow_cy = cy + 10  # 本体より下
+            target.dither(0.3)
+            target.circ(shadow_cx, shadow_cy, shadow_radius, 0)
+            target.dither(1.0)  # ディザ解除（完全不透明）
+            # --- 本体・羽 ---
+            target.circ(cx, cy, TILE_SIZE // 2, 7)
+            target.circ(cx, cy, TILE_SIZE // 2 - 2, archetype.color)
+            # 羽（左右に白い線）
+            target.line(cx - TILE_SIZE // 2, cy, cx - TILE_SIZE, cy - TILE_SIZE // 2, 7)
+            target.line(cx + TILE_SIZE // 2, cy, cx + TILE_SIZE, cy - TILE_SIZE // 2, 7)
+        else:
+            # 着地後は青い丸＋中央に点
+            target.circ(cx, cy, TILE_SIZE // 2, 7)
+            target.circ(cx, cy, TILE_SIZE // 2 - 2, archetype.color)
+            target.pset(cx, cy, 0)
@@ -0,0 +1,102 @@
+"""
+EnemyArchetype - 敵の種類ごとの能力値・見た目を定義するレジストリ
+"""
+
+from typing import Dict, Type
+
+from .enemy import Enemy, FlyingEnemy, GroundEnemy
+
+
+class EnemyStats:
+    """
+    ステージ難易度調整用係数を適用済みの能力値。
+    同じ (種類, 係数) の敵は1つのインスタンスを共有するため、生成後に書き換えないこと。
+    """
+
+    __slots__ = ("max_hp", "speed", "reward")
+
+    def __init__(self, max_hp: int, speed: float, reward: int) -> None:
+        self.max_hp = max_hp
+        self.speed = speed
+        self.reward = reward
+
+
+class EnemyArchetype:
+    """
+    敵の種類の定義（不変）。
+    移動の仕方は enemy_class、能力値の基準値と見た目はこの定義が持つ。
+    係数を適用した能力値は係数ごとに一度だけ計算してキャッシュする。
+    """
+
+    __slots__ = ("type_id", "enemy_class", "hp", "speed", "reward", "color", "shape", "_stats")
+
+    def __init__(
+        self, type_id: str, enemy_class: Type[Enemy], hp: int, speed: float, reward: int, color: int, shape: str
+    ) -> None:
+        """
+        Args:
+            type_id (str): ステージマスターの enemy_type で指定する識別子
+            enemy_class: 生成する敵クラス（地上を進むなら GroundEnemy）
+            hp (int): 係数1.0のときの最大HP
+            speed (float): 移動速度（タイル/ティック）
+            reward (int): 係数1.0のときの撃破報酬
+            color (int): 本体の色
+            shape (str): 本体の形（"circ" / "tri" / "rect"）
+        """
+        self.type_id = type_id
+        self.enemy_class = enemy_class
+        self.hp = hp
+        self.speed = speed
+        self.reward = reward
+        self.color = color
+        self.shape = shape
+        self._stats: Dict[float, EnemyStats] = {}  # 係数 → 能力値
+
+    def get_stats(self, coefficient: float) -> EnemyStats:
+        """
+        係数を適用した能力値を返す（HP・報酬は係数を掛けて切り捨て）。
+        """
+        stats = self._stats.get(coefficient)
+        if stats is None:
+            stats = EnemyStats(int(self.hp * coefficient), self.speed, int(self.reward * coefficient))
+            self._stats[coefficient] = stats
+        return stats
+
+
+# 登録済みの敵の種類（type_id → 定義）
+ENEMY_ARCHETYPES: Dict[str, EnemyArchetype] = {}
+
+
+def register_enemy_archetype(
+    type_id: str, enemy_class: Type[Enemy], hp: int, speed: float, reward: int, color: int, shape: str = "circ"
+) -> EnemyArchetype:
+    """
+    敵の種類を登録して返す。同じ type_id は登録できない。
+    """
+    if type_id in ENEMY_ARCHETYPES:
+        raise ValueError(f"Enemy type already registered: {type_id}")
+    archetype = EnemyArchetype(type_id, enemy_class, hp, speed, reward, color, shape)
+    ENEMY_ARCHETYPES[type_id] = archetype
+    return archetype
+
+
+def get_enemy_archetype(type_id: str) -> EnemyArchetype:
+    """
+    type_id に対応する敵の種類を返す。
+    """
+    archetype = ENEMY_ARCHETYPES.get(type_id)
+    if archetype is None:
+        raise ValueError(f"Unknown enemy type: {type_id}")
+    return archetype
+
+
+# 標準的な敵（赤い丸）
+BASIC_ENEMY = register_enemy_archetype("BasicEnemy", GroundEnemy, hp=16, speed=0.04, reward=5, color=8, shape="circ")
+# 高速移動型（緑の三角形）
+FAST_ENEMY = register_enemy_archetype("FastEnemy", GroundEnemy, hp=10, speed=0.09, reward=4, color=10, shape="tri")
+# 高耐久・低速型（紫の四角）
+TANK_ENEMY = register_enemy_archetype("TankEnemy", GroundEnemy, hp=29, speed=0.025, reward=5, color=12, shape="rect")
+# 飛行→着地→道を進む（青い丸、飛行中は羽付き）
+FLYING_ENEMY = register_enemy_archetype(
+    "FlyingEnemy", FlyingEnemy, hp=22, speed=0.05, reward=6, color=6, shape="circ"
+)
@@ -2,21 +2,75 @@
 EnemyManager - 敵ユニットの管理クラス
 """
 
-from typing import List
+from typing import Any, Container, Dict, List, Optional, Type, TypeVar, TYPE_CHECKING
+from .buff_timer_wheel import BuffTimerWheel
 from .enemy import Enemy
+from .spatial_grid import SpatialGrid
+from ..object_pool import ObjectPool
+from ..entity_list import EntityHandle, EntityList
+from ..camera import CullStats
+from ..constants import CULL_MARGIN, VIEW_TILE_HEIGHT, VIEW_TILE_WIDTH
+
+EnemyT = TypeVar("EnemyT", bound=Enemy)
+
+if TYPE_CHECKING:
+    from .array_enemy_store import ArrayEnemyStore
+
+
+def _spawn_order(enemy: Enemy) -> int:
+    return enemy.spawn_order
 
 
 class EnemyManager:
     """
     複数の敵ユニットを一括管理するクラス。
     生成・更新・描画・削除を担当。
+    生存中の敵は入れ替え削除で詰めるEntityListで保持するため、並び順は出現順とは限らない（出現順は spawn_order）。
+    敵の位置は空間インデックス（SpatialGrid）にも登録し、範囲検索に利用する。
+    バフの効果切れは全ての敵で共有するタイマーホイールで管理する。
+    除去した敵は種類ごとのObjectPoolへ返却し、次の出現で再利用する（配列ストアではビューを同様に再利用する）。
+    ゴールに到達した敵は、向かっている弾が着弾するまで標的として残すため、
+    リストからは切り離すだけにして release_departed でまとめて返却する。
+    配列ストアを有効にすると、敵の状態をNumPy配列で保持し移動をまとめて計算する。
     """
 
-    def __init__(self) -> None:
+    def __init__(self, use_array_store: bool = False) -> None:
         """
         敵ユニットリストの初期化。
+        Args:
+            use_array_store (bool): 敵の状態をArrayEnemyStore（NumPy必須）で保持する
         """
-        self.enemies: List[Enemy] = []
+        self.enemies: EntityList[Enemy] = EntityList()
+        self.grid = SpatialGrid()
+        self._next_spawn_order = 0
+        self.buff_timer_wheel = BuffTimerWheel()
+        self.cull_stats = CullStats()  # 直近の draw で描画した数・省いた数
+        self.pools: Dict[Type[Enemy], ObjectPool[Any]] = {}  # 敵の種類 → プール
+        self.departed: List[Enemy] = []  # ゴールに到達し、ハンドルを有効なまま残している敵
+        self.store: "ArrayEnemyStore | None" = None
+        if use_array_store:
+            from .array_enemy_store import ArrayEnemyStore
+
+            self.store = ArrayEnemyStore()
+
+    def acquire_enemy(self, enemy_class: Type[EnemyT], *args: Any, **kwargs: Any) -> EnemyT:
+        """
+        プールから敵を取得する（空きがなければ生成する）。引数は敵クラスのコンストラクタと同じ。
+        取得した敵は spawn_enemy で追加すること。
+        """
+        pool = self.pools.get(enemy_class)
+        if pool is None:
+            pool = ObjectPool(enemy_class, capacity=1024)
+            self.pools[enemy_class] = pool
+        return pool.acquire(*args, **kwargs)
+
+    def _release_enemy(self, enemy: Enemy) -> None:
+        """
+        除去した敵をプールへ返却する。acquire_enemy 以外で生成した種類の敵は返却しない。
+        """
+        pool = self.pools.get(type(enemy))
+        if pool is not None:
+            pool.release(enemy)
 
     def spawn_enemy(self, enemy: Enemy) -> None:
         """
@@ -24,25 +78,118 @@ class EnemyManager:
         Args:
             enemy (Enemy): 追加する敵ユニット
         """
-        self.enemies.append(enemy)
+        if self.store is not None:
+            # 配列ストアは状態をコピーしたビューを使うため、元の敵はすぐにプールへ戻せる
+            template = enemy
+            enemy = self.store.adopt(template)
+            self._release_enemy(template)
+        else:
+            enemy.buff_manager.timer_wheel = self.buff_timer_wheel
+        enemy.spawn_order = self._next_spawn_order
+        self._next_spawn_order += 1
+        self.enemies.add(enemy)
+        self.grid.insert(enemy)
 
     def update(self) -> List[Enemy]:
         """
         全ての敵ユニットを更新。死亡した敵はリストから除去。
         """
+        # 移動より先に、このティックで効果が切れるバフを取り除く
+        self.buff_timer_wheel.advance()
+        if self.store is not None:
+            return self._update_array_store(self.store)
         goal_enemies = []
+        grid = self.grid
+        removed = []
         for enemy in self.enemies:
             is_goal_reached = enemy.update()
             if is_goal_reached:
                 goal_enemies.append(enemy)
-        # 死亡・ゴール到達した敵を除去
-        self.enemies = [e for e in self.enemies if e.is_alive and not e.is_goal()]
+            # 残った敵は移動先のバケットへ付け替え、死亡・ゴール到達した敵は後でまとめて除去する
+            if enemy.is_alive and not enemy.is_goal():
+                grid.move(enemy)
+            else:
+                removed.append(enemy)
+        for enemy in removed:
+            grid.remove(enemy)
+            if enemy.is_alive:
+                # ゴール到達: 向かっている弾のために、ハンドルは release_departed まで有効にしておく
+                self.enemies.detach(enemy)
+                self.departed.append(enemy)
+            else:
+                self.enemies.remove(enemy)
+                self._release_enemy(enemy)
+        return goal_enemies
+
+    def _update_array_store(self, store: "ArrayEnemyStore") -> List[Enemy]:
+        """
+        配列ストアで全ての敵をまとめて更新する。
+        グリッドの付け替えはタイルが変わった敵だけ、リストからの除去は除去した敵だけ行う。
+        """
+        goal_slots, removed_slots, moved_slots = store.step()
+        views = store.views
+        goal_enemies: List[Enemy] = [views[slot] for slot in goal_slots.tolist()]  # type: ignore[misc]
+        grid = self.grid
+        for slot in moved_slots.tolist():
+            grid.move(views[slot])  # type: ignore[arg-type]
+        for slot in removed_slots.tolist():
+            enemy = views[slot]
+            grid.remove(enemy)  # type: ignore[arg-type]
+            if enemy.is_alive:  # type: ignore[union-attr]
+                # ゴール到達: ビューは除去時点の値を保持したまま、弾の標的として残す
+                store.release(slot)
+                self.enemies.detach(enemy)  # type: ignore[arg-type]
+                self.departed.append(enemy)  # type: ignore[arg-type]
+            else:
+                self.enemies.remove(enemy)  # type: ignore[arg-type]
+                store.recycle(enemy)  # type: ignore[arg-type]
         return goal_enemies
 
-    def draw(self, camera_x: int, camera_y: int) -> None:
+    def release_departed(self, targeted: Container[EntityHandle]) -> None:
         """
-        全ての敵ユニットを描画。
+        ゴールに到達して切り離した敵のうち、どの弾の標的でもなくなったものを除去してプールへ返却する。
+        Args:
+            targeted: 飛んでいる弾の標的のハンドル
+        """
+        if not self.departed:
+            return
+        remaining = []
+        for enemy in self.departed:
+            if enemy.entity_handle in targeted:
+                remaining.append(enemy)
+                continue
+            self.enemies.release(enemy)
+            if self.store is not None:
+                self.store.recycle(enemy)
+            else:
+                self._release_enemy(enemy)
+        self.departed = remaining
+
+    def draw(
+        self, camera_x: int, camera_y: int, view_width: Optional[int] = None, view_height: Optional[int] = None
+    ) -> None:
+        """
+        表示範囲内の敵ユニットを描画。
         camera_x, camera_y: カメラの左上タイル座標
+        view_width, view_height: 画面表示タイル数
+        敵が表示範囲のバケット数より多いときは空間インデックスで範囲内の敵だけを取り出し、
+        少ないときは全件を座標で判定する。重なった敵は出現順に描画する（後に出現した敵が手前）。
+        描画した数・省いた数は cull_stats に残す。
         """
-        for enemy in self.enemies:
+        view_width = view_width if view_width is not None else VIEW_TILE_WIDTH
+        view_height = view_height if view_height is not None else VIEW_TILE_HEIGHT
+        min_x = camera_x - CULL_MARGIN
+        min_y = camera_y - CULL_MARGIN
+        max_x = camera_x + view_width + CULL_MARGIN
+        max_y = camera_y + view_height + CULL_MARGIN
+        total = len(self.enemies)
+        if total > (max_x - min_x + 1) * (max_y - min_y + 1):
+            visible = self.grid.query_rect(min_x, min_y, max_x, max_y)
+        else:
+            visible = [e for e in self.enemies if min_x <= e.x <= max_x and min_y <= e.y <= max_y]
+        # バケット順・入れ替え削除後の並びは毎フレーム変わりうるため、重なりの前後がちらつかないよう出現順に描く
+        visible.sort(key=_spawn_order)
+        for enemy in visible:
             enemy.draw(camera_x, camera_y)
+        self.cull_stats.drawn = len(visible)
+        self.cull_stats.culled = total - len(visible)
@@ -0,0 +1,123 @@
+"""
+SpatialGrid - 敵ユニットをタイル単位のバケットで管理する一様グリッド空間インデックス
+"""
+
+import math
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .enemy import Enemy
+
+Cell = Tuple[int, int]
+
+
+class SpatialGrid:
+    """
+    敵ユニットの位置を一様グリッド（既定は1タイル=1バケット）に振り分けて保持するクラス。
+    範囲検索では、円の外接矩形に重なるバケットのみを走査するため、
+    敵の総数ではなく射程周辺の敵数に比例したコストで検索できる。
+    """
+
+    def __init__(self, cell_size: float = 1.0) -> None:
+        """
+        Args:
+            cell_size (float): 1バケットの一辺（タイル単位）
+        """
+        self.cell_size = cell_size
+        self.buckets: Dict[Cell, List["Enemy"]] = {}
+        self._cells: Dict["Enemy", Cell] = {}  # 敵ごとの現在のバケット
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    def __contains__(self, enemy: "Enemy") -> bool:
+        return enemy in self._cells
+
+    def cell_of(self, x: float, y: float) -> Cell:
+        """
+        座標が属するバケットを返す。マップ外の座標もそのまま扱える。
+        """
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def insert(self, enemy: "Enemy") -> None:
+        """
+        敵を現在位置のバケットに登録する。
+        """
+        cell = self.cell_of(enemy.x, enemy.y)
+        self._cells[enemy] = cell
+        self.buckets.setdefault(cell, []).append(enemy)
+
+    def remove(self, enemy: "Enemy") -> None:
+        """
+        敵をグリッドから除去する。未登録なら何もしない。
+        """
+        cell = self._cells.pop(enemy, None)
+        if cell is None:
+            return
+        bucket = self.buckets[cell]
+        bucket.remove(enemy)
+        if not bucket:
+            del self.buckets[cell]
+
+    def move(self, enemy: "Enemy") -> None:
+        """
+        敵の移動後に呼び出し、バケットが変わっていれば付け替える。
+        """
+        old_cell = self._cells.get(enemy)
+        new_cell = self.cell_of(enemy.x, enemy.y)
+        if old_cell == new_cell:
+            return
+        if old_cell is not None:
+            bucket = self.buckets[old_cell]
+            bucket.remove(enemy)
+            if not bucket:
+                del self.buckets[old_cell]
+        self._cells[enemy] = new_cell
+        self.buckets.setdefault(new_cell, []).append(enemy)
+
+    def clear(self) -> None:
+        """
+        全ての登録を破棄する。
+        """
+        self.buckets.clear()
+        self._cells.clear()
+
+    def query_rect(self, min_x: float, min_y: float, max_x: float, max_y: float) -> List["Enemy"]:
+        """
+        矩形 [min_x, max_x] x [min_y, max_y]（境界含む）の中にいる敵を返す。順序は不定。
+        """
+        min_cx, min_cy = self.cell_of(min_x, min_y)
+        max_cx, max_cy = self.cell_of(max_x, max_y)
+        result: List["Enemy"] = []
+        buckets = self.buckets
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                bucket = buckets.get((cx, cy))
+                if not bucket:
+                    continue
+                for enemy in bucket:
+                    if min_x <= enemy.x <= max_x and min_y <= enemy.y <= max_y:
+                        result.append(enemy)
+        return result
+
+    def query_range(self, x: float, y: float, radius: float) -> List["Enemy"]:
+        """
+        中心(x, y)から半径radius以内（境界含む）にいる敵を返す。
+        距離比較は平方距離で行い、sqrtを使わない。順序は不定。
+        """
+        min_cx, min_cy = self.cell_of(x - radius, y - radius)
+        max_cx, max_cy = self.cell_of(x + radius, y + radius)
+        radius_sq = radius * radius
+        result: List["Enemy"] = []
+        buckets = self.buckets
+        for cy in range(min_cy, max_cy + 1):
+            for cx in range(min_cx, max_cx + 1):
+                bucket = buckets.get((cx, cy))
+                if not bucket:
+                    continue
+                for enemy in bucket:
+                    dx = enemy.x - x
+                    dy = enemy.y - y
+                    if dx * dx + dy * dy <= radius_sq:
+                        result.append(enemy)
+        return result
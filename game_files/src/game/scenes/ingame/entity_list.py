@@ -0,0 +1,126 @@
+"""
+EntityList - 入れ替え削除で詰めて保持するエンティティ配列と、世代番号付きハンドル
+"""
+
+from typing import Dict, Generic, Iterator, List, Optional, Protocol, Tuple, TypeVar
+
+# (スロット番号, 世代番号)。削除されたエンティティのハンドルは世代番号が一致しなくなる
+EntityHandle = Tuple[int, int]
+
+# どのEntityListにも属していないことを表すハンドル
+NO_HANDLE: EntityHandle = (-1, -1)
+
+
+class Entity(Protocol):
+    """
+    EntityListに格納できるオブジェクト。追加時にハンドルが書き込まれる。
+    """
+
+    entity_handle: EntityHandle
+
+
+T = TypeVar("T", bound=Entity)
+
+
+class EntityList(Generic[T]):
+    """
+    生存中のエンティティを隙間のない配列（items）で保持するコンテナ。
+
+    削除は末尾の要素を削除位置へ移して縮める（swap-remove）ため、1件あたりO(1)で済み、
+    毎ティックの後始末のコストは全体数ではなく削除数に比例する。その代わり並び順は保たれない。
+    各エンティティにはスロット番号と世代番号の組（ハンドル）を割り当て、削除時に世代番号を進める。
+    弾の標的のように他から参照し続ける場合はハンドルを保持し、get で引き直すこと
+    （削除済み、またはスロットが別のエンティティに再利用されていればNoneになる）。
+    走査対象からは外すがハンドルでは引けるようにしておきたい場合は、detach で切り離してから
+    不要になった時点で release する。
+    """
+
+    def __init__(self) -> None:
+        self.items: List[T] = []  # 密な配列（走査用）
+        self._item_slots: List[int] = []  # items[i] のスロット番号
+        self._dense_index: List[int] = []  # スロット番号 → items内の位置（空きスロットは-1）
+        self._generations: List[int] = []  # スロット番号 → 世代番号
+        self._free_slots: List[int] = []
+        self._detached: Dict[int, T] = {}  # スロット番号 → 切り離したエンティティ
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self.items)
+
+    def __getitem__(self, index: int) -> T:
+        return self.items[index]
+
+    def add(self, entity: T) -> EntityHandle:
+        """
+        エンティティを追加し、ハンドルを割り当てて返す（entity.entity_handle にも書き込む）。
+        """
+        if self._free_slots:
+            slot = self._free_slots.pop()
+        else:
+            slot = len(self._generations)
+            self._generations.append(0)
+            self._dense_index.append(-1)
+        self._dense_index[slot] = len(self.items)
+        self.items.append(entity)
+        self._item_slots.append(slot)
+        handle = (slot, self._generations[slot])
+        entity.entity_handle = handle
+        return handle
+
+    def get(self, handle: EntityHandle) -> Optional[T]:
+        """
+        ハンドルが指すエンティティを返す。既に削除されていればNone。
+        """
+        slot, generation = handle
+        if not 0 <= slot < len(self._generations) or self._generations[slot] != generation:
+            return None
+        index = self._dense_index[slot]
+        if index < 0:
+            return self._detached.get(slot)
+        return self.items[index]
+
+    def remove(self, entity: T) -> None:
+        """
+        エンティティを削除する（末尾の要素を削除位置へ移して詰める）。未登録・切り離し済みなら何もしない。
+        """
+        if self.detach(entity):
+            self.release(entity)
+
+    def detach(self, entity: T) -> bool:
+        """
+        エンティティを items から外す（末尾の要素を削除位置へ移して詰める）。
+        ハンドルは release するまで有効なままで、get で引ける。
+        Returns:
+            bool: 切り離したらTrue（未登録・切り離し済みならFalse）
+        """
+        slot, generation = entity.entity_handle
+        if not 0 <= slot < len(self._generations) or self._generations[slot] != generation:
+            return False
+        index = self._dense_index[slot]
+        if index < 0:
+            return False
+        last = len(self.items) - 1
+        if index != last:
+            moved_slot = self._item_slots[last]
+            self.items[index] = self.items[last]
+            self._item_slots[index] = moved_slot
+            self._dense_index[moved_slot] = index
+        self.items.pop()
+        self._item_slots.pop()
+        self._dense_index[slot] = -1
+        self._detached[slot] = entity
+        return True
+
+    def release(self, entity: T) -> None:
+        """
+        切り離したエンティティのハンドルを無効にし、スロットを再利用できるようにする。
+        """
+        slot, generation = entity.entity_handle
+        if self._detached.get(slot) is not entity or self._generations[slot] != generation:
+            return
+        del self._detached[slot]
+        self._generations[slot] += 1
+        self._free_slots.append(slot)
+        entity.entity_handle = NO_HANDLE
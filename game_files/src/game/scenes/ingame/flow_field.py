@@ -0,0 +1,298 @@
+"""
+FlowField - ゴールからの逆方向探索で求めた「次の一歩」と「残り距離」のマップ
+"""
+
+import heapq
+from collections import deque
+from typing import Deque, FrozenSet, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .map import Map
+
+Tile = Tuple[int, int]
+
+# 探索する隣接方向（Map.get_path と同じ順序）
+NEIGHBOR_OFFSETS: Tuple[Tile, ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+# 到達不能タイルの距離
+UNREACHABLE = -1
+
+
+class FlowField:
+    """
+    ゴールタイルから道（TILE_PATH）を幅優先で逆探索し、
+    各道タイルについて「ゴールへ向かう次のタイル」と「ゴールまでの残り歩数」を保持するクラス。
+
+    敵は自分の経路リストを持たず、現在のタイルから次のタイルを引くだけで進めるため、
+    出現地点・途中出現・着地地点がいくつあっても敵1体あたりのメモリはO(1)で済む。
+    同じ歩数の分岐がある場合は、探索順で先に見つかった方向を採用する。
+
+    迷路化（道タイルへのユニット配置）にも対応し、block/unblock で道が変化したときは
+    距離場全体を作り直さず、影響を受けた領域だけを差分修復する（LPA*と同様の考え方）。
+    - 塞いだ場合: 次の一歩を辿ると塞いだタイルを通る領域（最短路木の部分木）だけ距離が伸びうるため、
+      その部分木を未確定に戻し、外周の確定済みタイルを起点に部分木内だけ再探索する。
+    - 開けた場合: 距離は縮むだけなので、開けたタイルから改善が続く範囲だけ広げる。
+      直前に塞いだタイルから順に開ける場合は、塞ぐ前に退避した部分木の値を書き戻すため、
+      同じ歩数の分岐の選び方も含めて塞ぐ前の距離場に正確に戻る。
+    """
+
+    def __init__(self, map: "Map") -> None:
+        """
+        Args:
+            map (Map): 対象マップ。マップデータは構築後に変更しないこと。
+        """
+        self.width = map.width
+        self.height = map.height
+        self.goal: Tile = map.get_goal()
+        self.distance: List[List[int]] = [[UNREACHABLE] * self.width for _ in range(self.height)]
+        self.next_step: List[List[Optional[Tile]]] = [[None] * self.width for _ in range(self.height)]
+        # 経路として通行可能なタイル（道・ゴール）。塞いだタイルは含めない
+        self._passable: List[List[bool]] = [[False] * self.width for _ in range(self.height)]
+        self.blocked: Set[Tile] = set()
+        # 直前の can_block の判定（タイル, 起点集合, 結果）。距離場が変わったら捨てる
+        self._last_check: Optional[Tuple[Tile, FrozenSet[Tile], bool]] = None
+        self.revision = 0  # 塞ぐ・開けるで距離場を変えた回数（敵の移動予測のやり直しの判定に使う）
+        # 塞いだ順の (タイル, 塞ぐ前の部分木の (x, y, 距離, 次の一歩))。開けるときに書き戻す
+        self._undo: List[Tuple[Tile, List[Tuple[int, int, int, Optional[Tile]]]]] = []
+        self._build(map)
+
+    def _build(self, map: "Map") -> None:
+        """
+        ゴールから幅優先探索を行い、距離と次の一歩を埋める。
+        """
+        from .map import TILE_PATH, TILE_GOAL
+
+        for y in range(self.height):
+            for x in range(self.width):
+                self._passable[y][x] = map.data[y][x] in (TILE_PATH, TILE_GOAL)
+        gx, gy = self.goal
+        if not (0 <= gx < self.width and 0 <= gy < self.height):
+            return
+        self.distance[gy][gx] = 0
+        queue: Deque[Tile] = deque([self.goal])
+        while queue:
+            x, y = queue.popleft()
+            next_distance = self.distance[y][x] + 1
+            for dx, dy in NEIGHBOR_OFFSETS:
+                nx, ny = x + dx, y + dy
+                if not (0 <= nx < self.width and 0 <= ny < self.height):
+                    continue
+                if self.distance[ny][nx] != UNREACHABLE or not self._passable[ny][nx]:
+                    continue
+                self.distance[ny][nx] = next_distance
+                # (nx, ny) から見てゴール側の隣接タイルが次の一歩
+                self.next_step[ny][nx] = (x, y)
+                queue.append((nx, ny))
+
+    def get_distance(self, x: int, y: int) -> int:
+        """
+        ゴールまでの残り歩数を返す。到達不能・マップ外はUNREACHABLE。
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.distance[y][x]
+        return UNREACHABLE
+
+    def get_next(self, x: int, y: int) -> Optional[Tile]:
+        """
+        ゴールへ向かう次のタイルを返す。ゴール自身・到達不能・マップ外はNone。
+        塞がれたタイル上では、隣接する最もゴールに近いタイル（脱出先）を返す。
+        """
+        if 0 <= x < self.width and 0 <= y < self.height:
+            return self.next_step[y][x]
+        return None
+
+    def is_reachable(self, x: int, y: int) -> bool:
+        """
+        指定タイルからゴールへ到達できるか。
+        """
+        return self.get_distance(x, y) != UNREACHABLE
+
+    # --- 迷路化（道の封鎖）対応 ---
+
+    def can_block(self, x: int, y: int, sources: Iterable[Tile]) -> bool:
+        """
+        道タイル(x, y)を塞いでも、全ての起点（出現・着地地点、移動中の敵の目的タイル）から
+        ゴールへ到達できるかを判定する。距離場は変更しない。
+
+        塞ぐタイルの部分木に起点が含まれなければ、どの起点の距離も変わらないため即座に可と判定できる。
+        含まれる場合のみ仮に修復して到達性を確認し、元に戻す。
+        同じタイル・同じ起点で続けて呼ばれた場合（配置判定の直後の try_block など）は前回の結果を返す。
+        """
+        if not self._is_blockable(x, y):
+            return False
+        source_set = frozenset(sources)
+        if (x, y) in source_set:
+            return False
+        last = self._last_check
+        if last is not None and last[0] == (x, y) and last[1] == source_set:
+            return last[2]
+        region = self._subtree((x, y))
+        affected = [tile for tile in region if tile in source_set]
+        if not affected:
+            self._last_check = ((x, y), source_set, True)
+            return True
+        snapshot = self._snapshot(region)
+        self._apply_block(x, y, region)
+        connected = all(self.distance[ty][tx] != UNREACHABLE for tx, ty in affected)
+        # 仮の封鎖を元に戻す（差分修復をやり直すのではなく退避した値を書き戻す）
+        self._restore(x, y, snapshot)
+        self._last_check = ((x, y), source_set, connected)
+        return connected
+
+    def try_block(self, x: int, y: int, sources: Iterable[Tile]) -> bool:
+        """
+        起点からゴールへの到達性を保てる場合のみ道タイル(x, y)を塞ぐ。
+        Returns:
+            bool: 塞いだらTrue、到達不能になるため拒否した場合はFalse
+        """
+        if not self.can_block(x, y, sources):
+            return False
+        self._last_check = None
+        region = self._subtree((x, y))
+        self._undo.append(((x, y), self._snapshot(region)))
+        self._apply_block(x, y, region)
+        self.revision += 1
+        return True
+
+    def unblock(self, x: int, y: int) -> None:
+        """
+        塞いでいたタイルを再び通行可能にする。
+        最後に塞いだタイルなら塞ぐ前の値を書き戻し、そうでなければ距離が縮む範囲だけ差分更新する
+        （この場合、距離は塞ぐ前と一致するが同じ歩数の分岐の選び方は変わりうる）。
+        """
+        if (x, y) not in self.blocked:
+            return
+        self._last_check = None
+        self.revision += 1
+        if self._undo and self._undo[-1][0] == (x, y):
+            self._restore(x, y, self._undo.pop()[1])
+            return
+        # 途中のタイルを開けると、それより後に塞いだ分の退避値は前提が崩れるため捨てる
+        self._undo.clear()
+        self.blocked.discard((x, y))
+        self._passable[y][x] = True
+        self.distance[y][x] = UNREACHABLE
+        self.next_step[y][x] = None
+        heap: List[Tuple[int, int, Tile, Tile]] = []
+        order = 0
+        for nx, ny in self._neighbors(x, y):
+            dist = self.distance[ny][nx]
+            if self._passable[ny][nx] and dist != UNREACHABLE:
+                heapq.heappush(heap, (dist + 1, order, (x, y), (nx, ny)))
+                order += 1
+        # 距離が改善するタイルだけを広げる
+        while heap:
+            dist, _, (tx, ty), via = heapq.heappop(heap)
+            current = self.distance[ty][tx]
+            if current != UNREACHABLE and current <= dist:
+                continue
+            self.distance[ty][tx] = dist
+            self.next_step[ty][tx] = via
+            for nx, ny in self._neighbors(tx, ty):
+                if (nx, ny) == self.goal or not self._passable[ny][nx]:
+                    continue
+                neighbor_dist = self.distance[ny][nx]
+                if neighbor_dist == UNREACHABLE or neighbor_dist > dist + 1:
+                    heapq.heappush(heap, (dist + 1, order, (nx, ny), (tx, ty)))
+                    order += 1
+        self._update_escape_steps()
+
+    def _snapshot(self, region: List[Tile]) -> List[Tuple[int, int, int, Optional[Tile]]]:
+        """
+        region の各タイルの (x, y, 距離, 次の一歩) を退避する。
+        """
+        return [(tx, ty, self.distance[ty][tx], self.next_step[ty][tx]) for tx, ty in region]
+
+    def _restore(self, x: int, y: int, snapshot: List[Tuple[int, int, int, Optional[Tile]]]) -> None:
+        """
+        (x, y)を開け、塞ぐ前に退避した部分木の値を書き戻す。
+        """
+        self.blocked.discard((x, y))
+        self._passable[y][x] = True
+        for tx, ty, dist, step in snapshot:
+            self.distance[ty][tx] = dist
+            self.next_step[ty][tx] = step
+        self._update_escape_steps()
+
+    def _is_blockable(self, x: int, y: int) -> bool:
+        """
+        塞ぐことができるタイルか（通行可能な道タイルで、ゴールではない）。
+        """
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            return False
+        return self._passable[y][x] and (x, y) != self.goal
+
+    def _neighbors(self, x: int, y: int) -> List[Tile]:
+        """
+        マップ内の隣接タイルを探索順で返す。
+        """
+        result = []
+        for dx, dy in NEIGHBOR_OFFSETS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < self.width and 0 <= ny < self.height:
+                result.append((nx, ny))
+        return result
+
+    def _subtree(self, tile: Tile) -> List[Tile]:
+        """
+        次の一歩を辿るとtileを通過するタイル（tile自身を含む最短路木の部分木）を列挙する。
+        塞がれたタイルの脱出先は木の辺ではないため含めない。
+        """
+        region = [tile]
+        index = 0
+        while index < len(region):
+            x, y = region[index]
+            index += 1
+            for nx, ny in self._neighbors(x, y):
+                if self._passable[ny][nx] and self.next_step[ny][nx] == (x, y):
+                    region.append((nx, ny))
+        return region
+
+    def _apply_block(self, x: int, y: int, region: List[Tile]) -> None:
+        """
+        (x, y)を塞ぎ、その部分木regionだけを再探索して距離場を修復する。
+        部分木の外側のタイルは距離が変わらないので、外周から確定距離を種にして部分木内を探索する。
+        """
+        self.blocked.add((x, y))
+        self._passable[y][x] = False
+        region_set = set(region)
+        for tx, ty in region:
+            self.distance[ty][tx] = UNREACHABLE
+            self.next_step[ty][tx] = None
+        heap: List[Tuple[int, int, Tile, Tile]] = []
+        order = 0
+        for tx, ty in region:
+            if not self._passable[ty][tx]:
+                continue
+            for nx, ny in self._neighbors(tx, ty):
+                if (nx, ny) in region_set or not self._passable[ny][nx]:
+                    continue
+                dist = self.distance[ny][nx]
+                if dist != UNREACHABLE:
+                    heapq.heappush(heap, (dist + 1, order, (tx, ty), (nx, ny)))
+                    order += 1
+        while heap:
+            dist, _, (tx, ty), via = heapq.heappop(heap)
+            if self.distance[ty][tx] != UNREACHABLE:
+                continue
+            self.distance[ty][tx] = dist
+            self.next_step[ty][tx] = via
+            for nx, ny in self._neighbors(tx, ty):
+                if (nx, ny) in region_set and self._passable[ny][nx] and self.distance[ny][nx] == UNREACHABLE:
+                    heapq.heappush(heap, (dist + 1, order, (nx, ny), (tx, ty)))
+                    order += 1
+        self._update_escape_steps()
+
+    def _update_escape_steps(self) -> None:
+        """
+        塞がれたタイル上にいる敵が抜け出せるよう、隣接する最もゴールに近いタイルを次の一歩に設定する。
+        """
+        for x, y in self.blocked:
+            best: Optional[Tile] = None
+            best_dist = UNREACHABLE
+            for nx, ny in self._neighbors(x, y):
+                dist = self.distance[ny][nx]
+                if self._passable[ny][nx] and dist != UNREACHABLE and (best is None or dist < best_dist):
+                    best = (nx, ny)
+                    best_dist = dist
+            self.next_step[y][x] = best
@@ -0,0 +1,77 @@
+"""
+GameSpeed - 早送り（ゲーム速度）の定義と、1フレームあたりのティック数を決めるスケジューラ。
+"""
+
+from enum import Enum
+
+# pyxelのデフォルトFPS（Game側でfpsを指定していないため30）
+DEFAULT_FPS = 30
+# 1フレームのうちシミュレーションに使ってよい割合（残りは描画用）
+SIMULATION_BUDGET_RATIO = 0.7
+# MAX速度時でも1フレームで処理する上限ティック数
+MAX_TICKS_PER_FRAME = 64
+
+
+class GameSpeed(Enum):
+    """
+    ゲーム速度。値は1フレームあたりのシミュレーションティック数（MAXは0=無制限）。
+    """
+
+    NORMAL = 1
+    DOUBLE = 2
+    QUAD = 4
+    OCTUPLE = 8
+    MAX = 0
+
+    def next(self) -> "GameSpeed":
+        """
+        速度切り替え順で次の速度を返す（MAXの次はNORMAL）。
+        """
+        members = list(GameSpeed)
+        return members[(members.index(self) + 1) % len(members)]
+
+    def label(self) -> str:
+        """
+        UI表示用の文字列。
+        """
+        return "MAX" if self == GameSpeed.MAX else f"x{self.value}"
+
+
+class TickScheduler:
+    """
+    1フレームに実行するティック数を決めるクラス。
+
+    直近のティック処理時間の指数移動平均からフレーム予算内に収まるティック数を求め、
+    指定速度の倍率を上限に実行数を調整する。
+    ティック自体の処理内容は変えないため、シミュレーション結果は速度に依存しない
+    （処理が重い場合は指定倍率より遅くなるだけ）。
+    """
+
+    def __init__(self, fps: int = DEFAULT_FPS, budget_ratio: float = SIMULATION_BUDGET_RATIO) -> None:
+        self.frame_budget = budget_ratio / fps  # 秒
+        self.avg_tick_time = 0.0  # 1ティックあたりの平均処理時間（秒）。0は未計測
+        self.smoothing = 0.2  # 指数移動平均の係数
+
+    def ticks_for_frame(self, speed: GameSpeed) -> int:
+        """
+        このフレームで実行するティック数を返す。常に1以上。
+        """
+        if self.avg_tick_time > 0.0:
+            affordable = max(1, int(self.frame_budget / self.avg_tick_time))
+        else:
+            affordable = MAX_TICKS_PER_FRAME
+        if speed == GameSpeed.MAX:
+            return min(affordable, MAX_TICKS_PER_FRAME)
+        return max(1, min(speed.value, affordable))
+
+    def record(self, ticks: int, elapsed: float) -> None:
+        """
+        実行したティック数と所要時間を記録し、平均処理時間を更新する。
+        """
+        if ticks <= 0:
+            return
+        per_tick = elapsed / ticks
+        if self.avg_tick_time == 0.0:
+            self.avg_tick_time = per_tick
+        else:
+            self.avg_tick_time += (per_tick - self.avg_tick_time) * self.smoothing
@@ -0,0 +1,181 @@
+"""
+HeadlessSimulator - pyxelのウィンドウを開かずにステージを進行させるシミュレータ。
+
+バランス調整・回帰テスト用に、InGameManagerと同じマネージャ群を組み立て、
+PlayingStateと同じ順序で1ティックずつ全速で更新する。
+このモジュールおよび依存モジュールはpyxelをimportしない。
+"""
+
+from typing import Optional
+
+from .enemy.enemy import Enemy
+from .enemy.enemy_manager import EnemyManager
+from .map import Map, TILE_PATH, TILE_PLACEABLE
+from .player_unit.player_unit import PLAYER_UNIT_MASTER, PlayerUnit
+from .player_unit.player_unit_manager import PlayerUnitManager
+from .simulation_result import SimulationResult
+from .stage_manager import StageManager
+from .stage_master import STAGE_MASTER_LIST
+
+
+class HeadlessSimulator:
+    """
+    描画・入力を持たないインゲームシミュレーション。
+    InGameManagerのうちゲーム進行に必要な状態のみを保持する。
+    """
+
+    def __init__(
+        self,
+        stage_index: int = 0,
+        funds: int = 100,
+        base_hp: int = 5,
+        use_flow_field: bool = False,
+        mazing: bool = False,
+        use_array_store: bool = False,
+        analytic_projectiles: bool = False,
+        start_wave: int = 0,
+        start_tick: int = 0,
+    ) -> None:
+        """
+        Args:
+            stage_index (int): STAGE_MASTER_LIST のインデックス
+            funds (int): 初期資金
+            base_hp (int): 防衛拠点の初期HP
+            use_flow_field (bool): 敵の移動に経路リストではなくフローフィールドを使う
+            mazing (bool): 道タイルを塞ぐユニット配置を許可する
+            use_array_store (bool): 敵の状態をNumPy配列で保持する（フローフィールド・迷路化とは併用不可）
+            analytic_projectiles (bool): 弾を毎ティック移動させず、発射時に求めた着弾ティックに命中処理する
+            start_wave (int): このウェーブから進める（それより前のウェーブは出現しない）
+            start_tick (int): start_wave の開始からこのティック目まで飛ばして進める（それより前の出現は起こらない）
+        """
+        if not 0 <= stage_index < len(STAGE_MASTER_LIST):
+            raise ValueError(f"Unknown stage index: {stage_index}")
+        if use_array_store and (use_flow_field or mazing):
+            # 配列ストアの敵は経路リストを進むため、フローフィールド（迷路化を含む）とは組み合わせられない
+            raise ValueError("use_array_store cannot be combined with use_flow_field or mazing")
+        self.stage_index = stage_index
+        stage_data = STAGE_MASTER_LIST[stage_index]
+        if not 0 <= start_wave < len(stage_data.waves):
+            raise ValueError(f"Unknown wave index: {start_wave}")
+        self.map = Map(map_data=stage_data.map_data)
+        self.enemy_manager = EnemyManager(use_array_store=use_array_store)
+        self.stage_manager = StageManager(
+            stage_data, self.enemy_manager, self.map, use_flow_field=use_flow_field, mazing=mazing
+        )
+        if start_wave or start_tick:
+            self.stage_manager.seek(start_wave, start_tick)
+        self.unit_list = PLAYER_UNIT_MASTER
+        self.player_unit_manager = PlayerUnitManager(analytic_projectiles=analytic_projectiles)
+
+        self.base_hp: int = base_hp
+        self.max_base_hp = base_hp
+        self.funds: int = funds
+
+        self.tick_count = 0  # 経過ティック数
+        self.result = SimulationResult.RUNNING
+
+    def can_place_unit_at(self, x: int, y: int) -> bool:
+        """
+        指定位置にユニットを配置できるかチェック。
+        InGameManager.can_place_unit_at と同じ判定。
+        """
+        if (x, y) in self.player_unit_manager.units:
+            return False
+        if not (0 <= x < self.map.width and 0 <= y < self.map.height):
+            return False
+        tile = self.map.get_tile(x, y)
+        if tile == TILE_PATH:
+            return self.stage_manager.can_block_tile(x, y)
+        return tile == TILE_PLACEABLE
+
+    def place_unit(self, unit: PlayerUnit, x: int, y: int) -> bool:
+        """
+        資金を消費してユニットを配置する。
+        資金不足・配置不可の場合はFalse。
+        """
+        if self.funds < unit.cost or not self.can_place_unit_at(x, y):
+            return False
+        if self.map.get_tile(x, y) == TILE_PATH and not self.stage_manager.block_tile(x, y):
+            return False
+        if not self.player_unit_manager.place_unit(unit, x, y):
+            return False
+        self.funds -= unit.cost
+        return True
+
+    def level_up_unit(self, x: int, y: int) -> bool:
+        """
+        資金を消費して配置済みユニットを強化する。
+        最大レベル・資金不足の場合はFalse。
+        """
+        inst = self.player_unit_manager.units.get((x, y))
+        if inst is None:
+            return False
+        next_cost = inst.unit.get_upgrade_cost(inst.level)
+        if next_cost <= 0 or self.funds < next_cost or inst.level >= inst.unit.max_level:
+            return False
+        self.funds -= next_cost
+        return self.player_unit_manager.level_up_unit(x, y)
+
+    def step(self) -> SimulationResult:
+        """
+        1ティック進める。
+        PlayingState._update_stage_and_units → _update_enemies と同じ順序で更新する。
+        Returns:
+            SimulationResult: 決着していなければRUNNING
+        """
+        if self.result != SimulationResult.RUNNING:
+            return self.result
+        is_all_wave_complete = self.stage_manager.update(on_defeat=self._on_defeat_enemy)
+        self.player_unit_manager.update(self.enemy_manager, ingame_manager=self)  # type: ignore[arg-type]
+        goal_enemies = self.enemy_manager.update()
+        self.tick_count += 1
+        if goal_enemies:
+            self.base_hp -= len(goal_enemies)
+        # PlayingStateと同様、ゲームオーバーはクリアより後に判定されるため優先される
+        if self.base_hp <= 0:
+            self.result = SimulationResult.GAMEOVER
+        elif is_all_wave_complete:
+            self.result = SimulationResult.CLEAR
+        return self.result
+
+    def skip_idle_ticks(self, max_ticks: Optional[int] = None) -> int:
+        """
+        場に敵も弾もいない間は、次の出現（またはウェーブ完了）のティックまでまとめて進める。
+        その間の step は何も起こさないため、1ティックずつ進めた場合と結果は変わらない。
+        Returns:
+            int: 省略したティック数
+        """
+        if self.result != SimulationResult.RUNNING or len(self.player_unit_manager.bullets) > 0:
+            return 0
+        ticks = self.stage_manager.get_idle_ticks()
+        if max_ticks is not None:
+            ticks = min(ticks, max_ticks - self.tick_count)
+        if ticks <= 0:
+            return 0
+        self.stage_manager.skip_ticks(ticks)
+        self.player_unit_manager.skip_ticks(ticks)
+        self.tick_count += ticks
+        return ticks
+
+    def run(self, max_ticks: Optional[int] = None, skip_idle: bool = True) -> SimulationResult:
+        """
+        決着するか max_ticks に達するまで全速で進める。
+        Args:
+            max_ticks (Optional[int]): 最大ティック数（Noneなら無制限）
+            skip_idle (bool): 敵の出現待ちの間をまとめて進める
+        Returns:
+            SimulationResult: CLEAR / GAMEOVER / TIMEOUT
+        """
+        while self.result == SimulationResult.RUNNING:
+            if skip_idle:
+                self.skip_idle_ticks(max_ticks)
+            if max_ticks is not None and self.tick_count >= max_ticks:
+                return SimulationResult.TIMEOUT
+            self.step()
+        return self.result
+
+    def _on_defeat_enemy(self, enemy: Enemy) -> None:
+        """
+        敵が倒されたときの処理。
+        """
+        self.funds += enemy.reward
@@ -0,0 +1,59 @@
+"""
+HudPanel - 内容が変わったときだけ描き直すUIパネル
+"""
+
+from typing import Any, Callable, Hashable, Optional
+
+
+class HudPanel:
+    """
+    画面上の矩形領域のUIを画面外のイメージに描画しておき、毎フレームはそれを blt で転送するクラス。
+
+    呼び出し側は毎フレーム、パネルの表示内容を決める入力（資金・HP・カーソル位置など）を
+    タプル等のキーとして draw に渡す。キーが前回と変わったとき（または invalidate したとき）に
+    version を進め、描画済みの version と異なる場合だけ render でイメージを描き直す。
+    """
+
+    def __init__(self, x: int, y: int, width: int, height: int) -> None:
+        """
+        Args:
+            x (int): 画面上の左上X座標
+            y (int): 画面上の左上Y座標
+            width (int): パネルの幅
+            height (int): パネルの高さ
+        """
+        self.x = x
+        self.y = y
+        self.width = width
+        self.height = height
+        self.version = 0  # 表示内容の版（入力が変わるたびに進む）
+        self.render_count = 0  # 描き直した回数（計測用）
+        self._rendered_version = -1  # イメージに描画済みの版
+        self._key: Optional[Hashable] = None
+        self._image: Any = None  # pyxel.Image（初回描画時に確保）
+
+    def invalidate(self) -> None:
+        """
+        入力に関係なく、次の draw で描き直させる。
+        """
+        self.version += 1
+
+    def draw(self, key: Hashable, render: Callable[[Any], None]) -> None:
+        """
+        パネルを描画する。
+        Args:
+            key: 表示内容を決める入力。前回と等しければ描画済みのイメージを再利用する
+            render: パネルのイメージ（pyxel.Image）を受け取り、パネル左上を原点として描画する関数
+        """
+        import pyxel
+
+        if key != self._key:
+            self._key = key
+            self.version += 1
+        if self._image is None:
+            self._image = pyxel.Image(self.width, self.height)
+        if self._rendered_version != self.version:
+            render(self._image)
+            self._rendered_version = self.version
+            self.render_count += 1
+        pyxel.blt(self.x, self.y, self._image, 0, 0, self.width, self.height)
@@ -2,6 +2,7 @@
 ゲームプレイ中のステートクラス。
 """
 
+import time
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -12,6 +13,7 @@ from .in_game_state import GameStateProtocol
 from ..enemy.enemy_manager import EnemyManager
 from .state_result import StateResult
 from ..enemy.enemy import Enemy
+from ..map import TILE_PATH
 
 
 class PlayingState(GameStateProtocol):
@@ -42,10 +44,7 @@ class PlayingState(GameStateProtocol):
         ゲームプレイ中の状態更新処理。
         各役割ごとに分割したメソッドを呼び出し、主処理はフロー制御のみとする。
         """
-        is_all_wave_complete = self._update_stage_and_units(manager)
-        if is_all_wave_complete:
-            state_manager.change_state(state_manager.clear_state)
-        self._update_enemies(manager, state_manager)
+        self._run_simulation_ticks(manager, state_manager)
 
         # 選択中の場合
         pum = manager.player_unit_manager
@@ -59,6 +58,25 @@ class PlayingState(GameStateProtocol):
         self._update_camera(manager)
         return StateResult.NONE
 
+    def _run_simulation_ticks(self, manager: "InGameManager", state_manager: "InGameStateManager") -> None:
+        """
+        ゲーム速度に応じて、1フレーム内にシミュレーションを複数ティック進める。
+        各ティックの処理内容は等速時と同じで、クリア・ゲームオーバーで状態が変わったら打ち切る。
+        """
+        scheduler = manager.tick_scheduler
+        ticks = scheduler.ticks_for_frame(manager.game_speed)
+        start = time.perf_counter()
+        executed = 0
+        while executed < ticks:
+            executed += 1
+            is_all_wave_complete = self._update_stage_and_units(manager)
+            if is_all_wave_complete:
+                state_manager.change_state(state_manager.clear_state)
+            self._update_enemies(manager, state_manager)
+            if state_manager.current_state is not self:
+                break
+        scheduler.record(executed, time.perf_counter() - start)
+
     def _handle_upgrade_ui(self, manager: "InGameManager", input_manager: "InputManager") -> StateResult:
         """
         強化UIの入力処理。
@@ -115,8 +133,7 @@ class PlayingState(GameStateProtocol):
         goal_enemies = self.enemy_manager.update()
         if goal_enemies:
             manager.base_hp -= len(goal_enemies)
-            # ゴール到達エネミーはリストから除去
-            self.enemy_manager.enemies = [e for e in self.enemy_manager.enemies if not (e.is_goal() and e.is_alive)]
+            # ゴール到達エネミーは EnemyManager.update で除去済み
             if manager.base_hp <= 0:
                 # ゲームオーバー遷移
                 state_manager.change_state(state_manager.gameover_state)
@@ -139,7 +156,11 @@ class PlayingState(GameStateProtocol):
                 unit = manager.unit_list[manager.unit_ui_cursor]
                 # 資金が足りる場合のみ配置し、UIを閉じる
                 if manager.funds >= unit.cost:
-                    placed = manager.player_unit_manager.place_unit(unit, x, y)
+                    # 迷路化モードで道に置く場合は先に道を塞ぐ（到達不能になる場合は配置しない）
+                    if manager.map.get_tile(x, y) == TILE_PATH and not manager.stage_manager.block_tile(x, y):
+                        placed = False
+                    else:
+                        placed = manager.player_unit_manager.place_unit(unit, x, y)
                     if placed:
                         manager.funds -= unit.cost
                     manager.is_selecting_unit = False
@@ -165,6 +186,10 @@ class PlayingState(GameStateProtocol):
         elif input_manager.is_triggered(pyxel.KEY_RIGHT):
             manager.cursor.move(1, 0)
 
+        # Fキーでゲーム速度を切り替え
+        if input_manager.is_triggered(pyxel.KEY_F):
+            manager.game_speed = manager.game_speed.next()
+
         # Zキーでユニット配置 or 強化UIへ
         if input_manager.is_triggered(pyxel.KEY_Z):
             x, y = manager.cursor.get_pos()
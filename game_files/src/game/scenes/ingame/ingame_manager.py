@@ -1,16 +1,19 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from ...game import Game
     from ...input_manager import InputManager
     from ..in_game_scene import InGameScene
 from .in_game_states.in_game_state_manager import InGameStateManager
-from .map import Map
+from .map import Map, TILE_PATH
 from .enemy.enemy_manager import EnemyManager
 from .ingame_result import InGameResult
 from ...utils.font_renderer import FontRenderer
 from .constants import TILE_SIZE
 from .player_unit.player_unit_manager import PlayerUnitManager
+from .game_speed import GameSpeed, TickScheduler
+from .hud_panel import HudPanel
+from .camera import CullStats
 
 
 class Unit:
@@ -43,7 +46,11 @@ class InGameManager:
     インゲームのマップとステート管理を担当。
     """
 
-    def __init__(self, ingame_scene: "InGameScene", stage_index: int = 0) -> None:
+    def __init__(self, ingame_scene: "InGameScene", stage_index: int = 0, mazing: bool = False) -> None:
+        """
+        Args:
+            mazing (bool): 道タイルを塞ぐユニット配置（迷路化）を許可するか
+        """
         self.ingame_scene = ingame_scene
         self.stage_index = stage_index
         from .stage_master import STAGE_MASTER_LIST
@@ -51,9 +58,10 @@ class InGameManager:
 
         stage_data = STAGE_MASTER_LIST[stage_index]
         self.map = Map(map_data=stage_data.map_data)
+        self.map.prerender()  # 静的なマップはイメージバンクに一度だけ描画しておく
         self.enemy_manager = EnemyManager()
         # --- ステージマスターデータ・マネージャ ---
-        self.stage_manager = StageManager(stage_data, self.enemy_manager, self.map)
+        self.stage_manager = StageManager(stage_data, self.enemy_manager, self.map, mazing=mazing)
         self.state_manager = InGameStateManager(self, self.enemy_manager)
         from .cursor import Cursor
         from .camera import Camera
@@ -84,6 +92,17 @@ class InGameManager:
 
         self.outside_area_color: int = 0  # マップ外の塗りつぶし色
 
+        # --- ゲーム速度（早送り） ---
+        self.game_speed: GameSpeed = GameSpeed.NORMAL
+        self.tick_scheduler = TickScheduler()
+
+        # --- 右側・下部UIのキャッシュ（初回描画時に生成） ---
+        self.right_panel: Optional[HudPanel] = None
+        self.bottom_panel: Optional[HudPanel] = None
+
+        # --- 射程の円の描画カリング（検証用の計数） ---
+        self.range_ring_cull_stats = CullStats()
+
     def update(self, input_manager: "InputManager") -> InGameResult:
         """
         インゲームの状態更新処理。
@@ -122,12 +141,13 @@ class InGameManager:
 
     def draw_map_and_objects(self, camera_x: int, camera_y: int) -> None:
         self.map.draw(camera_x, camera_y, self.camera.view_width, self.camera.view_height)
-        self.player_unit_manager.draw(camera_x, camera_y)
-        self.enemy_manager.draw(camera_x, camera_y)
+        view_width = self.camera.view_width
+        view_height = self.camera.view_height
+        self.player_unit_manager.draw(camera_x, camera_y, view_width, view_height)
+        self.enemy_manager.draw(camera_x, camera_y, view_width, view_height)
 
     def draw_range_ring(self, camera_x: int, camera_y: int) -> None:
-        import pyxel
-
+        self.range_ring_cull_stats.reset()
         pum = self.player_unit_manager
         if pum.is_upgrading_unit and pum.selected_unit_pos is not None:
             x, y = pum.selected_unit_pos
@@ -139,7 +159,7 @@ class InGameManager:
             cy = (y - camera_y) * TILE_SIZE + TILE_SIZE // 2
             rng = unit.get_range(next_level)
             radius = int(rng * TILE_SIZE)
-            pyxel.circb(cx, cy, radius, 13)
+            self._draw_ring(cx, cy, radius, 13)
         elif not self.is_selecting_unit:
             cursor_pos = self.cursor.get_pos()
             unit_inst = self.player_unit_manager.units.get(cursor_pos)
@@ -148,31 +168,63 @@ class InGameManager:
                 cx = (cursor_pos[0] - camera_x) * TILE_SIZE + TILE_SIZE // 2
                 cy = (cursor_pos[1] - camera_y) * TILE_SIZE + TILE_SIZE // 2
                 radius = int(rng * TILE_SIZE)
-                pyxel.circb(cx, cy, radius, 10)
+                self._draw_ring(cx, cy, radius, 10)
+
+    def _draw_ring(self, cx: int, cy: int, radius: int, color: int) -> None:
+        """
+        射程の円を描画する。円の外接矩形がマップ表示範囲に重ならなければ描画しない。
+        """
+        import pyxel
+
+        view_w = self.camera.view_width * TILE_SIZE
+        view_h = self.camera.view_height * TILE_SIZE
+        if cx + radius < 0 or cx - radius >= view_w or cy + radius < 0 or cy - radius >= view_h:
+            self.range_ring_cull_stats.culled += 1
+            return
+        pyxel.circb(cx, cy, radius, color)
+        self.range_ring_cull_stats.drawn += 1
+
+    def get_cull_stats(self) -> dict[str, CullStats]:
+        """
+        直近のフレームで描画した数・表示範囲外として省いた数を描画対象ごとに返す（検証用）。
+        """
+        return {
+            "enemies": self.enemy_manager.cull_stats,
+            "units": self.player_unit_manager.unit_cull_stats,
+            "bullets": self.player_unit_manager.bullet_cull_stats,
+            "range_rings": self.range_ring_cull_stats,
+        }
 
     def draw_right_ui(self, game: "Game", camera_x: int, camera_y: int) -> None:
+        """
+        右側UIを描画する。
+        表示内容を決める入力だけをキーにまとめ、変化したときだけパネルを描き直す。
+        """
+        if self.right_panel is None:
+            ui_x = self.camera.view_width * TILE_SIZE
+            self.right_panel = HudPanel(ui_x, 0, game.WINDOW_WIDTH - ui_x, game.WINDOW_HEIGHT)
         pum = self.player_unit_manager
         if pum.is_upgrading_unit and pum.selected_unit_pos is not None:
-            self._draw_upgrade_ui(game, pum)
+            inst = pum.units[pum.selected_unit_pos]
+            # 強化可否は資金で変わるため資金もキーに含める
+            key: tuple = ("upgrade", pum.selected_unit_pos, inst.level, pum.upgrade_ui_cursor, self.funds)
+            self.right_panel.draw(key, lambda image: self._draw_upgrade_ui(image, pum))
         elif self.is_selecting_unit:
-            self._draw_unit_select_ui(game)
+            key = ("select", self.unit_ui_cursor, self.funds)
+            self.right_panel.draw(key, self._draw_unit_select_ui)
         else:
-            self._draw_default_right_ui(game)
-
-    def _draw_upgrade_ui(self, game: "Game", pum: "PlayerUnitManager") -> None:
-        import pyxel
+            key = ("default", self.game_speed)
+            self.right_panel.draw(key, self._draw_default_right_ui)
 
-        ui_x = self.camera.view_width * TILE_SIZE
-        ui_y = 0
-        ui_w = game.WINDOW_WIDTH - ui_x
-        ui_h = game.WINDOW_HEIGHT
-        pyxel.rect(ui_x, ui_y, ui_w, ui_h, 1)
+    def _draw_upgrade_ui(self, image: Any, pum: "PlayerUnitManager") -> None:
+        ui_w = image.width
+        image.rect(0, 0, ui_w, image.height, 1)
         title_text = "ユニット強化"
         title_w = len(title_text) * 8
-        title_x = ui_x + (ui_w - title_w) // 2
+        title_x = (ui_w - title_w) // 2
         font_renderer = FontRenderer.get_instance()
-        font_renderer.draw_text(title_x, ui_y + 4, title_text, 7, font_name="default")
-        opt_y = ui_y + 16
+        font_renderer.draw_text(title_x, 4, title_text, 7, font_name="default", target=image)
+        opt_y = 16
 
         # 強化コスト・資金チェック
         if pum.selected_unit_pos is None:
@@ -187,46 +239,45 @@ class InGameManager:
 
         # 強化ボタン色: 押せる=10, 押せない=5
         upgrade_color = 10 if can_upgrade and pum.upgrade_ui_cursor == 0 else (7 if can_upgrade else 5)
-        font_renderer = FontRenderer.get_instance()
-        font_renderer.draw_text(ui_x + 4, opt_y, "強化", upgrade_color, font_name="default")
+        font_renderer.draw_text(4, opt_y, "強化", upgrade_color, font_name="default", target=image)
         # コスト表示
         if level < unit.max_level:
             cost_str = f"コスト:{next_cost}"
             cost_color = 3 if can_upgrade else 8
-            font_renderer.draw_text(ui_x + 4, opt_y + 14, cost_str, cost_color, font_name="default")
+            font_renderer.draw_text(4, opt_y + 14, cost_str, cost_color, font_name="default", target=image)
         else:
-            font_renderer.draw_text(ui_x + 4, opt_y + 14, "最大レベル", 8, font_name="default")
+            font_renderer.draw_text(4, opt_y + 14, "最大レベル", 8, font_name="default", target=image)
 
         # キャンセルボタン
         font_renderer.draw_text(
-            ui_x + 4, opt_y + 24, "キャンセル", 10 if pum.upgrade_ui_cursor == 1 else 7, font_name="default"
+            4, opt_y + 24, "キャンセル", 10 if pum.upgrade_ui_cursor == 1 else 7, font_name="default", target=image
         )
 
-        font_renderer.draw_text(ui_x + 8, opt_y + 36, f"Lv: {level}", 7, font_name="default")
-        font_renderer.draw_text(ui_x + 8, opt_y + 46, f"攻撃: {unit.get_attack(level)}", 7, font_name="default")
-        font_renderer.draw_text(ui_x + 8, opt_y + 56, f"射程: {unit.get_range(level)}", 7, font_name="default")
+        font_renderer.draw_text(8, opt_y + 36, f"Lv: {level}", 7, font_name="default", target=image)
+        font_renderer.draw_text(8, opt_y + 46, f"攻撃: {unit.get_attack(level)}", 7, font_name="default", target=image)
+        font_renderer.draw_text(8, opt_y + 56, f"射程: {unit.get_range(level)}", 7, font_name="default", target=image)
         if level < unit.max_level:
-            font_renderer.draw_text(ui_x + 8, opt_y + 70, f"→ Lv: {level+1}", 13, font_name="default")
-            font_renderer.draw_text(ui_x + 8, opt_y + 80, f"攻:{unit.get_attack(level+1)}", 13, font_name="default")
-            font_renderer.draw_text(ui_x + 8, opt_y + 90, f"射:{unit.get_range(level+1)}", 13, font_name="default")
-
-    def _draw_unit_select_ui(self, game: "Game") -> None:
-        import pyxel
-
-        ui_x = self.camera.view_width * TILE_SIZE
-        ui_y = 0
-        ui_w = game.WINDOW_WIDTH - ui_x
-        ui_h = game.WINDOW_HEIGHT
-        pyxel.rect(ui_x, ui_y, ui_w, ui_h, 5)
+            font_renderer.draw_text(8, opt_y + 70, f"→ Lv: {level+1}", 13, font_name="default", target=image)
+            font_renderer.draw_text(
+                8, opt_y + 80, f"攻:{unit.get_attack(level+1)}", 13, font_name="default", target=image
+            )
+            font_renderer.draw_text(
+                8, opt_y + 90, f"射:{unit.get_range(level+1)}", 13, font_name="default", target=image
+            )
+
+    def _draw_unit_select_ui(self, image: Any) -> None:
+        ui_w = image.width
+        ui_h = image.height
+        image.rect(0, 0, ui_w, ui_h, 5)
         title_text = "ユニット選択"
         title_w = len(title_text) * 8
-        title_x = ui_x + (ui_w - title_w) // 2
+        title_x = (ui_w - title_w) // 2
         font_renderer = FontRenderer.get_instance()
-        font_renderer.draw_text(title_x, ui_y + 4, title_text, 7, font_name="default")
+        font_renderer.draw_text(title_x, 4, title_text, 7, font_name="default", target=image)
         font_h = 8
         item_pad = 4
         item_h = font_h * 2 + item_pad
-        list_top = ui_y + 16
+        list_top = 16
         for idx, unit in enumerate(self.unit_list):
             y = list_top + idx * item_h
             can_afford = self.funds >= unit.cost
@@ -239,12 +290,12 @@ class InGameManager:
                 cost_color = 3
                 bg_color = 13 if idx == self.unit_ui_cursor else 5
             if idx == self.unit_ui_cursor:
-                pyxel.rect(ui_x + 2, y - 2, ui_w - 4, item_h, bg_color)
-            font_renderer.draw_text(ui_x + 4, y + 2, f"{unit.name}", name_color, font_name="default")
+                image.rect(2, y - 2, ui_w - 4, item_h, bg_color)
+            font_renderer.draw_text(4, y + 2, f"{unit.name}", name_color, font_name="default", target=image)
             cost_str = f"コスト:{unit.cost}"
-            font_renderer.draw_text(ui_x + 4, y + 2 + font_h, cost_str, cost_color, font_name="default")
+            font_renderer.draw_text(4, y + 2 + font_h, cost_str, cost_color, font_name="default", target=image)
         sel_unit = self.unit_list[self.unit_ui_cursor]
-        desc_y = ui_y + ui_h - 24
+        desc_y = ui_h - 24
         max_desc_width = ui_w - 8
         max_chars_per_line = max_desc_width // 8
         desc_lines = []
@@ -253,33 +304,33 @@ class InGameManager:
             desc_lines.append(desc[:max_chars_per_line])
             desc = desc[max_chars_per_line:]
         for i, line in enumerate(desc_lines[:2]):
-            font_renderer.draw_text(ui_x + 4, desc_y + i * 9, line, 13, font_name="default")
+            font_renderer.draw_text(4, desc_y + i * 9, line, 13, font_name="default", target=image)
 
-    def _draw_default_right_ui(self, game: "Game") -> None:
-        import pyxel
-
-        ui_x = self.camera.view_width * TILE_SIZE
-        ui_y = 0
-        ui_w = game.WINDOW_WIDTH - ui_x
-        ui_h = game.WINDOW_HEIGHT
-        pyxel.rect(ui_x, ui_y, ui_w, ui_h, 13)
+    def _draw_default_right_ui(self, image: Any) -> None:
+        image.rect(0, 0, image.width, image.height, 13)
+        font_renderer = FontRenderer.get_instance()
+        font_renderer.draw_text(4, 4, f"速度: {self.game_speed.label()}", 1, font_name="default", target=image)
+        font_renderer.draw_text(4, 14, "F: 切替", 1, font_name="default", target=image)
 
     def draw_bottom_ui(self, game: "Game") -> None:
-        import pyxel
-
-        map_bottom_y = self.camera.view_height * TILE_SIZE
-        ui_x = 0
-        ui_y = map_bottom_y
-        ui_w = self.camera.view_width * TILE_SIZE
-        ui_h = game.WINDOW_HEIGHT - map_bottom_y
-        pyxel.rect(ui_x, ui_y, ui_w, ui_h, 13)
-        funds = self.funds
-        funds_text = f"資金: {funds}"
+        """
+        下部UI（資金・HP）を描画する。資金・HPが変わったときだけパネルを描き直す。
+        """
+        if self.bottom_panel is None:
+            map_bottom_y = self.camera.view_height * TILE_SIZE
+            self.bottom_panel = HudPanel(
+                0, map_bottom_y, self.camera.view_width * TILE_SIZE, game.WINDOW_HEIGHT - map_bottom_y
+            )
+        self.bottom_panel.draw((self.funds, self.base_hp, self.max_base_hp), self._draw_bottom_panel)
+
+    def _draw_bottom_panel(self, image: Any) -> None:
+        image.rect(0, 0, image.width, image.height, 13)
+        funds_text = f"資金: {self.funds}"
         font_renderer = FontRenderer.get_instance()
         width = font_renderer.text_width(funds_text, font_name="default")
-        font_renderer.draw_text(ui_x + 8, ui_y + 0, funds_text, 1, font_name="default")
-        x = ui_x + width + 24
-        font_renderer.draw_text(x, ui_y, f"HP: {self.base_hp}/{self.max_base_hp}", 1, font_name="default")
+        font_renderer.draw_text(8, 0, funds_text, 1, font_name="default", target=image)
+        x = width + 24
+        font_renderer.draw_text(x, 0, f"HP: {self.base_hp}/{self.max_base_hp}", 1, font_name="default", target=image)
 
     def draw_cursor(self, camera_x: int, camera_y: int) -> None:
         self.cursor.draw(camera_x, camera_y)
@@ -296,6 +347,9 @@ class InGameManager:
         if not (0 <= x < self.map.width and 0 <= y < self.map.height):
             return False
         tile = self.map.get_tile(x, y)
+        if tile == TILE_PATH:
+            # 迷路化モードでは、ゴールへの到達性を保てる道タイルにも配置できる
+            return self.stage_manager.can_block_tile(x, y)
         if tile != 1:
             return False
         return True
@@ -3,10 +3,15 @@ Map - シンプルなマップタイル管理クラス
 各タイルは8x8px、種別ごとに描画方法を分岐
 """
 
-from typing import List
+from typing import Dict, Iterable, List, Tuple, TYPE_CHECKING
 
 from typing import Optional
 
+from .sprite_atlas import DrawTarget
+
+if TYPE_CHECKING:
+    from .flow_field import FlowField
+
 # タイル種別定数
 TILE_PATH = 0  # 敵の道（灰色）
 TILE_PLACEABLE = 1  # ユニット配置可能（白）
@@ -29,6 +34,11 @@ class Map:
         self.data: List[List[int]] = map_data
         self.height = len(self.data)
         self.width = len(self.data[0]) if self.data else 0
+        self._goal = self._find_goal()
+        # 開始タイル → ゴールまでの経路（全エネミーで共有する不変タプル）
+        self._path_cache: Dict[Tuple[int, int], Tuple[Tuple[int, int], ...]] = {}
+        self._flow_field: Optional["FlowField"] = None
+        self._prerendered = False  # マップ全体をイメージバンクに描画済みか
 
     def get_tile(self, x: int, y: int) -> int:
         """
@@ -97,23 +107,87 @@ class Map:
         path.reverse()
         return path
 
+    def get_shared_path(self, start: tuple[int, int]) -> Tuple[Tuple[int, int], ...]:
+        """
+        指定した開始位置からゴールまでの経路を、キャッシュ済みの不変タプルで返す。
+        同じ開始位置から出る全エネミーが同一のタプルを参照するため、出現時の確保が発生しない。
+        未計算の開始位置は初回のみ get_path で求めてキャッシュする。
+        Args:
+            start (tuple[int, int]): 開始位置のタイル座標
+        Returns:
+            Tuple[Tuple[int, int], ...]: 経路となるタイル座標（到達不能なら空）
+        """
+        path = self._path_cache.get(start)
+        if path is None:
+            path = tuple(self.get_path(start, self._goal))
+            self._path_cache[start] = path
+        return path
+
+    def precompute_paths(self, starts: Iterable[tuple[int, int]]) -> None:
+        """
+        ステージ読み込み時に、出現・着地地点ごとの経路をまとめて計算しておく。
+        """
+        for start in starts:
+            self.get_shared_path(start)
+
+    def get_flow_field(self) -> "FlowField":
+        """
+        ゴールからの逆探索によるフローフィールドを返す（初回のみ構築）。
+        経路リストの代わりに、敵がタイルごとの次の一歩を引いて進むモードで使用する。
+        """
+        if self._flow_field is None:
+            from .flow_field import FlowField
+
+            self._flow_field = FlowField(self)
+        return self._flow_field
+
     def get_goal(self) -> tuple[int, int]:
         """
         ゴール地点のタイル座標を取得。
+        マップデータは不変のため、初期化時に求めた値を返す。
         Returns:
             tuple[int, int]: ゴール地点の座標
         """
+        return self._goal
+
+    def _find_goal(self) -> tuple[int, int]:
+        """
+        マップ全体を走査してゴール地点を探す。見つからなければ(-1, -1)。
+        """
         for y in range(self.height):
             for x in range(self.width):
                 if self.data[y][x] == TILE_GOAL:
                     return (x, y)
         return (-1, -1)
 
+    def prerender(self) -> bool:
+        """
+        マップ全体をイメージバンク（MAP_IMAGE_BANK）に一度だけ描画する（ステージ読み込み時に呼ぶ）。
+        以後の draw はカメラ範囲を blt で1回転送するだけになる。
+        マップがイメージバンクに収まらない場合は何もせず、draw はタイルごとの描画を続ける。
+        Returns:
+            bool: 事前描画したらTrue
+        """
+        import pyxel
+        from .constants import IMAGE_BANK_SIZE, MAP_IMAGE_BANK, TILE_SIZE
+
+        if self.width * TILE_SIZE > IMAGE_BANK_SIZE or self.height * TILE_SIZE > IMAGE_BANK_SIZE:
+            self._prerendered = False
+            return False
+        image = pyxel.images[MAP_IMAGE_BANK]
+        image.cls(0)
+        for y in range(self.height):
+            for x in range(self.width):
+                self._draw_tile(image, self.data[y][x], x * TILE_SIZE, y * TILE_SIZE)
+        self._prerendered = True
+        return True
+
     def draw(
         self, camera_x: int = 0, camera_y: int = 0, view_width: Optional[int] = None, view_height: Optional[int] = None
     ) -> None:
         """
         カメラ範囲のみマップを描画。
+        事前描画済みならイメージバンクからカメラ範囲を1回の blt で転送する。
         Args:
             camera_x (int): カメラ左上タイルX
             camera_y (int): カメラ左上タイルY
@@ -121,37 +195,58 @@ class Map:
             view_height (int): 画面表示タイル数Y
         """
         import pyxel
-        from .constants import TILE_SIZE, VIEW_TILE_WIDTH, VIEW_TILE_HEIGHT
+        from .constants import MAP_IMAGE_BANK, TILE_SIZE, VIEW_TILE_WIDTH, VIEW_TILE_HEIGHT
 
         view_width = view_width if view_width is not None else VIEW_TILE_WIDTH
         view_height = view_height if view_height is not None else VIEW_TILE_HEIGHT
+        if self._prerendered:
+            width = min(view_width, self.width - camera_x)
+            height = min(view_height, self.height - camera_y)
+            if width > 0 and height > 0:
+                pyxel.blt(
+                    0,
+                    0,
+                    MAP_IMAGE_BANK,
+                    camera_x * TILE_SIZE,
+                    camera_y * TILE_SIZE,
+                    width * TILE_SIZE,
+                    height * TILE_SIZE,
+                )
+            return
         for y in range(camera_y, min(camera_y + view_height, self.height)):
             for x in range(camera_x, min(camera_x + view_width, self.width)):
-                tile = self.data[y][x]
-                px = (x - camera_x) * TILE_SIZE
-                py = (y - camera_y) * TILE_SIZE
-                if tile == TILE_PATH:
-                    pyxel.rect(px, py, TILE_SIZE, TILE_SIZE, 5)  # 灰色
-                elif tile == TILE_PLACEABLE:
-                    pyxel.rect(px, py, TILE_SIZE, TILE_SIZE, 7)  # 白
-                elif tile == TILE_BLOCKED:
-                    pyxel.rect(px, py, TILE_SIZE, TILE_SIZE, 7)  # 白地
-                    pyxel.line(px, py, px + TILE_SIZE - 1, py + TILE_SIZE - 1, 8)  # バツ印
-                    pyxel.line(px + TILE_SIZE - 1, py, px, py + TILE_SIZE - 1, 8)
-                elif tile == TILE_GOAL:
-                    # --- 拠点（城）グラフィック ---
-                    # 土台
-                    pyxel.rect(px, py, TILE_SIZE, TILE_SIZE, 13)  # 薄グレー
-                    # 城壁
-                    pyxel.rectb(px, py, TILE_SIZE, TILE_SIZE, 1)  # 黒枠
-                    # 中央塔
-                    tower_w = TILE_SIZE // 2
-                    tower_h = TILE_SIZE // 2
-                    tower_x = px + (TILE_SIZE - tower_w) // 2
-                    tower_y = py + (TILE_SIZE - tower_h) // 2
-                    pyxel.rect(tower_x, tower_y, tower_w, tower_h, 7)  # 白
-                    # 旗
-                    flag_x = tower_x + tower_w // 2
-                    flag_y = tower_y
-                    pyxel.line(flag_x, flag_y, flag_x, flag_y - 3, 8)  # ポール
-                    pyxel.rect(flag_x, flag_y - 3, 3, 2, 8)  # 赤旗
+                self._draw_tile(pyxel, self.data[y][x], (x - camera_x) * TILE_SIZE, (y - camera_y) * TILE_SIZE)
+
+    @staticmethod
+    def _draw_tile(target: DrawTarget, tile: int, px: int, py: int) -> None:
+        """
+        1タイルを描画する。
+        target: 描画先（DrawTarget）
+        """
+        from .constants import TILE_SIZE
+
+        if tile == TILE_PATH:
+            target.rect(px, py, TILE_SIZE, TILE_SIZE, 5)  # 灰色
+        elif tile == TILE_PLACEABLE:
+            target.rect(px, py, TILE_SIZE, TILE_SIZE, 7)  # 白
+        elif tile == TILE_BLOCKED:
+            target.rect(px, py, TILE_SIZE, TILE_SIZE, 7)  # 白地
+            target.line(px, py, px + TILE_SIZE - 1, py + TILE_SIZE - 1, 8)  # バツ印
+            target.line(px + TILE_SIZE - 1, py, px, py + TILE_SIZE - 1, 8)
+        elif tile == TILE_GOAL:
+            # --- 拠点（城）グラフィック ---
+            # 土台
+            target.rect(px, py, TILE_SIZE, TILE_SIZE, 13)  # 薄グレー
+            # 城壁
+            target.rectb(px, py, TILE_SIZE, TILE_SIZE, 1)  # 黒枠
+            # 中央塔
+            tower_w = TILE_SIZE // 2
+            tower_h = TILE_SIZE // 2
+            tower_x = px + (TILE_SIZE - tower_w) // 2
+            tower_y = py + (TILE_SIZE - tower_h) // 2
+            target.rect(tower_x, tower_y, tower_w, tower_h, 7)  # 白
+            # 旗
+            flag_x = tower_x + tower_w // 2
+            flag_y = tower_y
+            target.line(flag_x, flag_y, flag_x, flag_y - 3, 8)  # ポール
+            target.rect(flag_x, flag_y - 3, 3, 2, 8)  # 赤旗
@@ -0,0 +1,84 @@
+"""
+ObjectPool - 弾・敵などの使い捨てオブジェクトを再利用するための固定容量プール
+"""
+
+from typing import Any, Callable, Generic, List, Protocol, TypeVar
+
+
+class Poolable(Protocol):
+    """
+    プールで再利用できるオブジェクト。reset で生成直後と同じ状態に戻せること。
+    """
+
+    def reset(self, *args: Any, **kwargs: Any) -> None: ...
+
+
+T = TypeVar("T", bound=Poolable)
+
+
+class ObjectPool(Generic[T]):
+    """
+    解放されたオブジェクトを空きリストに保持し、次の取得時に reset して再利用するクラス。
+
+    空きリストは容量までしか保持せず、溢れたオブジェクトは破棄する（GCに任せる）。
+    取得時に空きリストから再利用できた割合（ヒット率）と、同時に使用中だった数の最大値を記録する。
+    """
+
+    def __init__(self, factory: Callable[..., T], capacity: int = 256) -> None:
+        """
+        Args:
+            factory: 空きがないときに新しいオブジェクトを生成する関数（通常はクラス）
+            capacity (int): 空きリストに保持する最大数
+        """
+        self.factory = factory
+        self.capacity = capacity
+        self.free: List[T] = []
+        # --- 統計 ---
+        self.hits = 0  # 空きリストから再利用した回数
+        self.misses = 0  # 新規生成した回数
+        self.discarded = 0  # 空きリストが満杯で破棄した回数
+        self.in_use = 0  # 使用中の数
+        self.high_water = 0  # 使用中の数の最大値
+
+    def acquire(self, *args: Any, **kwargs: Any) -> T:
+        """
+        オブジェクトを取得する。引数は生成時（またはreset）の引数としてそのまま渡す。
+        """
+        if self.free:
+            obj = self.free.pop()
+            obj.reset(*args, **kwargs)
+            self.hits += 1
+        else:
+            obj = self.factory(*args, **kwargs)
+            self.misses += 1
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj: T) -> None:
+        """
+        使い終わったオブジェクトを返却する。返却後は参照を保持しないこと。
+        """
+        self.in_use -= 1
+        if len(self.free) < self.capacity:
+            self.free.append(obj)
+        else:
+            self.discarded += 1
+
+    @property
+    def hit_rate(self) -> float:
+        """
+        取得のうち空きリストから再利用できた割合（0.0〜1.0）。
+        """
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get_stats(self) -> str:
+        """
+        統計を1行の文字列で返す（デバッグ表示・ヘッドレス実行のログ用）。
+        """
+        return (
+            f"hit_rate={self.hit_rate:.1%} hits={self.hits} misses={self.misses} "
+            f"high_water={self.high_water} free={len(self.free)} discarded={self.discarded}"
+        )
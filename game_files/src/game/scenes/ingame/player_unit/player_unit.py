@@ -1,5 +1,27 @@
 from typing import List, Optional
 
+from ..sprite_atlas import SPRITE_ATLAS, DrawTarget
+
+
+class PlayerUnitLevelStats:
+    """
+    ユニットの種類・レベルごとに前計算した能力値の行。
+    攻撃処理の毎ティックのループはこの行だけを参照する（生成後に書き換えないこと）。
+    """
+
+    __slots__ = ("attack", "range", "range_sq", "interval", "is_aoe", "flying_effect", "grants_slow")
+
+    def __init__(
+        self, attack: int, range: int, interval: int, is_aoe: bool, flying_effect: bool, grants_slow: bool
+    ) -> None:
+        self.attack = attack
+        self.range = range
+        self.range_sq = range * range  # 射程判定は距離の2乗と比較する
+        self.interval = interval
+        self.is_aoe = is_aoe
+        self.flying_effect = flying_effect
+        self.grants_slow = grants_slow
+
 
 class PlayerUnit:
     def __init__(
@@ -39,6 +61,7 @@ class PlayerUnit:
         self.level_colors = level_colors if level_colors is not None else []
         self.flying_effect = flying_effect
         self.grants_slow = grants_slow
+        self.level_stats = self._build_level_stats()
 
     def get_upgrade_cost(self, level: int) -> int:
         idx = min(level, len(self.upgrade_cost) - 1)
@@ -51,15 +74,26 @@ class PlayerUnit:
         return self.level_colors[idx]
 
     def draw(self, x: int, y: int, level: int, tile_size: int) -> None:
-        import pyxel
+        """
+        ユニットを描画する。スプライトアトラスにあれば blt 1回、なければ draw_body で直接描画する。
+        """
+        if not SPRITE_ATLAS.draw((self, level), x, y):
+            import pyxel
+
+            self.draw_body(pyxel, x, y, level, tile_size)
 
+    def draw_body(self, target: DrawTarget, x: int, y: int, level: int, tile_size: int) -> None:
+        """
+        ユニットの見た目を描画する（スプライトアトラスの生成にも使う）。
+        target: 描画先（DrawTarget）
+        """
         color = self.get_color(level)
         if self.shape == "rect":
-            pyxel.rect(x, y, tile_size, tile_size, color)
+            target.rect(x, y, tile_size, tile_size, color)
         elif self.shape == "tri":
-            pyxel.tri(x, y + tile_size, x + tile_size // 2, y, x + tile_size, y + tile_size, color)
+            target.tri(x, y + tile_size, x + tile_size // 2, y, x + tile_size, y + tile_size, color)
         elif self.shape == "circ":
-            pyxel.circ(x + tile_size // 2, y + tile_size // 2, tile_size // 2, color)
+            target.circ(x + tile_size // 2, y + tile_size // 2, tile_size // 2, color)
         elif self.shape == "diamond":
             # ひし形（ダイヤ型）: 4頂点
             cx = x + tile_size // 2
@@ -69,15 +103,15 @@ class PlayerUnit:
             bottom = (cx, y + tile_size)
             left = (x, cy)
             # 塗りつぶし（2三角形で分割）
-            pyxel.tri(*top, *right, *bottom, color)
-            pyxel.tri(*top, *bottom, *left, color)
+            target.tri(*top, *right, *bottom, color)
+            target.tri(*top, *bottom, *left, color)
             # 枠線
-            pyxel.line(*top, *right, 7)
-            pyxel.line(*right, *bottom, 7)
-            pyxel.line(*bottom, *left, 7)
-            pyxel.line(*left, *top, 7)
+            target.line(*top, *right, 7)
+            target.line(*right, *bottom, 7)
+            target.line(*bottom, *left, 7)
+            target.line(*left, *top, 7)
         else:
-            pyxel.rect(x, y, tile_size, tile_size, color)
+            target.rect(x, y, tile_size, tile_size, color)
 
     def get_attack(self, level: int) -> int:
         idx = min(level - 1, len(self.attack) - 1)
@@ -87,6 +121,30 @@ class PlayerUnit:
         idx = min(level - 1, len(self.range) - 1)
         return self.range[idx]
 
+    def _build_level_stats(self) -> List[PlayerUnitLevelStats]:
+        """
+        レベル1から順の能力値テーブルを作る（攻撃力・射程のリストが短い場合は末尾の値を使う）。
+        """
+        levels = max(self.max_level, len(self.attack), len(self.range))
+        return [
+            PlayerUnitLevelStats(
+                self.get_attack(level),
+                self.get_range(level),
+                self.attack_interval,
+                self.is_aoe,
+                self.flying_effect,
+                self.grants_slow,
+            )
+            for level in range(1, levels + 1)
+        ]
+
+    def get_level_stats(self, level: int) -> PlayerUnitLevelStats:
+        """
+        指定レベルの能力値の行を返す。
+        """
+        idx = min(level - 1, len(self.level_stats) - 1)
+        return self.level_stats[idx]
+
 
 # --- ユニットマスターデータ ---
 
@@ -2,43 +2,89 @@
 PlayerUnitManager - プレイヤーユニットの配置・管理・攻撃処理を担当
 """
 
-from typing import Dict, Tuple, TYPE_CHECKING
+import heapq
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from ..ingame_manager import InGameManager
-from .player_unit import PlayerUnit
+    from ..enemy.enemy import Enemy
+    from ..bullet import Bullet
+from .player_unit import PlayerUnit, PlayerUnitLevelStats
+from .tile_coverage import TileCoverage
+from ..object_pool import ObjectPool
+from ..entity_list import EntityHandle, EntityList
 from ..enemy.enemy_manager import EnemyManager
-from ..enemy.buff import SpeedDownBuff
+from ..enemy.buff import SLOW_BUFF
+from ..camera import CullStats
+from ..constants import TILE_SIZE, VIEW_TILE_HEIGHT, VIEW_TILE_WIDTH
 
 
 class PlayerUnitInstance:
     """
     マップ上に配置されたプレイヤーユニットのインスタンス。
-    各インスタンスはレベル・座標・攻撃クールダウン等を持つ。
+    各インスタンスはレベル・座標・次に攻撃できるティック等を持つ。
     """
 
-    def __init__(self, unit: PlayerUnit, pos: Tuple[int, int]) -> None:
+    __slots__ = ("unit", "pos", "order", "level", "stats", "cooldown", "ready_tick")
+
+    def __init__(self, unit: PlayerUnit, pos: Tuple[int, int], order: int = 0) -> None:
         self.unit = unit
         self.pos = pos  # (x, y)
+        self.order = order  # 配置順（同じティックに攻撃するユニットはこの順で処理する）
         self.level = 1
+        self.stats: PlayerUnitLevelStats = unit.get_level_stats(1)  # 現在のレベルの能力値
         self.cooldown = 0  # 予備
-        self.attack_cooldown = 0  # 攻撃間隔管理
+        self.ready_tick = 0  # 次に攻撃できるティック（PlayerUnitManagerのティック基準）
 
     def level_up(self) -> None:
         if self.level < self.unit.max_level:
             self.level += 1
+            self.stats = self.unit.get_level_stats(self.level)
+
+
+def _placement_order(inst: PlayerUnitInstance) -> int:
+    return inst.order
 
 
 class PlayerUnitManager:
     """
     プレイヤーユニットの配置・管理・攻撃処理を一元管理するクラス。
+
+    攻撃間隔の待ちは、毎ティック全ユニットのカウントを減らす代わりに
+    「次に攻撃できるティック」をキーにした優先度付きキューで管理する。
+    キューから取り出したユニットは標的が見つかるまで待機中（_ready）に置き、攻撃したらキューへ戻す。
+    1ティックの処理は、攻撃待ちが明けたユニットと標的待ちのユニットの数に比例する。
+
+    弾は入れ替え削除で詰めるため、更新順は発射順と一致しない。標的が倒れたティックに
+    その標的へ向かう弾が既に更新済みだと、その弾は次のティックの更新で外れとして消える（1ティック残る）。
+    決着・ティック数・資金・拠点HPはこの順序に影響されない。
+
+    着弾計算モードでは、弾は発射時に着弾ティックを求めてティックごとのバケットに登録し、
+    毎ティックの追尾移動を行わない。弾の座標は描画するときだけ求める。
+    毎ティック確認するのは弾が向かっている敵ごとの予測の前提（速度・フローフィールド）だけで、
+    変わっていればその敵に向かう弾の着弾ティックを求め直す。
     """
 
-    def __init__(self) -> None:
+    def __init__(self, analytic_projectiles: bool = False) -> None:
+        """
+        Args:
+            analytic_projectiles (bool): 弾を毎ティック移動させず、発射時に求めた着弾ティックに命中処理する
+        """
         self.units: Dict[Tuple[int, int], PlayerUnitInstance] = {}
         from ..bullet import Bullet
 
-        self.bullets: list[Bullet] = []
+        self.bullets: EntityList[Bullet] = EntityList()
+        self.bullet_pool: ObjectPool[Bullet] = ObjectPool(Bullet, capacity=1024)  # 消滅した弾を再利用する
+        self.coverage = TileCoverage()  # タイル → 射程が掛かるユニット
+        self.tick = 0  # update を呼んだ回数
+        self._schedule: List[Tuple[int, int, PlayerUnitInstance]] = []  # (攻撃できるティック, 登録順, ユニット)
+        self._schedule_count = 0
+        self._ready: Dict[Tuple[int, int], PlayerUnitInstance] = {}  # 攻撃可能で標的を待っているユニット
+        self.analytic_projectiles = analytic_projectiles
+        self._impacts: Dict[int, List["Bullet"]] = {}  # 着弾ティック → その時に命中処理する弾
+        self._inbound: Dict[EntityHandle, List["Bullet"]] = {}  # 標的のハンドル → 向かっている弾（着弾計算モード）
+        self.unit_cull_stats = CullStats()  # 直近の draw で描画した数・省いた数
+        self.bullet_cull_stats = CullStats()
 
         # --- 強化UI状態管理 ---
         self.is_upgrading_unit: bool = False  # 強化UI表示中か
@@ -69,7 +115,10 @@ class PlayerUnitManager:
         """
         if (x, y) in self.units:
             return False
-        self.units[(x, y)] = PlayerUnitInstance(unit, (x, y))
+        inst = PlayerUnitInstance(unit, (x, y), len(self.units))
+        self.units[(x, y)] = inst
+        self.coverage.add_unit(inst)
+        self._ready[inst.pos] = inst  # 配置直後から攻撃できる
         return True
 
     def level_up_unit(self, x: int, y: int) -> bool:
@@ -79,75 +128,199 @@ class PlayerUnitManager:
         """
         if (x, y) not in self.units:
             return False
-        self.units[(x, y)].level_up()
+        inst = self.units[(x, y)]
+        prev_level = inst.level
+        inst.level_up()
+        if inst.level != prev_level:
+            # 射程が変わりうるため、担当タイルを更新（攻撃間隔はレベルによらないので予約はそのまま）
+            self.coverage.update_unit(inst)
         return True
 
+    def skip_ticks(self, ticks: int) -> None:
+        """
+        敵も弾もいない間の更新をまとめて省略する（攻撃待ちの明けは次の update でまとめて処理される）。
+        """
+        self.tick += ticks
+
+    def _schedule_attack(self, inst: PlayerUnitInstance, ready_tick: int) -> None:
+        """
+        ユニットが次に攻撃できるティックを予約する。
+        予約し直した場合、古いエントリは取り出したときに ready_tick が一致しないため無視される。
+        """
+        inst.ready_tick = ready_tick
+        self._schedule_count += 1
+        heapq.heappush(self._schedule, (ready_tick, self._schedule_count, inst))
+
     def update(self, enemy_manager: "EnemyManager", ingame_manager: "InGameManager") -> None:
         """
         全ユニットの攻撃処理・弾の更新を行う。
         """
-        from ..bullet import Bullet
+        self.tick += 1
+        tick = self.tick
 
-        # 弾の更新・消滅処理
-        for bullet in self.bullets:
-            bullet.update(enemy_manager.enemies)
+        # 弾の更新・消滅処理（消滅した弾だけを入れ替え削除し、プールへ返却する）
+        if self.analytic_projectiles:
+            # 着弾計算モードでは、予測の前提が変わった敵に向かう弾を求め直してから、このティックに着弾する弾だけを処理する
+            self._repredict_impacts(enemy_manager.enemies, tick)
+            finished = self._impacts.pop(tick, [])
+            for bullet in finished:
+                bullet.resolve(enemy_manager.enemies, enemy_manager.grid)
+                inbound = self._inbound[bullet.target]
+                inbound.remove(bullet)
+                if not inbound:
+                    del self._inbound[bullet.target]
+        else:
+            finished = []
+            for bullet in self.bullets:
+                bullet.update(enemy_manager.enemies, enemy_manager.grid)
+                if not bullet.is_active:
+                    finished.append(bullet)
+        for bullet in finished:
+            self.bullets.remove(bullet)
+            self.bullet_pool.release(bullet)
+        # ゴールに到達した敵は、向かっている弾がなくなってから除去する
+        if enemy_manager.departed:
+            enemy_manager.release_departed({bullet.target for bullet in self.bullets})
 
-        self.bullets = [b for b in self.bullets if b.is_active]
+        # 攻撃待ちが明けたユニットだけをキューから取り出す
+        schedule = self._schedule
+        while schedule and schedule[0][0] <= tick:
+            ready_tick, _, inst = heapq.heappop(schedule)
+            if inst.ready_tick == ready_tick and self.units.get(inst.pos) is inst:
+                self._ready[inst.pos] = inst
+        if not self._ready:
+            return
 
-        # 各ユニットの攻撃判定
-        for inst in self.units.values():
-            if inst.attack_cooldown > 0:
-                inst.attack_cooldown -= 1
+        # 従来どおり配置順に攻撃させる（弾の発射順を決定的にするため）
+        ready_units = sorted(self._ready.values(), key=_placement_order)
+
+        targets = self._find_targets(ready_units, enemy_manager)
+        for inst in ready_units:
+            target = targets.get(inst.pos)
+            if target is None:
                 continue
-            # 射程内の敵を検索
-            attack_range = inst.unit.get_range(inst.level)
-            attack_power = inst.unit.get_attack(inst.level)
+            stats = inst.stats
             cx, cy = inst.pos
-            targets = []
-            for enemy in enemy_manager.enemies:
-                if not enemy.is_alive:
-                    continue
-                ex, ey = enemy.x, enemy.y
-                dist = ((ex - cx) ** 2 + (ey - cy) ** 2) ** 0.5
-                if dist <= attack_range:
-                    targets.append(enemy)
-            if not targets:
-                continue
-            # 単体攻撃: 最初の敵に弾
-            grant_buff = None
-            if inst.unit.grants_slow:
-                grant_buff = SpeedDownBuff(duration=300, speed_multiplier=0.5)
-            if inst.unit.is_aoe:
+            # 速度低下は共有のバフ定義を渡すだけで、発射ごとにバフを生成しない
+            grant_buff = SLOW_BUFF if stats.grants_slow else None
+            if stats.is_aoe:
                 # 範囲攻撃
-                self.bullets.append(
-                    Bullet(cx, cy, targets[0], attack_power, aoe_radius=2.5, flying_effect=inst.unit.flying_effect)
+                bullet = self.bullet_pool.acquire(
+                    cx, cy, target, stats.attack, aoe_radius=2.5, flying_effect=stats.flying_effect
                 )
             else:
                 # 単体攻撃
-                self.bullets.append(
-                    Bullet(
-                        cx,
-                        cy,
-                        targets[0],
-                        attack_power,
-                        grant_buff=grant_buff,
-                        flying_effect=inst.unit.flying_effect,
-                    )
+                bullet = self.bullet_pool.acquire(
+                    cx,
+                    cy,
+                    target,
+                    stats.attack,
+                    grant_buff=grant_buff,
+                    flying_effect=stats.flying_effect,
                 )
+            self.bullets.add(bullet)
+            if self.analytic_projectiles:
+                impact_tick = bullet.launch(target, tick)
+                self._impacts.setdefault(impact_tick, []).append(bullet)
+                self._inbound.setdefault(bullet.target, []).append(bullet)
 
-            inst.attack_cooldown = inst.unit.attack_interval  # ユニットごとの発射間隔
+            # ユニットごとの発射間隔だけ待つ（従来のカウントダウンと同じく間隔+1ティック後に再び攻撃できる）
+            del self._ready[inst.pos]
+            self._schedule_attack(inst, tick + stats.interval + 1)
+
+    def _repredict_impacts(self, enemies: EntityList["Enemy"], tick: int) -> None:
+        """
+        弾が向かっている敵のうち、速度やフローフィールドが発射時（前回の予測時）から変わった敵について、
+        向かっている弾の着弾ティックを求め直してバケットを付け替える（着弾計算モード）。
+        既にいない敵に向かう弾は、着弾ティックに外れとして処理する。
+        """
+        impacts = self._impacts
+        for handle, bullets in self._inbound.items():
+            target = enemies.get(handle)
+            if target is None or not target.is_alive:
+                continue
+            key = target.prediction_key()
+            for bullet in bullets:
+                if bullet.aim_key == key:
+                    continue
+                impacts[bullet.impact_tick].remove(bullet)
+                impacts.setdefault(bullet.repredict(target, tick), []).append(bullet)
 
-    def draw(self, camera_x: int, camera_y: int) -> None:
+    def _find_targets(
+        self, ready_units: List[PlayerUnitInstance], enemy_manager: "EnemyManager"
+    ) -> Dict[Tuple[int, int], "Enemy"]:
         """
-        マップ上のユニットを描画する。
+        攻撃可能な各ユニットについて、射程内で最も早く出現した敵を求める。
+
+        敵が1体以上いるタイル（空間インデックスのバケット）ごとにタイル被覆テーブルを引き、
+        そのタイルを射程に収めうる攻撃可能ユニットだけを距離判定する。
+        敵リストは入れ替え削除で詰めるため出現順に並んでおらず、走査の順序によらないよう
+        ユニットごとに出現番号（spawn_order）が最小の射程内の敵を残す。
+        Returns:
+            Dict[Tuple[int, int], Enemy]: ユニット座標 → 標的
         """
-        from ..constants import TILE_SIZE
+        ready = {inst.pos for inst in ready_units}
+        targets: Dict[Tuple[int, int], "Enemy"] = {}
+        coverage = self.coverage
+        for cell, bucket in enemy_manager.grid.buckets.items():
+            candidates = coverage.units_at(cell)
+            if not candidates:
+                continue
+            for inst in candidates:
+                pos = inst.pos
+                if pos not in ready:
+                    continue
+                ux, uy = pos
+                range_sq = inst.stats.range_sq
+                best = targets.get(pos)
+                for enemy in bucket:
+                    if not enemy.is_alive or (best is not None and enemy.spawn_order >= best.spawn_order):
+                        continue
+                    dx = enemy.x - ux
+                    dy = enemy.y - uy
+                    if dx * dx + dy * dy <= range_sq:
+                        best = enemy
+                if best is not None:
+                    targets[pos] = best
+        return targets
 
+    def draw(
+        self, camera_x: int, camera_y: int, view_width: Optional[int] = None, view_height: Optional[int] = None
+    ) -> None:
+        """
+        表示範囲内のユニットと弾を描画する。
+        camera_x, camera_y: カメラの左上タイル座標
+        view_width, view_height: 画面表示タイル数
+        描画した数・省いた数はユニットは unit_cull_stats、弾は bullet_cull_stats に残す。
+        """
+        view_width = view_width if view_width is not None else VIEW_TILE_WIDTH
+        view_height = view_height if view_height is not None else VIEW_TILE_HEIGHT
+        # ユニットはタイルに収まるので表示範囲のタイルだけを描画する
+        unit_stats = self.unit_cull_stats
+        unit_stats.reset()
+        max_x = camera_x + view_width
+        max_y = camera_y + view_height
         for inst in self.units.values():
-            sx = (inst.pos[0] - camera_x) * TILE_SIZE
-            sy = (inst.pos[1] - camera_y) * TILE_SIZE
-            inst.unit.draw(sx, sy, inst.level, TILE_SIZE)
+            x, y = inst.pos
+            if camera_x <= x < max_x and camera_y <= y < max_y:
+                inst.unit.draw((x - camera_x) * TILE_SIZE, (y - camera_y) * TILE_SIZE, inst.level, TILE_SIZE)
+                unit_stats.drawn += 1
+            else:
+                unit_stats.culled += 1
 
-        # 弾の描画
+        # 弾の描画（着弾計算モードでは描画する弾だけ座標を補間する）
+        # 弾は半径2pxの円なので上下左右に1タイル広げた範囲で判定する
+        bullet_stats = self.bullet_cull_stats
+        bullet_stats.reset()
+        min_x = camera_x - 1
+        min_y = camera_y - 1
+        max_x += 1
+        max_y += 1
         for bullet in self.bullets:
-            bullet.draw(camera_x, camera_y)
+            if self.analytic_projectiles:
+                bullet.interpolate(self.tick)
+            if min_x <= bullet.x <= max_x and min_y <= bullet.y <= max_y:
+                bullet.draw(camera_x, camera_y)
+                bullet_stats.drawn += 1
+            else:
+                bullet_stats.culled += 1
@@ -0,0 +1,98 @@
+"""
+TileCoverage - タイルごとに「そのタイル上の敵を射程に収めうるユニット」を保持するテーブル
+"""
+
+import math
+from typing import Dict, List, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .player_unit_manager import PlayerUnitInstance
+
+Cell = Tuple[int, int]
+
+
+class TileCoverage:
+    """
+    タイル座標 → 射程がそのタイルに掛かるユニット一覧 の対応表。
+
+    配置済みユニットは移動せず、射程が変わるのはレベルアップ時のみのため、
+    配置・強化のたびに該当ユニットの担当タイルだけを差分更新する。
+    敵の現在タイルを引くだけで攻撃候補のユニットが分かるので、
+    ターゲット探索で全ユニット×全敵の総当たりをせずに済む。
+
+    飛行中の敵は道以外のタイル上も移動するため、道タイルに限らず射程内の全タイルを登録する。
+    登録は保守的（タイル内のどこかが射程内なら登録）なので、最終判定は呼び出し側で距離を確認すること。
+    """
+
+    def __init__(self) -> None:
+        self.table: Dict[Cell, List["PlayerUnitInstance"]] = {}
+        self._unit_cells: Dict[Tuple[int, int], List[Cell]] = {}  # ユニット座標 → 登録済みタイル
+
+    def units_at(self, cell: Cell) -> List["PlayerUnitInstance"]:
+        """
+        指定タイル上の敵を射程に収めうるユニット一覧を返す。
+        """
+        return self.table.get(cell, [])
+
+    def cells_of(self, inst: "PlayerUnitInstance") -> List[Cell]:
+        """
+        ユニットの射程が掛かるタイル一覧を返す。
+        """
+        return self._unit_cells.get(inst.pos, [])
+
+    def add_unit(self, inst: "PlayerUnitInstance") -> None:
+        """
+        ユニットの射程が掛かるタイルを登録する。
+        """
+        cells = self._covered_cells(inst.pos, inst.stats.range)
+        self._unit_cells[inst.pos] = cells
+        for cell in cells:
+            self.table.setdefault(cell, []).append(inst)
+
+    def remove_unit(self, inst: "PlayerUnitInstance") -> None:
+        """
+        ユニットの登録を全て外す。
+        """
+        for cell in self._unit_cells.pop(inst.pos, []):
+            units = self.table[cell]
+            units.remove(inst)
+            if not units:
+                del self.table[cell]
+
+    def update_unit(self, inst: "PlayerUnitInstance") -> None:
+        """
+        レベルアップ等で射程が変わったユニットの登録を差分更新する。
+        """
+        old_cells = set(self._unit_cells.get(inst.pos, []))
+        new_cells = self._covered_cells(inst.pos, inst.stats.range)
+        new_set = set(new_cells)
+        for cell in old_cells - new_set:
+            units = self.table[cell]
+            units.remove(inst)
+            if not units:
+                del self.table[cell]
+        for cell in new_cells:
+            if cell not in old_cells:
+                self.table.setdefault(cell, []).append(inst)
+        self._unit_cells[inst.pos] = new_cells
+
+    @staticmethod
+    def _covered_cells(pos: Tuple[int, int], attack_range: float) -> List[Cell]:
+        """
+        ユニット座標から射程attack_range以内の点を1つでも含むタイルを列挙する。
+        タイル(cx, cy)は敵座標 [cx, cx+1) x [cy, cy+1) の範囲に対応する。
+        """
+        ux, uy = pos
+        range_sq = attack_range * attack_range
+        reach = math.ceil(attack_range)
+        cells: List[Cell] = []
+        for cy in range(uy - reach - 1, uy + reach + 1):
+            # タイル内でユニットに最も近い点までの距離で判定する
+            ny = min(max(uy, cy), cy + 1)
+            dy = ny - uy
+            for cx in range(ux - reach - 1, ux + reach + 1):
+                nx = min(max(ux, cx), cx + 1)
+                dx = nx - ux
+                if dx * dx + dy * dy <= range_sq:
+                    cells.append((cx, cy))
+        return cells
@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class SimulationResult(Enum):
+    """
+    ヘッドレスシミュレーションの結果を表すEnum。
+    """
+
+    RUNNING = 0
+    CLEAR = 1
+    GAMEOVER = 2
+    TIMEOUT = 3
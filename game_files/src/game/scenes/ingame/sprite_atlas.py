@@ -0,0 +1,158 @@
+"""
+SpriteAtlas - 敵・ユニット・弾の見た目を起動時にイメージバンクへ描画しておくアトラス
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .constants import IMAGE_BANK_SIZE, SPRITE_IMAGE_BANK
+
+# 1スプライトを描画する枠の大きさと、枠内での描画原点（枠の左上からの距離）
+# 原点より左上・右下にはみ出す描画（黒縁・羽・影）も枠に収まるよう余白を取る
+SPRITE_CELL_SIZE = 32
+SPRITE_ORIGIN = 8
+
+# 描画先: pyxel モジュール（画面）か pyxel.Image（イメージバンク）。どちらも同じ描画API（rect・circ など）を持つ
+DrawTarget = Any
+
+# スプライトの描画関数: (描画先, 原点X, 原点Y)
+SpritePainter = Callable[[DrawTarget, int, int], None]
+
+# 弾のスプライトのキー
+BULLET_SPRITE = "bullet"
+
+
+class Sprite:
+    """
+    アトラス上のスプライト1つ分の矩形。
+    offset_x, offset_y は描画原点から見た矩形左上の位置。
+    """
+
+    __slots__ = ("u", "v", "width", "height", "offset_x", "offset_y")
+
+    def __init__(self, u: int, v: int, width: int, height: int, offset_x: int, offset_y: int) -> None:
+        self.u = u
+        self.v = v
+        self.width = width
+        self.height = height
+        self.offset_x = offset_x
+        self.offset_y = offset_y
+
+
+class SpriteAtlas:
+    """
+    描画関数ごとに一度だけイメージバンクへ描画し、以後は blt 1回で描画するためのアトラス。
+    スプライトは SPRITE_CELL_SIZE 四方の枠に並べ、実際に描かれた範囲だけを転送する。
+    build していない（またはバンクに収まらなかった）キーは draw が False を返すので、
+    呼び出し側は従来どおり描画関数で直接描画する。
+    """
+
+    def __init__(self, bank: int = SPRITE_IMAGE_BANK) -> None:
+        self.bank = bank
+        self.colkey = 0  # 透明色（どのスプライトも使わない色）
+        self.sprites: Dict[Hashable, Sprite] = {}
+        self._blt: Any = None  # pyxel.blt（build 時に取得）
+
+    def build(self, painters: Dict[Hashable, SpritePainter], colkey: int) -> int:
+        """
+        painters の各描画関数をイメージバンクに描画し、キーごとのスプライトを登録し直す。
+        Args:
+            painters: キー → 描画関数
+            colkey (int): 背景を塗る透明色。描画関数が使わない色を指定すること
+        Returns:
+            int: 登録したスプライトの数
+        """
+        import pyxel
+
+        image = pyxel.images[self.bank]
+        image.cls(colkey)
+        self.colkey = colkey
+        self.sprites.clear()
+        per_row = IMAGE_BANK_SIZE // SPRITE_CELL_SIZE
+        for index, (key, paint) in enumerate(painters.items()):
+            if index >= per_row * per_row:
+                break  # バンクに収まらない分は直接描画のまま
+            cell_u = index % per_row * SPRITE_CELL_SIZE
+            cell_v = index // per_row * SPRITE_CELL_SIZE
+            origin_u = cell_u + SPRITE_ORIGIN
+            origin_v = cell_v + SPRITE_ORIGIN
+            image.clip(cell_u, cell_v, SPRITE_CELL_SIZE, SPRITE_CELL_SIZE)
+            paint(image, origin_u, origin_v)
+            image.clip()
+            bounds = self._measure(image, cell_u, cell_v)
+            if bounds is None:
+                continue
+            u, v, width, height = bounds
+            self.sprites[key] = Sprite(u, v, width, height, u - origin_u, v - origin_v)
+        self._blt = pyxel.blt
+        return len(self.sprites)
+
+    def _measure(self, image: Any, cell_u: int, cell_v: int) -> Optional[tuple[int, int, int, int]]:
+        """
+        枠内で透明色以外が描かれた範囲 (u, v, 幅, 高さ) を返す。何も描かれていなければ None。
+        """
+        colkey = self.colkey
+        min_u = min_v = IMAGE_BANK_SIZE
+        max_u = max_v = -1
+        for v in range(cell_v, cell_v + SPRITE_CELL_SIZE):
+            for u in range(cell_u, cell_u + SPRITE_CELL_SIZE):
+                if image.pget(u, v) != colkey:
+                    min_u = min(min_u, u)
+                    max_u = max(max_u, u)
+                    min_v = min(min_v, v)
+                    max_v = max(max_v, v)
+        if max_u < 0:
+            return None
+        return min_u, min_v, max_u - min_u + 1, max_v - min_v + 1
+
+    def draw(self, key: Hashable, x: int, y: int) -> bool:
+        """
+        キーのスプライトを、描画原点が (x, y) になるように描画する。
+        Returns:
+            bool: 描画したらTrue（アトラスにないキーならFalse）
+        """
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            return False
+        self._blt(
+            x + sprite.offset_x,
+            y + sprite.offset_y,
+            self.bank,
+            sprite.u,
+            sprite.v,
+            sprite.width,
+            sprite.height,
+            self.colkey,
+        )
+        return True
+
+
+# 敵・ユニット・弾が共有するアトラス
+SPRITE_ATLAS = SpriteAtlas()
+
+
+def build_sprite_atlas() -> int:
+    """
+    登録済みの敵の種類（種類×状態）・ユニット（種類×レベル）・弾のスプライトを描画する（起動時に一度だけ呼ぶ）。
+    Returns:
+        int: 登録したスプライトの数
+    """
+    from .bullet import Bullet
+    from .constants import TILE_SIZE
+    from .enemy.enemy_archetype import ENEMY_ARCHETYPES
+    from .player_unit.player_unit import PLAYER_UNIT_MASTER
+
+    painters: Dict[Hashable, SpritePainter] = {}
+    used_colors = {0, 7}  # 縁取り・点・影などの共通色
+    for archetype in ENEMY_ARCHETYPES.values():
+        used_colors.add(archetype.color)
+        for state in archetype.enemy_class.SPRITE_STATES:
+            painters[(archetype, state)] = (
+                lambda target, x, y, a=archetype, s=state: a.enemy_class.draw_body(target, a, s, x, y)
+            )
+    for unit in PLAYER_UNIT_MASTER:
+        for level in range(1, unit.max_level + 1):
+            used_colors.add(unit.get_color(level))
+            painters[(unit, level)] = lambda target, x, y, u=unit, lv=level: u.draw_body(target, x, y, lv, TILE_SIZE)
+    painters[BULLET_SPRITE] = Bullet.draw_body
+    colkey = next((c for c in range(16) if c not in used_colors), 0)
+    return SPRITE_ATLAS.build(painters, colkey)
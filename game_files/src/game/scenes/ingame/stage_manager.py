@@ -1,113 +1,182 @@
-from typing import Callable
-from .stage_master import StageMasterData, EnemySpawnData, FlyingEnemySpawnData, StageWaveData, Delay
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .stage_master import StageMasterData, EnemySpawnData, FlyingEnemySpawnData
 from .enemy.enemy_manager import EnemyManager
-from .enemy.enemy import BasicEnemy
 from .enemy.enemy import Enemy
-from .enemy.enemy import FastEnemy
-from .enemy.enemy import TankEnemy
-from .enemy.enemy import FlyingEnemy
+from .enemy.enemy_archetype import get_enemy_archetype
 from .map import Map
+from .flow_field import FlowField
+from .wave_timeline import WaveTimeline
 
 
 class StageManager:
     """
     ステージ進行・エネミー出現管理クラス。
     経過フレームを管理し、マスターデータに従いエネミーを出現させる。
+    各ウェーブは読み込み時に (出現ティック, 出現情報) の時系列（WaveTimeline）へ変換し、
+    毎ティックの処理は次の出現ティックとの比較だけで済ませる。
     """
 
-    def __init__(self, stage_master: StageMasterData, enemy_manager: EnemyManager, map: Map) -> None:
+    def __init__(
+        self,
+        stage_master: StageMasterData,
+        enemy_manager: EnemyManager,
+        map: Map,
+        use_flow_field: bool = False,
+        mazing: bool = False,
+    ) -> None:
+        """
+        Args:
+            use_flow_field (bool): Trueなら敵に経路リストを持たせず、マップのフローフィールドで移動させる
+            mazing (bool): Trueなら道タイルを塞ぐユニット配置を許可する（フローフィールド移動が前提）
+        """
         self.stage_master = stage_master
         self.enemy_manager = enemy_manager
         self.map = map
+        self.timelines = [WaveTimeline(wave) for wave in stage_master.waves]
         self.wave_index = 0
-        self.spawn_index = 0  # 現在のspawnsリストのインデックス
-        self.delay_counter = 0  # Delay用カウンタ
+        self.spawn_index = 0  # 現在のウェーブの時系列で次に出現させるインデックス
+        self.wave_tick = 0  # 現在のウェーブ開始からの経過ティック
+        self.mazing = mazing
+        self.route_starts = self._collect_path_starts(stage_master)
+        self.flow_field: Optional[FlowField] = None
+        if use_flow_field or mazing:
+            self.flow_field = self.map.get_flow_field()
+        else:
+            # 出現・着地地点ごとの経路を読み込み時に計算し、出現時は共有経路を参照するだけにする
+            self.map.precompute_paths(self.route_starts)
+
+    @staticmethod
+    def _collect_path_starts(stage_master: StageMasterData) -> List[Tuple[int, int]]:
+        """
+        ステージ内で経路探索の起点となる座標（地上敵の出現地点・飛行敵の着地地点）を列挙する。
+        """
+        starts: List[Tuple[int, int]] = []
+        for wave in stage_master.waves:
+            for spawn in wave.spawns:
+                if isinstance(spawn, FlyingEnemySpawnData):
+                    point = spawn.landing_point
+                elif isinstance(spawn, EnemySpawnData):
+                    point = spawn.spawn_point
+                else:
+                    continue
+                if point not in starts:
+                    starts.append(point)
+        return starts
+
+    def can_block_tile(self, x: int, y: int) -> bool:
+        """
+        迷路化モードで、道タイル(x, y)をユニットで塞げるか判定する。
+        出現・着地地点と、移動中の敵が向かっているタイルの全てからゴールへ到達できる場合のみ可。
+        """
+        if not self.mazing or self.flow_field is None:
+            return False
+        return self.flow_field.can_block(x, y, self._route_sources())
+
+    def block_tile(self, x: int, y: int) -> bool:
+        """
+        迷路化モードで道タイル(x, y)を塞ぐ。フローフィールドは影響範囲だけ差分修復され、
+        移動中の敵は次のタイルに着いた時点で新しい経路に沿って進む。
+        Returns:
+            bool: 塞いだらTrue
+        """
+        if not self.mazing or self.flow_field is None:
+            return False
+        return self.flow_field.try_block(x, y, self._route_sources())
+
+    def _route_sources(self) -> List[Tuple[int, int]]:
+        """
+        ゴールへの到達性を保つ必要がある起点タイルを列挙する。
+        """
+        sources = list(self.route_starts)
+        for enemy in self.enemy_manager.enemies:
+            if enemy.waypoint is not None:
+                sources.append(enemy.waypoint)
+        return sources
 
     def update(self, on_defeat: Callable[[Enemy], None]) -> bool:
         """
         ウェーブ進行・エネミー出現管理。
-        spawnsリストを順次処理し、Delayなら待機、EnemySpawnDataなら即スポーン。
+        現在のウェーブの時系列から、出現ティックに達した敵をまとめてスポーンする。
         ウェーブ内の全ての敵が死亡したらウェーブ完了とする。
         """
-        if self.wave_index >= len(self.stage_master.waves):
+        if self.wave_index >= len(self.timelines):
             # 全ウェーブ終了
             return True
-        wave = self.stage_master.waves[self.wave_index]
-        spawns = wave.spawns
-
-        # spawnsリストを順次処理
-        while self.spawn_index < len(spawns):
-            spawn = spawns[self.spawn_index]
-            if isinstance(spawn, Delay):
-                if self.delay_counter < spawn.frame:
-                    self.delay_counter += 1
-                    break  # Delay中はここで止める
-                else:
-                    self.delay_counter = 0
-                    self.spawn_index += 1
-            elif isinstance(spawn, (EnemySpawnData, FlyingEnemySpawnData)):
-                self.spawn_enemy(spawn, on_defeat)
-                self.spawn_index += 1
-            else:
-                # 未知の型はスキップ
-                self.spawn_index += 1
+        timeline = self.timelines[self.wave_index]
+        ticks = timeline.ticks
+        while self.spawn_index < len(ticks) and ticks[self.spawn_index] <= self.wave_tick:
+            self.spawn_enemy(timeline.spawns[self.spawn_index], on_defeat)
+            self.spawn_index += 1
 
         # ウェーブ完了判定
-        if self._is_wave_complete(wave):
+        if self._is_wave_complete(timeline):
             self.wave_index += 1
             self.spawn_index = 0
-            self.delay_counter = 0
+            self.wave_tick = 0
+        else:
+            self.wave_tick += 1
         return False
 
-    def _is_wave_complete(self, wave: StageWaveData) -> bool:
+    def _is_wave_complete(self, timeline: WaveTimeline) -> bool:
         """
-        ウェーブ内の全てのspawnsを処理し終え、かつ全ての敵が死亡したらTrue
+        ウェーブ内の全ての出現（末尾のDelayを含む）を処理し終え、かつ全ての敵が死亡したらTrue
         """
-        all_spawned = self.spawn_index >= len(wave.spawns)
+        all_spawned = self.spawn_index >= len(timeline) and self.wave_tick >= timeline.end_tick
         all_dead = len(self.enemy_manager.enemies) == 0
         return all_spawned and all_dead
 
+    def get_idle_ticks(self) -> int:
+        """
+        場に敵がいない場合に、出現もウェーブ完了も起こらない残りの更新回数を返す。
+        早送り時は skip_ticks でこの回数分をまとめて進めてよい。
+        """
+        if self.wave_index >= len(self.timelines) or len(self.enemy_manager.enemies) > 0:
+            return 0
+        timeline = self.timelines[self.wave_index]
+        return max(0, timeline.next_event_tick(self.spawn_index) - self.wave_tick)
+
+    def skip_ticks(self, ticks: int) -> None:
+        """
+        出現を起こさずに現在のウェーブの経過ティックを進める（get_idle_ticks 以下で使うこと）。
+        """
+        self.wave_tick += ticks
+
+    def seek(self, wave_index: int, tick: int = 0) -> None:
+        """
+        指定ウェーブの開始から tick ティック目へ移動する。
+        tick より前の出現は処理済みとして扱い（スポーンしない）、tick 以降の出現は次の update から順に起こる。
+        """
+        self.wave_index = wave_index
+        self.wave_tick = tick
+        if wave_index < len(self.timelines):
+            self.spawn_index = self.timelines[wave_index].index_at(tick)
+        else:
+            self.spawn_index = 0
+
     def spawn_enemy(self, spawn: EnemySpawnData, onDefeat: Callable[[Enemy], None]) -> None:
         """
-        マスターデータに従いエネミーを生成・EnemyManagerに追加
-        """
-        enemy: Enemy
-        goal_point = self.map.get_goal()
-        path = self.map.get_path(spawn.spawn_point, goal_point) if goal_point else []
-        if spawn.enemy_type == BasicEnemy.__name__:
-            enemy = BasicEnemy(
-                x=spawn.spawn_point[0],
-                y=spawn.spawn_point[1],
-                path=path,
-                on_defeat=onDefeat,
-                coefficient=spawn.coefficient,
-            )
-        elif spawn.enemy_type == FastEnemy.__name__:
-            enemy = FastEnemy(
-                x=spawn.spawn_point[0],
-                y=spawn.spawn_point[1],
-                path=path,
-                on_defeat=onDefeat,
-                coefficient=spawn.coefficient,
-            )
-        elif spawn.enemy_type == TankEnemy.__name__:
-            enemy = TankEnemy(
-                x=spawn.spawn_point[0],
-                y=spawn.spawn_point[1],
-                path=path,
-                on_defeat=onDefeat,
-                coefficient=spawn.coefficient,
-            )
-        elif isinstance(spawn, FlyingEnemySpawnData):
-            flying_spawn_data = spawn
-            enemy = FlyingEnemy(
-                start_x=flying_spawn_data.spawn_point[0],
-                start_y=flying_spawn_data.spawn_point[1],
-                land_pos=flying_spawn_data.landing_point,
-                path=self.map.get_path(flying_spawn_data.landing_point, goal=goal_point),
-                on_defeat=onDefeat,
-                coefficient=flying_spawn_data.coefficient,
-            )
+        マスターデータに従いエネミーを生成・EnemyManagerに追加。
+        敵の種類は enemy_type をキーにレジストリ（EnemyArchetype）から引く。
+        """
+        archetype = get_enemy_archetype(spawn.enemy_type)
+        # 経路の起点（飛行敵は着地地点）
+        extra: Dict[str, Any] = {}
+        if isinstance(spawn, FlyingEnemySpawnData):
+            route_start = spawn.landing_point
+            extra["land_pos"] = route_start
         else:
-            raise ValueError(f"Unknown enemy type: {spawn.enemy_type}")
+            route_start = spawn.spawn_point
+        path = () if self.flow_field is not None else self.map.get_shared_path(route_start)
+        enemy = self.enemy_manager.acquire_enemy(
+            archetype.enemy_class,
+            archetype,
+            x=spawn.spawn_point[0],
+            y=spawn.spawn_point[1],
+            path=path,
+            on_defeat=onDefeat,
+            coefficient=spawn.coefficient,
+            **extra,
+        )
+        if self.flow_field is not None:
+            enemy.use_flow_field(self.flow_field, route_start)
         self.enemy_manager.spawn_enemy(enemy)
@@ -0,0 +1,51 @@
+"""
+WaveTimeline - ウェーブの出現リストを (出現ティック, 出現情報) の時系列に変換したもの
+"""
+
+from bisect import bisect_left
+from typing import List
+
+from .stage_master import Delay, EnemySpawnData, StageWaveData
+
+
+class WaveTimeline:
+    """
+    StageWaveData.spawns を読み込み時に一度だけ解釈し、
+    ウェーブ開始からのティック順に並んだ出現情報の列として保持するクラス。
+
+    従来の逐次処理と同じく、Delay(frame) はそれ以降の出現を frame ティック遅らせる。
+    ウェーブ開始ティック（0）に出現する敵は、ウェーブが始まった更新で出現する。
+    ticks は昇順に並ぶため、次の出現ティックの参照や任意ティックへの移動は二分探索で済む。
+    """
+
+    def __init__(self, wave: StageWaveData) -> None:
+        self.ticks: List[int] = []  # 各出現のウェーブ開始からのティック（昇順）
+        self.spawns: List[EnemySpawnData] = []
+        tick = 0
+        for spawn in wave.spawns:
+            if isinstance(spawn, Delay):
+                tick += spawn.frame
+            elif isinstance(spawn, EnemySpawnData):
+                self.ticks.append(tick)
+                self.spawns.append(spawn)
+            # 未知の型は従来どおり無視する
+        # 末尾のDelayも含めた、全ての出現を処理し終えるティック
+        self.end_tick = tick
+
+    def __len__(self) -> int:
+        return len(self.spawns)
+
+    def index_at(self, tick: int) -> int:
+        """
+        ティック tick の更新で最初に処理する出現のインデックス（tick より前の出現の数）を返す。
+        """
+        return bisect_left(self.ticks, tick)
+
+    def next_event_tick(self, index: int) -> int:
+        """
+        インデックス index 以降で次に何かが起こるティックを返す。
+        残りの出現があればその出現ティック、なければ全ての出現を処理し終えるティック。
+        """
+        if index < len(self.ticks):
+            return self.ticks[index]
+        return self.end_tick
@@ -23,19 +23,25 @@ class StageSelectScene(BaseScene):
         super().__init__()
         self.selected_stage = 0
         self.stages = ["Stage 1", "Stage 2", "Stage 3"]
+        # 迷路化モード（道タイルへのユニット配置）を有効にして開始するか
+        self.mazing = False
 
     def update(self, game: Game, input_manager: InputManager) -> None:
         """
         ステージ選択画面の更新処理。
-        上下キーで選択、Zで決定、Qでメニューに戻る。
+        上下キーで選択、Xで迷路化モード切替、Zで決定、Qでメニューに戻る。
         InputManager経由で入力判定。
         """
         if input_manager.is_triggered(pyxel.KEY_UP):
             self.selected_stage = (self.selected_stage - 1) % len(self.stages)
         elif input_manager.is_triggered(pyxel.KEY_DOWN):
             self.selected_stage = (self.selected_stage + 1) % len(self.stages)
+        elif input_manager.is_triggered(pyxel.KEY_X):
+            self.mazing = not self.mazing
         elif input_manager.is_triggered(pyxel.KEY_Z):
-            game.change_scene(new_scene=SceneType.IN_GAME, scene_param={"stage_index": self.selected_stage})
+            game.change_scene(
+                new_scene=SceneType.IN_GAME, scene_param={"stage_index": self.selected_stage, "mazing": self.mazing}
+            )
         elif input_manager.is_triggered(pyxel.KEY_Q):
             game.change_scene(new_scene=SceneType.MENU)
 
@@ -50,7 +56,8 @@ class StageSelectScene(BaseScene):
             color = 11 if i == self.selected_stage else 6
             y_pos = 40 + i * 15
             pyxel.text(60, y_pos, stage, color)
+        pyxel.text(52, 86, "MAZING: " + ("ON" if self.mazing else "OFF"), 10 if self.mazing else 6)
 
         font_renderer = FontRenderer.get_instance()
-        font_renderer.draw_text(20, 100, "UP/DOWN: カーソル移動, Z:決定", 5, font_name="default")
+        font_renderer.draw_text(20, 100, "UP/DOWN:選択 X:迷路化 Z:決定", 5, font_name="default")
         font_renderer.draw_text(25, 110, "Q: メニューに戻る", 5, font_name="default")
@@ -3,7 +3,32 @@ FontRenderer - 任意のフォントでテキスト描画を行うユーティ
 """
 
 import pyxel
-from typing import Any
+from collections import OrderedDict
+from typing import Any, Optional
+
+# 描画済みの文字列を置くイメージバンク（1枚 256x256px）
+TEXT_CACHE_IMAGE_BANK = 1
+TEXT_CACHE_SIZE = 256
+# キャッシュの1行の高さ（美咲フォントは8x8px）
+TEXT_CACHE_ROW_HEIGHT = 8
+# text_width のメモ・キャッシュできない文字列の記録の上限（超えたら全て捨てる）
+TEXT_WIDTH_MEMO_SIZE = 1024
+
+
+class _CachedText:
+    """
+    イメージバンクに描画済みの文字列1つ分の位置。
+    """
+
+    __slots__ = ("key", "u", "v", "width", "row", "colkey")
+
+    def __init__(self, key: tuple, u: int, v: int, width: int, row: int, colkey: int) -> None:
+        self.key = key
+        self.u = u
+        self.v = v
+        self.width = width
+        self.row = row
+        self.colkey = colkey  # 背景（透明にする）色
 
 
 class FontRenderer:
@@ -21,6 +46,21 @@ class FontRenderer:
         if not hasattr(self, "_initialized"):
             self._font_instances: dict[str, pyxel.Font] = {}
             self._name_to_path: dict[str, str] = {}
+            # --- 描画済み文字列のLRUキャッシュ ---
+            # (文字列, 色, フォントパス) → 位置。先頭ほど長く使われていない
+            self._text_cache: OrderedDict[tuple, _CachedText] = OrderedDict()
+            # 行ごとの配置済み文字列（u 昇順）
+            self._cache_rows: list[list[_CachedText]] = [[] for _ in range(TEXT_CACHE_SIZE // TEXT_CACHE_ROW_HEIGHT)]
+            # (文字列, フォントパス) → 幅
+            self._width_memo: dict[tuple[str, str], int] = {}
+            # キャッシュできないと分かった (文字列, フォントパス)。毎フレーム幅を調べ直さないために覚えておく
+            self._uncacheable: set[tuple[str, str]] = set()
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.cache_evictions = 0
+            self.cache_bypasses = 0  # キャッシュせずに直接描画した回数（ミスには数えない）
+            self.width_hits = 0
+            self.width_misses = 0
             self._initialized = True
 
     @staticmethod
@@ -35,22 +75,126 @@ class FontRenderer:
         if font_path not in self._font_instances:
             self._font_instances[font_path] = pyxel.Font(font_path)
 
-    def _get_font(self, name: str) -> pyxel.Font:
+    def _get_font_path(self, name: str) -> str:
         font_path = self._name_to_path.get(name)
         if not font_path:
             raise ValueError(f"Font name '{name}' is not registered.")
-        return self._font_instances[font_path]
+        return font_path
 
-    def draw_text(self, x: int, y: int, text: str, color: int = 7, font_name: str = "default") -> None:
+    def _get_font(self, name: str) -> pyxel.Font:
+        return self._font_instances[self._get_font_path(name)]
+
+    def draw_text(
+        self, x: int, y: int, text: str, color: int = 7, font_name: str = "default", target: Any = None
+    ) -> None:
         """
         指定フォント名でテキストを描画。
+        画面への描画は、初回にイメージバンクへ描画した文字列を blt で転送する。
+        target に pyxel.Image を渡すと、画面ではなくそのイメージに直接描画する。
         """
-        font = self._get_font(font_name)
-        pyxel.text(x, y, text, color, font)
+        font_path = self._get_font_path(font_name)
+        if target is not None:
+            target.text(x, y, text, color, self._font_instances[font_path])
+            return
+        entry = self._get_cached_text(text, color, font_path)
+        if entry is None:
+            pyxel.text(x, y, text, color, self._font_instances[font_path])
+            return
+        pyxel.blt(x, y, TEXT_CACHE_IMAGE_BANK, entry.u, entry.v, entry.width, TEXT_CACHE_ROW_HEIGHT, entry.colkey)
 
     def text_width(self, text: str, font_name: str = "default") -> int:
         """
         指定フォント名でテキスト幅を取得。
         """
-        font = self._get_font(font_name)
-        return font.text_width(text)
+        font_path = self._get_font_path(font_name)
+        return self._text_width(text, font_path)
+
+    def _text_width(self, text: str, font_path: str) -> int:
+        key = (text, font_path)
+        width = self._width_memo.get(key)
+        if width is not None:
+            self.width_hits += 1
+            return width
+        self.width_misses += 1
+        if len(self._width_memo) >= TEXT_WIDTH_MEMO_SIZE:
+            self._width_memo.clear()
+        width = self._font_instances[font_path].text_width(text)
+        self._width_memo[key] = width
+        return width
+
+    def _get_cached_text(self, text: str, color: int, font_path: str) -> Optional[_CachedText]:
+        """
+        描画済みの文字列の位置を返す。なければイメージバンクに描画して登録する。
+        改行を含む・空・1行に収まらない文字列はキャッシュせず None を返す（一度判定したものは覚えておく）。
+        """
+        key = (text, color, font_path)
+        entry = self._text_cache.get(key)
+        if entry is not None:
+            self._text_cache.move_to_end(key)
+            self.cache_hits += 1
+            return entry
+        uncacheable_key = (text, font_path)
+        if uncacheable_key in self._uncacheable:
+            self.cache_bypasses += 1
+            return None
+        width = 0 if "\n" in text else self._text_width(text, font_path)
+        if width <= 0 or width > TEXT_CACHE_SIZE:
+            if len(self._uncacheable) >= TEXT_WIDTH_MEMO_SIZE:
+                self._uncacheable.clear()
+            self._uncacheable.add(uncacheable_key)
+            self.cache_bypasses += 1
+            return None
+        self.cache_misses += 1
+        space = self._find_space(width)
+        while space is None:
+            # 空きが見つかるまで最も長く使われていない文字列から捨てる
+            _, evicted = self._text_cache.popitem(last=False)
+            self._cache_rows[evicted.row].remove(evicted)
+            self.cache_evictions += 1
+            space = self._find_space(width)
+        row, index, u = space
+        v = row * TEXT_CACHE_ROW_HEIGHT
+        colkey = 0 if color != 0 else 1
+        image = pyxel.images[TEXT_CACHE_IMAGE_BANK]
+        image.rect(u, v, width, TEXT_CACHE_ROW_HEIGHT, colkey)
+        image.text(u, v, text, color, self._font_instances[font_path])
+        entry = _CachedText(key, u, v, width, row, colkey)
+        self._cache_rows[row].insert(index, entry)
+        self._text_cache[key] = entry
+        return entry
+
+    def _find_space(self, width: int) -> Optional[tuple[int, int, int]]:
+        """
+        幅 width の空きを上の行から探し、(行, 行内の挿入位置, u) を返す。なければ None。
+        """
+        for row, entries in enumerate(self._cache_rows):
+            u = 0
+            for index, entry in enumerate(entries):
+                if entry.u - u >= width:
+                    return row, index, u
+                u = entry.u + entry.width
+            if TEXT_CACHE_SIZE - u >= width:
+                return row, len(entries), u
+        return None
+
+    def clear_text_cache(self) -> None:
+        """
+        描画済み文字列のキャッシュを捨てる（他の処理がイメージバンクを書き換えたときに呼ぶ）。
+        """
+        self._text_cache.clear()
+        for entries in self._cache_rows:
+            entries.clear()
+
+    def get_cache_stats(self) -> dict[str, int]:
+        """
+        文字列キャッシュと text_width メモのヒット・ミス数、キャッシュせずに描画した回数を返す（計測用）。
+        """
+        return {
+            "cache_entries": len(self._text_cache),
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+            "cache_evictions": self.cache_evictions,
+            "cache_bypasses": self.cache_bypasses,
+            "width_hits": self.width_hits,
+            "width_misses": self.width_misses,
+        }
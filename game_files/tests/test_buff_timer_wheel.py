@@ -0,0 +1,58 @@
+"""
+BuffTimerWheel によるバフの効果切れのティックのテスト。
+"""
+
+from src.game.scenes.ingame.enemy.buff import SLOW_BUFF, SpeedDownBuff
+from src.game.scenes.ingame.enemy.buff_manager import BuffManager
+from src.game.scenes.ingame.enemy.buff_timer_wheel import BuffTimerWheel
+
+
+def _advance(wheel: BuffTimerWheel, times: int) -> None:
+    for _ in range(times):
+        wheel.advance()
+
+
+def test_record_expires_on_exact_tick() -> None:
+    wheel = BuffTimerWheel()
+    _advance(wheel, 7)
+    manager = BuffManager(wheel)
+    manager.apply(SLOW_BUFF)
+    assert manager.get_speed_multiplier() == 0.5
+    _advance(wheel, SLOW_BUFF.duration - 1)
+    assert manager.get_speed_multiplier() == 0.5
+    wheel.advance()
+    assert manager.get_speed_multiplier() == 1.0
+
+
+def test_duration_longer_than_wheel_waits_for_lap() -> None:
+    wheel = BuffTimerWheel(size=16)
+    manager = BuffManager(wheel)
+    manager.apply(SLOW_BUFF)
+    _advance(wheel, SLOW_BUFF.duration - 1)
+    assert manager.records
+    wheel.advance()
+    assert not manager.records
+
+
+def test_zero_duration_buff_lasts_one_tick() -> None:
+    wheel = BuffTimerWheel()
+    manager = BuffManager(wheel)
+    manager.add_buff(SpeedDownBuff(duration=0, speed_multiplier=0.5))
+    assert manager.get_speed_multiplier() == 0.5
+    wheel.advance()
+    assert manager.get_speed_multiplier() == 1.0
+    assert not manager.buffs
+
+
+def test_paused_buff_counts_from_resume() -> None:
+    wheel = BuffTimerWheel()
+    manager = BuffManager(wheel)
+    manager.pause()
+    manager.apply(SLOW_BUFF)
+    _advance(wheel, SLOW_BUFF.duration + 5)
+    assert manager.get_speed_multiplier() == 0.5
+    manager.resume()
+    _advance(wheel, SLOW_BUFF.duration - 1)
+    assert manager.get_speed_multiplier() == 0.5
+    wheel.advance()
+    assert manager.get_speed_multiplier() == 1.0
@@ -0,0 +1,52 @@
+"""
+EntityList のハンドルと入れ替え削除（swap-remove）のテスト。
+"""
+
+from src.game.scenes.ingame.entity_list import NO_HANDLE, EntityHandle, EntityList
+
+
+class _Item:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.entity_handle: EntityHandle = NO_HANDLE
+
+
+def _filled(count: int) -> tuple[EntityList[_Item], list[_Item]]:
+    entities: EntityList[_Item] = EntityList()
+    items = [_Item(str(i)) for i in range(count)]
+    for item in items:
+        entities.add(item)
+    return entities, items
+
+
+def test_remove_moves_last_item_into_gap() -> None:
+    entities, items = _filled(4)
+    entities.remove(items[1])
+    assert [item.name for item in entities] == ["0", "3", "2"]
+    # 移動した要素もハンドルで引ける
+    assert entities.get(items[3].entity_handle) is items[3]
+
+
+def test_stale_handle_after_remove() -> None:
+    entities, items = _filled(3)
+    stale = items[0].entity_handle
+    entities.remove(items[0])
+    assert items[0].entity_handle == NO_HANDLE
+    assert entities.get(stale) is None
+    # 空いたスロットを再利用しても、古いハンドルは新しいエンティティを指さない
+    reused = _Item("reused")
+    handle = entities.add(reused)
+    assert handle[0] == stale[0]
+    assert entities.get(stale) is None
+    assert entities.get(handle) is reused
+
+
+def test_detached_item_keeps_handle_until_release() -> None:
+    entities, items = _filled(3)
+    handle = items[0].entity_handle
+    assert entities.detach(items[0])
+    assert items[0] not in entities.items
+    assert entities.get(handle) is items[0]
+    assert not entities.detach(items[0])
+    entities.release(items[0])
+    assert entities.get(handle) is None
@@ -0,0 +1,62 @@
+"""
+FlowField の封鎖判定（can_block）と封鎖・解除（try_block / unblock）のテスト。
+"""
+
+import copy
+
+from src.game.scenes.ingame.flow_field import FlowField
+from src.game.scenes.ingame.map import TILE_PATH, Map
+from src.game.scenes.ingame.map_master import MAP_MASTER_LIST
+
+
+def _field(map_index: int) -> tuple[FlowField, list[tuple[int, int]]]:
+    map = Map(map_data=MAP_MASTER_LIST[map_index])
+    tiles = [(x, y) for y in range(map.height) for x in range(map.width) if map.get_tile(x, y) == TILE_PATH]
+    return FlowField(map), tiles
+
+
+def _state(field: FlowField) -> tuple[list, list]:
+    return copy.deepcopy(field.distance), copy.deepcopy(field.next_step)
+
+
+def test_can_block_leaves_field_unchanged() -> None:
+    field, tiles = _field(2)
+    before = _state(field)
+    for x, y in tiles:
+        field.can_block(x, y, [tiles[0]])
+        assert _state(field) == before
+    assert not field.blocked
+
+
+def test_can_block_rejects_cutting_off_source() -> None:
+    field, tiles = _field(0)
+    source = tiles[0]
+    # 入口の隣の道タイルを塞ぐとゴールへ到達できなくなる
+    (nx, ny) = field.get_next(*source)
+    assert not field.can_block(nx, ny, [source])
+    assert not field.try_block(nx, ny, [source])
+    assert field.is_reachable(*source)
+
+
+def test_unblock_restores_exact_field() -> None:
+    # マップ2には同じ歩数の分岐があり、差分修復だけでは次の一歩の選び方が変わりうる
+    field, tiles = _field(2)
+    before = _state(field)
+    for x, y in tiles:
+        if field.try_block(x, y, [tiles[0]]):
+            assert (x, y) in field.blocked
+            field.unblock(x, y)
+            assert _state(field) == before
+
+
+def test_unblock_in_reverse_order_restores_each_step() -> None:
+    field, tiles = _field(2)
+    states = []
+    for x, y in tiles[::7]:
+        state = _state(field)
+        if field.try_block(x, y, [tiles[0]]):
+            states.append(((x, y), state))
+    assert len(states) >= 2
+    for (x, y), state in reversed(states):
+        field.unblock(x, y)
+        assert _state(field) == state
@@ -0,0 +1,38 @@
+"""
+ObjectPool の再利用と統計のテスト。
+"""
+
+from src.game.scenes.ingame.object_pool import ObjectPool
+
+
+class _Pooled:
+    def __init__(self, value: int) -> None:
+        self.resets = 0
+        self.value = value
+
+    def reset(self, value: int) -> None:
+        self.resets += 1
+        self.value = value
+
+
+def test_released_object_is_reset_and_reused() -> None:
+    pool = ObjectPool(_Pooled)
+    first = pool.acquire(1)
+    pool.release(first)
+    second = pool.acquire(2)
+    assert second is first
+    assert second.value == 2
+    assert second.resets == 1
+    assert (pool.hits, pool.misses) == (1, 1)
+    assert pool.hit_rate == 0.5
+
+
+def test_release_beyond_capacity_discards() -> None:
+    pool = ObjectPool(_Pooled, capacity=1)
+    objects = [pool.acquire(i) for i in range(3)]
+    for obj in objects:
+        pool.release(obj)
+    assert len(pool.free) == 1
+    assert pool.discarded == 2
+    assert pool.in_use == 0
+    assert pool.high_water == 3
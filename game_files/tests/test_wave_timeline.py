@@ -0,0 +1,108 @@
+"""
+WaveTimeline と StageManager の出現ティック管理（skip_ticks / seek）のテスト。
+"""
+
+from src.game.scenes.ingame.enemy.enemy_manager import EnemyManager
+from src.game.scenes.ingame.headless_simulator import HeadlessSimulator
+from src.game.scenes.ingame.map import Map
+from src.game.scenes.ingame.map_master import MAP_MASTER_LIST
+from src.game.scenes.ingame.stage_manager import StageManager
+from src.game.scenes.ingame.stage_master import Delay, EnemySpawnData, StageMasterData, StageWaveData
+from src.game.scenes.ingame.wave_timeline import WaveTimeline
+
+# ステージ0のマップの入口
+SPAWN_POINT = (3, 0)
+
+
+def _spawn() -> EnemySpawnData:
+    return EnemySpawnData(enemy_type="BasicEnemy", spawn_point=SPAWN_POINT, coefficient=1.0)
+
+
+def _stage() -> StageMasterData:
+    """
+    1ウェーブ目: 0, 10, 20 ティックに出現し、25 ティックで出現を終える。2ウェーブ目: 0 ティックに1体。
+    """
+    waves = [
+        StageWaveData([_spawn(), Delay(10), _spawn(), Delay(10), _spawn(), Delay(5)]),
+        StageWaveData([_spawn()]),
+    ]
+    return StageMasterData(map_id=1, map_data=MAP_MASTER_LIST[0], waves=waves)
+
+
+def _stage_manager() -> StageManager:
+    stage = _stage()
+    return StageManager(stage, EnemyManager(), Map(map_data=stage.map_data))
+
+
+def _update(stage_manager: StageManager, times: int = 1) -> None:
+    for _ in range(times):
+        stage_manager.update(on_defeat=lambda enemy: None)
+
+
+def test_timeline_converts_delays_to_ticks() -> None:
+    timeline = WaveTimeline(_stage().waves[0])
+    assert timeline.ticks == [0, 10, 20]
+    assert timeline.end_tick == 25
+    assert timeline.index_at(0) == 0
+    assert timeline.index_at(10) == 1
+    assert timeline.index_at(11) == 2
+    assert timeline.next_event_tick(1) == 10
+    assert timeline.next_event_tick(3) == 25
+
+
+def test_spawns_on_their_tick() -> None:
+    stage_manager = _stage_manager()
+    enemies = stage_manager.enemy_manager.enemies
+    _update(stage_manager)
+    assert len(enemies) == 1
+    _update(stage_manager, 9)
+    assert len(enemies) == 1
+    _update(stage_manager)
+    assert len(enemies) == 2
+
+
+def test_skip_ticks_reaches_next_spawn() -> None:
+    stage_manager = _stage_manager()
+    stage_manager.seek(0, 11)
+    # 場に敵がいなければ、次の出現（20ティック）までの更新は省略できる
+    assert stage_manager.get_idle_ticks() == 9
+    stage_manager.skip_ticks(stage_manager.get_idle_ticks())
+    assert stage_manager.get_idle_ticks() == 0
+    _update(stage_manager)
+    assert len(stage_manager.enemy_manager.enemies) == 1
+    assert stage_manager.spawn_index == 3
+
+
+def test_seek_skips_earlier_spawns() -> None:
+    stage_manager = _stage_manager()
+    stage_manager.seek(0, 10)
+    # 10ティックの出現は seek 直後の更新で起こり、それより前の出現は起こらない
+    _update(stage_manager)
+    assert len(stage_manager.enemy_manager.enemies) == 1
+    assert stage_manager.spawn_index == 2
+    assert stage_manager.wave_tick == 11
+
+
+def test_seek_to_later_wave() -> None:
+    stage_manager = _stage_manager()
+    stage_manager.seek(1)
+    _update(stage_manager)
+    assert stage_manager.wave_index == 1
+    assert len(stage_manager.enemy_manager.enemies) == 1
+
+
+def test_seek_past_last_wave_finishes_stage() -> None:
+    stage_manager = _stage_manager()
+    stage_manager.seek(2)
+    assert stage_manager.update(on_defeat=lambda enemy: None)
+
+
+def test_simulator_starts_from_seek_position() -> None:
+    full = HeadlessSimulator(stage_index=1, funds=0)
+    full.run()
+    seeked = HeadlessSimulator(stage_index=1, funds=0, start_tick=600)
+    timeline = seeked.stage_manager.timelines[0]
+    assert seeked.stage_manager.wave_tick == 600
+    assert seeked.stage_manager.spawn_index == timeline.index_at(600)
+    seeked.run()
+    assert seeked.tick_count < full.tick_count